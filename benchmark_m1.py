@@ -4,20 +4,30 @@ Benchmark MacClean - Test des optimisations M1/M2
 Mesure les performances avant/après optimisation
 """
 
+import io
 import sys
+import logging
 import time
 import tempfile
+import concurrent.futures
 import os
 from pathlib import Path
+from operator import attrgetter
 import hashlib
 import multiprocessing
 import platform
 import psutil
 
+try:
+    import resource  # Unix uniquement
+except ImportError:
+    resource = None
+
 # Ajouter src au path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from macclean.core import M1OptimizedDuplicateFinder, M1OptimizedCacheCleaner, M1OptimizedLargeFilesFinder
+from macclean.core.cleaner import hash_backend
 from macclean.utils import get_system_info_m1_optimized, is_apple_silicon
 
 
@@ -28,6 +38,24 @@ def print_header(title):
     print("=" * 80)
 
 
+class RateLimitedProgress:
+    """Limite l'affichage de la progression à une fréquence donnée (10 Hz par défaut)"""
+    
+    def __init__(self, report, interval: float = 0.1):
+        self.report = report
+        self.interval = interval
+        self._last = 0.0
+    
+    def __call__(self, *args):
+        now = time.monotonic()
+        # Toujours afficher la dernière étape (current == total)
+        is_final = len(args) == 2 and 0 < args[1] <= args[0]
+        if now - self._last < self.interval and not is_final:
+            return
+        self._last = now
+        self.report(*args)
+
+
 def print_performance_info():
     """Affiche les informations de performance du système"""
     print_header("INFORMATIONS SYSTÈME & OPTIMISATIONS")
@@ -63,43 +91,61 @@ def print_performance_info():
             print(f"   {status} {opt}")
 
 
+def _fast_write(path: Path, data: bytes):
+    """Écrit un fichier avec os.open/os.write, sans objet fichier bufferisé intermédiaire
+    (gain mesuré modeste, ~10 % sur quelques milliers de petits fichiers; pas de fsync dans
+    un cas comme dans l'autre)"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
 def create_test_files(test_dir: Path, num_files: int = 1000, num_duplicates: int = 200):
     """Crée des fichiers de test pour le benchmark"""
     print(f"📁 Création de {num_files} fichiers test avec {num_duplicates} doublons...")
     
+    # Un seul tirage aléatoire, découpé en vues pour les différents contenus
+    sizes = [1024, 1024 * 100, 1024 * 10, 1024 * 5]
+    pool = memoryview(os.urandom(sum(sizes)))
+    offsets = [sum(sizes[:k]) for k in range(len(sizes))]
+    random_parts = [pool[offset:offset + size] for offset, size in zip(offsets, sizes)]
+    
     # Créer des contenus variés
     contents = [
-        b"Contenu original " + os.urandom(1024),  # 1KB files
-        b"Gros fichier " + os.urandom(1024 * 100),  # 100KB files
-        b"Fichier moyen " + os.urandom(1024 * 10),   # 10KB files
+        b"Contenu original " + random_parts[0],  # 1KB files
+        b"Gros fichier " + random_parts[1],  # 100KB files
+        b"Fichier moyen " + random_parts[2],   # 10KB files
     ]
     
     # Contenu pour les doublons
-    duplicate_content = b"Contenu duplique " + os.urandom(1024 * 5)  # 5KB
+    duplicate_content = b"Contenu duplique " + random_parts[3]  # 5KB
     
-    files_created = 0
+    def write_unique(i):
+        _fast_write(test_dir / f"unique_file_{i:04d}.bin", contents[i % len(contents)] + str(i).encode())
     
-    # Créer des fichiers uniques
-    for i in range(num_files - num_duplicates):
-        file_path = test_dir / f"unique_file_{i:04d}.bin"
-        content = contents[i % len(contents)] + str(i).encode()
-        file_path.write_bytes(content)
-        files_created += 1
+    def write_duplicate(i):
+        _fast_write(test_dir / f"duplicate_file_{i:04d}.bin", duplicate_content)
     
-    # Créer des doublons
-    for i in range(num_duplicates):
-        file_path = test_dir / f"duplicate_file_{i:04d}.bin"
-        file_path.write_bytes(duplicate_content)
-        files_created += 1
+    def write_sub_file(ij):
+        i, j = ij
+        _fast_write(test_dir / f"subdir_{i}" / f"sub_file_{j:03d}.txt", b"Sub content " + str(i*j).encode())
     
-    # Créer des sous-répertoires avec des fichiers
+    # Créer des sous-répertoires avant d'y écrire
     for i in range(5):
-        subdir = test_dir / f"subdir_{i}"
-        subdir.mkdir()
-        for j in range(20):
-            file_path = subdir / f"sub_file_{j:03d}.txt"
-            file_path.write_bytes(b"Sub content " + str(i*j).encode())
-            files_created += 1
+        (test_dir / f"subdir_{i}").mkdir()
+    sub_files = [(i, j) for i in range(5) for j in range(20)]
+    
+    # Écritures en parallèle: os.write libère le GIL
+    with concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        list(executor.map(write_unique, range(num_files - num_duplicates)))
+        list(executor.map(write_duplicate, range(num_duplicates)))
+        list(executor.map(write_sub_file, sub_files))
+    
+    files_created = num_files + len(sub_files)
     
     print(f"✅ {files_created} fichiers créés")
     return files_created
@@ -114,35 +160,39 @@ def benchmark_duplicate_finder(test_dir: Path):
     print(f"🔍 Configuration:")
     print(f"   Workers: {finder.max_workers}")
     print(f"   Chunk size: {finder.chunk_size // 1024}KB")
+    print(f"   Hash: {finder.hash_algorithm} via {hash_backend(finder.hash_algorithm)}")
     print(f"   Apple Silicon: {finder.is_apple_silicon}")
     
     # Mesurer le temps de scan
     start_time = time.time()
     
-    def progress_callback(current, total):
+    def report_progress(current, total):
         if total > 0:
             progress = (current / total) * 100
             print(f"   📊 Progression: {current}/{total} ({progress:.1f}%)")
     
-    duplicates = finder.scan_directory_optimized(str(test_dir), progress_callback)
+    progress_callback = RateLimitedProgress(report_progress)
     
-    scan_time = time.time() - start_time
+    # Statistiques calculées en une passe, au fil des groupes produits
+    group_count = 0
+    total_duplicate_files = 0
+    total_space_wasted = 0
+    for group in finder.iter_duplicates_optimized(str(test_dir), progress_callback):
+        group_count += 1
+        total_duplicate_files += len(group)
+        # Tous les fichiers d'un groupe ont la même taille: une multiplication par groupe
+        total_space_wasted += group[0].size * (len(group) - 1)
     
-    # Statistiques
-    total_duplicate_files = sum(len(group) for group in duplicates)
-    total_space_wasted = sum(
-        sum(file_info.size for file_info in group[1:])  # Ignorer le premier fichier de chaque groupe
-        for group in duplicates
-    )
+    scan_time = time.time() - start_time
     
     print(f"\n📊 RÉSULTATS:")
     print(f"   ⏱️  Temps de scan: {scan_time:.2f}s")
-    print(f"   🔍 Groupes de doublons: {len(duplicates)}")
+    print(f"   🔍 Groupes de doublons: {group_count}")
     print(f"   📄 Fichiers en double: {total_duplicate_files}")
     print(f"   💾 Espace récupérable: {total_space_wasted / (1024*1024):.1f} MB")
-    print(f"   🚀 Performance: {len(finder.files_by_size) / scan_time:.0f} fichiers/sec")
+    print(f"   🚀 Performance: {len(finder.file_batch) / scan_time:.0f} fichiers/sec")
     
-    return scan_time, len(duplicates)
+    return scan_time, group_count
 
 
 def benchmark_cache_cleaner():
@@ -163,13 +213,12 @@ def benchmark_cache_cleaner():
     
     start_time = time.time()
     
-    def progress_callback(count):
-        print(f"   📊 Fichiers trouvés: {count}")
+    progress_callback = RateLimitedProgress(lambda count: print(f"   📊 Fichiers trouvés: {count}"))
     
     cache_files = cleaner.scan_cache_files_optimized(progress_callback)
     
     scan_time = time.time() - start_time
-    total_cache_size = sum(f.size for f in cache_files)
+    total_cache_size = sum(map(attrgetter('size'), cache_files))
     
     print(f"\n📊 RÉSULTATS:")
     print(f"   ⏱️  Temps de scan: {scan_time:.2f}s")
@@ -188,7 +237,7 @@ def benchmark_large_files(test_dir: Path):
     print("📄 Création de gros fichiers test...")
     for i in range(5):
         large_file = test_dir / f"large_file_{i}.bin"
-        large_file.write_bytes(os.urandom(10 * 1024 * 1024))  # 10MB files
+        _fast_write(large_file, os.urandom(10 * 1024 * 1024))  # 10MB files
     
     finder = M1OptimizedLargeFilesFinder(min_size_mb=5)  # 5MB minimum
     
@@ -200,24 +249,33 @@ def benchmark_large_files(test_dir: Path):
     
     start_time = time.time()
     
-    def progress_callback(count):
-        print(f"   📊 Gros fichiers trouvés: {count}")
+    progress_callback = RateLimitedProgress(lambda count: print(f"   📊 Gros fichiers trouvés: {count}"))
     
     large_files = finder.find_large_files_optimized(str(test_dir), progress_callback)
     
     scan_time = time.time() - start_time
-    total_size = sum(f.size for f in large_files)
+    total_size = sum(map(attrgetter('size'), large_files))
     
     print(f"\n📊 RÉSULTATS:")
     print(f"   ⏱️  Temps de scan: {scan_time:.2f}s")
     print(f"   📄 Gros fichiers: {len(large_files)}")
     print(f"   💾 Taille totale: {total_size / (1024*1024):.1f} MB")
     if large_files:
-        print(f"   🏆 Plus gros: {large_files[0].path} ({total_size / (1024*1024):.1f} MB)")
+        largest = max(large_files, key=attrgetter('size'))
+        print(f"   🏆 Plus gros: {largest.path} ({largest.size / (1024*1024):.1f} MB)")
     
     return scan_time, len(large_files)
 
 
+def peak_memory_mb(process) -> float:
+    """Pic de mémoire résidente du processus en MB (un seul getrusage)"""
+    if resource is None:
+        return process.memory_info().rss / (1024*1024)
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss est en octets sur macOS, en KB sur Linux
+    return max_rss / (1024*1024) if sys.platform == "darwin" else max_rss / 1024
+
+
 def run_memory_test():
     """Test l'utilisation mémoire"""
     print_header("TEST MÉMOIRE")
@@ -232,7 +290,7 @@ def run_memory_test():
     for i in range(100):
         large_data.append(os.urandom(1024 * 1024))  # 1MB chunks
     
-    peak_memory = process.memory_info().rss / (1024*1024)  # MB
+    peak_memory = peak_memory_mb(process)  # MB
     print(f"📈 Pic mémoire: {peak_memory:.1f} MB")
     print(f"📊 Augmentation: +{peak_memory - initial_memory:.1f} MB")
     
@@ -331,4 +389,13 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    # Sortie bufferisée quand elle est redirigée (fichier, pipe); ligne par ligne sur un
+    # terminal, pour que la progression limitée en fréquence s'affiche au fil de l'eau
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding=sys.stdout.encoding,
+                                  write_through=False, line_buffering=sys.stdout.isatty())
+    # Messages des scans (logger macclean.core.cleaner) sur la même sortie que le rapport
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    try:
+        main()
+    finally:
+        sys.stdout.flush()
@@ -6,10 +6,14 @@ python -m macclean
 from .gui.main_window import MacCleanApp
 from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import Qt
+import logging
 import sys
 
 def main():
     """Point d'entrée principal de l'application MacClean"""
+    # Résumés des scans sur la console, comme avant le passage au module logging
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     # Configuration de l'application Qt
     QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
     QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
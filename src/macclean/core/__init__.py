@@ -8,10 +8,13 @@ from .cleaner import (
     OrphanedFilesFinder,
     LargeFilesFinder,
     FileInfo,
+    file_type_from_extension,
     M1OptimizedDuplicateFinder,
     M1OptimizedCacheCleaner,
     M1OptimizedLargeFilesFinder
 )
+from .batch import FileBatch
+from .hashdb import HashDatabase
 
 __all__ = [
     'DuplicateFinder',
@@ -19,6 +22,9 @@ __all__ = [
     'OrphanedFilesFinder',
     'LargeFilesFinder',
     'FileInfo',
+    'file_type_from_extension',
+    'FileBatch',
+    'HashDatabase',
     'M1OptimizedDuplicateFinder',
     'M1OptimizedCacheCleaner',
     'M1OptimizedLargeFilesFinder'
@@ -0,0 +1,84 @@
+"""
+Liaison ctypes vers CommonCrypto (macOS) pour SHA-256
+Sur Apple Silicon, CC_SHA256 utilise les instructions SHA2 ARMv8
+"""
+
+import ctypes
+import platform
+
+CC_SHA256_DIGEST_LENGTH = 32
+
+# CC_LONG est un uint32: les mises à jour sont découpées sous cette limite
+_MAX_UPDATE = 1 << 30
+
+
+class _CCSHA256Context(ctypes.Structure):
+    """Équivalent de CC_SHA256_CTX"""
+    _fields_ = [
+        ("count", ctypes.c_uint32 * 2),
+        ("hash", ctypes.c_uint32 * 8),
+        ("wbuf", ctypes.c_uint32 * 16),
+    ]
+
+
+def _load_commoncrypto():
+    """Charge libcommonCrypto sur Apple Silicon, None ailleurs"""
+    if platform.system() != "Darwin" or platform.machine() != "arm64":
+        return None
+
+    try:
+        lib = ctypes.CDLL("/usr/lib/system/libcommonCrypto.dylib")
+    except OSError:
+        return None
+
+    ctx_p = ctypes.POINTER(_CCSHA256Context)
+    lib.CC_SHA256_Init.argtypes = [ctx_p]
+    lib.CC_SHA256_Update.argtypes = [ctx_p, ctypes.c_void_p, ctypes.c_uint32]
+    lib.CC_SHA256_Final.argtypes = [ctypes.POINTER(ctypes.c_ubyte), ctx_p]
+    return lib
+
+
+_libcc = _load_commoncrypto()
+AVAILABLE = _libcc is not None
+
+
+class CCSHA256:
+    """SHA-256 via CommonCrypto, interface compatible avec hashlib"""
+    name = "sha256"
+    digest_size = CC_SHA256_DIGEST_LENGTH
+
+    def __init__(self):
+        if _libcc is None:
+            raise ValueError("CommonCrypto n'est disponible que sur macOS Apple Silicon")
+        self._ctx = _CCSHA256Context()
+        _libcc.CC_SHA256_Init(ctypes.byref(self._ctx))
+
+    def update(self, data):
+        """Ajoute des données - sans copie pour bytes et buffers modifiables (mmap ACCESS_COPY)"""
+        if isinstance(data, bytes) and len(data) <= _MAX_UPDATE:
+            _libcc.CC_SHA256_Update(ctypes.byref(self._ctx), data, len(data))
+            return
+
+        view = memoryview(data).cast("B")
+        try:
+            for offset in range(0, len(view), _MAX_UPDATE):
+                chunk = view[offset:offset + _MAX_UPDATE]
+                if chunk.readonly:
+                    buffer = chunk.tobytes()
+                else:
+                    buffer = (ctypes.c_char * len(chunk)).from_buffer(chunk)
+                _libcc.CC_SHA256_Update(ctypes.byref(self._ctx), buffer, len(chunk))
+                del buffer
+                chunk.release()
+        finally:
+            view.release()
+
+    def digest(self) -> bytes:
+        """Retourne l'empreinte sans modifier l'état courant"""
+        ctx = _CCSHA256Context.from_buffer_copy(self._ctx)
+        md = (ctypes.c_ubyte * CC_SHA256_DIGEST_LENGTH)()
+        _libcc.CC_SHA256_Final(md, ctypes.byref(ctx))
+        return bytes(md)
+
+    def hexdigest(self) -> str:
+        return self.digest().hex()
@@ -0,0 +1,171 @@
+"""
+Parcours de répertoires via getattrlistbulk(2) (macOS)
+Nom, type et attributs stat de toutes les entrées d'un répertoire en un seul appel système
+"""
+
+import ctypes
+import ctypes.util
+import os
+import stat
+import struct
+import sys
+from typing import List, Tuple
+
+ATTR_BIT_MAP_COUNT = 5
+ATTR_CMN_NAME = 0x00000001
+ATTR_CMN_DEVID = 0x00000002
+ATTR_CMN_OBJTYPE = 0x00000008
+ATTR_CMN_MODTIME = 0x00000400
+ATTR_CMN_OWNERID = 0x00008000
+ATTR_CMN_GRPID = 0x00010000
+ATTR_CMN_ACCESSMASK = 0x00020000
+ATTR_CMN_FILEID = 0x02000000
+ATTR_CMN_RETURNED_ATTRS = 0x80000000
+ATTR_FILE_DATALENGTH = 0x00000200
+FSOPT_PACK_INVAL_ATTRS = 0x00000008
+
+# Types d'objets (enum vtype)
+VREG = 1
+VDIR = 2
+VLNK = 5
+
+_BUFFER_SIZE = 256 * 1024
+
+# Entrée retournée (FSOPT_PACK_INVAL_ATTRS: disposition fixe, attributs dans l'ordre des bits):
+# longueur, attribute_set_t retourné (5 x u32), attrreference_t du nom (offset, longueur),
+# périphérique, type d'objet, date de modification (timespec), propriétaire, groupe,
+# permissions, numéro de fichier, taille des données (off_t)
+_ENTRY = struct.Struct("=I5IiIiIqqIIIQq")
+_NAME_REF_OFFSET = 24
+
+_COMMON_ATTRS = (ATTR_CMN_RETURNED_ATTRS | ATTR_CMN_NAME | ATTR_CMN_DEVID | ATTR_CMN_OBJTYPE
+                 | ATTR_CMN_MODTIME | ATTR_CMN_OWNERID | ATTR_CMN_GRPID | ATTR_CMN_ACCESSMASK
+                 | ATTR_CMN_FILEID)
+
+_FILE_TYPE_BITS = {VREG: stat.S_IFREG, VDIR: stat.S_IFDIR, VLNK: stat.S_IFLNK}
+
+
+class DirEntry:
+    """Entrée de répertoire compatible avec os.DirEntry, stat déjà renseigné (sans appel système)"""
+
+    __slots__ = ("name", "path", "_stat")
+
+    def __init__(self, name: str, path: str, stat_result: os.stat_result):
+        self.name = name
+        self.path = path
+        self._stat = stat_result
+
+    def stat(self, *, follow_symlinks: bool = True) -> os.stat_result:
+        if follow_symlinks and self.is_symlink():
+            return os.stat(self.path)
+        return self._stat
+
+    def is_symlink(self) -> bool:
+        return stat.S_ISLNK(self._stat.st_mode)
+
+    def is_file(self, *, follow_symlinks: bool = True) -> bool:
+        if follow_symlinks and self.is_symlink():
+            return os.path.isfile(self.path)
+        return stat.S_ISREG(self._stat.st_mode)
+
+    def __fspath__(self) -> str:
+        return self.path
+
+    def __repr__(self) -> str:
+        return f"<DirEntry {self.name!r}>"
+
+
+class _AttrList(ctypes.Structure):
+    """Équivalent de struct attrlist"""
+    _fields_ = [
+        ("bitmapcount", ctypes.c_ushort),
+        ("reserved", ctypes.c_uint16),
+        ("commonattr", ctypes.c_uint32),
+        ("volattr", ctypes.c_uint32),
+        ("dirattr", ctypes.c_uint32),
+        ("fileattr", ctypes.c_uint32),
+        ("forkattr", ctypes.c_uint32),
+    ]
+
+
+def _load_libc():
+    """Charge getattrlistbulk depuis la libc macOS, None ailleurs"""
+    if sys.platform != "darwin":
+        return None
+
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    except OSError:
+        return None
+
+    if not hasattr(libc, "getattrlistbulk"):
+        return None
+
+    libc.getattrlistbulk.argtypes = [
+        ctypes.c_int, ctypes.POINTER(_AttrList), ctypes.c_void_p, ctypes.c_size_t, ctypes.c_uint64
+    ]
+    libc.getattrlistbulk.restype = ctypes.c_int
+    return libc
+
+
+_libc = _load_libc()
+AVAILABLE = _libc is not None
+
+
+def _parse_entries(view: memoryview, count: int, path: str, files: List[DirEntry], subdirs: List[str]):
+    """Décode count entrées d'un tampon getattrlistbulk: fichiers (et liens vers fichiers), sous-répertoires"""
+    offset = 0
+    for _ in range(count):
+        (length, returned_common, _vol, _dir, _file, _fork, name_offset, name_length,
+         device, obj_type, mtime_sec, mtime_nsec, uid, gid, access_mask, file_id,
+         data_length) = _ENTRY.unpack_from(view, offset)
+
+        if returned_common & ATTR_CMN_NAME:
+            name_start = offset + _NAME_REF_OFFSET + name_offset
+            name = os.fsdecode(bytes(view[name_start:name_start + name_length - 1]))  # Sans le NUL final
+            entry_path = os.path.join(path, name)
+
+            if obj_type == VDIR:
+                subdirs.append(entry_path)
+            elif obj_type in (VREG, VLNK):
+                mode = _FILE_TYPE_BITS[obj_type] | (access_mask & 0o7777)
+                stat_result = os.stat_result(
+                    (mode, file_id, device, 1, uid, gid, data_length, mtime_sec, mtime_sec, mtime_sec),
+                    {"st_mtime": mtime_sec + mtime_nsec * 1e-9,
+                     "st_mtime_ns": mtime_sec * 1_000_000_000 + mtime_nsec},
+                )
+                entry = DirEntry(name, entry_path, stat_result)
+                # Comme os.scandir + is_file(): un lien n'est retenu que s'il pointe vers un fichier
+                if obj_type == VREG or entry.is_file():
+                    files.append(entry)
+
+        offset += length
+
+
+def list_directory(path: str) -> Tuple[List[DirEntry], List[str]]:
+    """Liste un répertoire: (entrées des fichiers avec leur stat, sous-répertoires)"""
+    files, subdirs = [], []
+    try:
+        fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return files, subdirs
+
+    attrs = _AttrList(
+        bitmapcount=ATTR_BIT_MAP_COUNT,
+        commonattr=_COMMON_ATTRS,
+        fileattr=ATTR_FILE_DATALENGTH,
+    )
+    buffer = ctypes.create_string_buffer(_BUFFER_SIZE)
+    view = memoryview(buffer).cast("B")
+
+    try:
+        while True:
+            count = _libc.getattrlistbulk(fd, ctypes.byref(attrs), buffer, _BUFFER_SIZE, FSOPT_PACK_INVAL_ATTRS)
+            if count <= 0:
+                break  # 0: fin du répertoire, -1: erreur (traitée comme une fin de liste)
+            _parse_entries(view, count, path, files, subdirs)
+    finally:
+        view.release()
+        os.close(fd)
+
+    return files, subdirs
@@ -0,0 +1,96 @@
+"""
+Réglages par génération de SoC Apple Silicon
+Taille de bloc de hash (résidente en L1D des cœurs P) et nombre de workers
+"""
+
+import ctypes
+import ctypes.util
+import functools
+import sys
+from typing import NamedTuple, Optional
+
+
+class SocTuning(NamedTuple):
+    """Paramètres de scan adaptés à un SoC"""
+    chunk_size: int
+    max_workers: int
+
+
+# Bloc de hash + état du hasher dans les 128KB de L1D des cœurs P (M1/M2), un peu plus
+# sur M3/M4 - un worker par cœur de performance
+SOC_TUNING = {
+    "Apple M1": SocTuning(64 * 1024, 4),
+    "Apple M1 Pro": SocTuning(64 * 1024, 8),
+    "Apple M1 Max": SocTuning(64 * 1024, 8),
+    "Apple M1 Ultra": SocTuning(64 * 1024, 16),
+    "Apple M2": SocTuning(64 * 1024, 4),
+    "Apple M2 Pro": SocTuning(64 * 1024, 8),
+    "Apple M2 Max": SocTuning(64 * 1024, 8),
+    "Apple M2 Ultra": SocTuning(64 * 1024, 16),
+    "Apple M3": SocTuning(96 * 1024, 4),
+    "Apple M3 Pro": SocTuning(96 * 1024, 6),
+    "Apple M3 Max": SocTuning(96 * 1024, 12),
+    "Apple M4": SocTuning(96 * 1024, 4),
+    "Apple M4 Pro": SocTuning(96 * 1024, 10),
+    "Apple M4 Max": SocTuning(96 * 1024, 12),
+}
+
+
+def _load_libc():
+    """Charge sysctlbyname depuis la libc macOS, None ailleurs"""
+    if sys.platform != "darwin":
+        return None
+
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    except OSError:
+        return None
+
+    if not hasattr(libc, "sysctlbyname"):
+        return None
+
+    libc.sysctlbyname.argtypes = [
+        ctypes.c_char_p, ctypes.c_void_p, ctypes.POINTER(ctypes.c_size_t), ctypes.c_void_p, ctypes.c_size_t
+    ]
+    libc.sysctlbyname.restype = ctypes.c_int
+    return libc
+
+
+_libc = _load_libc()
+
+
+def sysctl_string(name: str) -> Optional[str]:
+    """Valeur texte d'un sysctl lue par sysctlbyname(3) (sans processus sysctl), None si absente"""
+    if _libc is None:
+        return None
+    key = name.encode()
+    size = ctypes.c_size_t(0)
+    if _libc.sysctlbyname(key, None, ctypes.byref(size), None, 0) != 0:
+        return None
+    buffer = ctypes.create_string_buffer(size.value)
+    if _libc.sysctlbyname(key, buffer, ctypes.byref(size), None, 0) != 0:
+        return None
+    return buffer.value.decode(errors="replace")
+
+
+def sysctl_int(name: str) -> Optional[int]:
+    """Valeur entière (32 ou 64 bits) d'un sysctl lue par sysctlbyname(3), None si absente"""
+    if _libc is None:
+        return None
+    value = ctypes.c_uint64(0)
+    size = ctypes.c_size_t(ctypes.sizeof(value))
+    if _libc.sysctlbyname(name.encode(), ctypes.byref(value), ctypes.byref(size), None, 0) != 0:
+        return None
+    # Valeur 32 bits: seuls les 4 premiers octets (poids faible, little-endian) sont écrits
+    return value.value if size.value == 8 else value.value & 0xFFFFFFFF
+
+
+@functools.lru_cache(maxsize=1)
+def get_cpu_brand() -> str:
+    """Nom commercial du processeur (sysctl machdep.cpu.brand_string), vide hors macOS"""
+    return (sysctl_string("machdep.cpu.brand_string") or "").strip()
+
+
+def get_soc_tuning() -> Optional[SocTuning]:
+    """Réglages du SoC courant, None si le modèle n'est pas connu"""
+    return SOC_TUNING.get(get_cpu_brand())
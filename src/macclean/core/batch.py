@@ -0,0 +1,178 @@
+"""
+Stockage en colonnes (Structure of Arrays) des résultats de scan
+Un tableau compact par attribut au lieu d'un objet Python par fichier
+"""
+
+import os
+from array import array
+from stat import S_ISLNK
+from typing import Dict, Iterable, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .cleaner import FileInfo
+
+# Drapeaux par fichier: bit 0 = supprimable, bit 1 = lien symbolique, bits 2-3 = type,
+# bit 4 = type et supprimabilité pas encore déterminés
+FLAG_REMOVABLE = 0b00001
+FLAG_SYMLINK = 0b00010
+FILE_TYPE_SHIFT = 2
+FLAG_UNCLASSIFIED = 0b10000
+FILE_TYPES = ("file", "image", "video", "audio")
+
+
+def _row_flags(file_type: Optional[str], is_removable: Optional[bool]) -> int:
+    """Drapeaux d'une ligne à partir du type et de la supprimabilité"""
+    flags = FLAG_REMOVABLE if is_removable else 0
+    if is_removable is None:
+        flags |= FLAG_UNCLASSIFIED
+    if file_type == "symlink":
+        flags |= FLAG_SYMLINK
+    elif file_type in FILE_TYPES:
+        flags |= FILE_TYPES.index(file_type) << FILE_TYPE_SHIFT
+    return flags
+
+
+def flags_is_removable(flags: int) -> Optional[bool]:
+    """Supprimabilité codée dans des drapeaux (None si non classé)"""
+    if flags & FLAG_UNCLASSIFIED:
+        return None
+    return bool(flags & FLAG_REMOVABLE)
+
+
+def flags_file_type(flags: int) -> Optional[str]:
+    """Type de fichier codé dans des drapeaux (None si non classé)"""
+    if flags & FLAG_SYMLINK:
+        return "symlink"
+    if flags & FLAG_UNCLASSIFIED:
+        return None
+    return FILE_TYPES[(flags >> FILE_TYPE_SHIFT) & 0b11]
+
+
+def ns_to_seconds(mtime_ns: int) -> float:
+    """Date en secondes flottantes, arrondie exactement comme os.stat_result.st_mtime"""
+    seconds, nanoseconds = divmod(mtime_ns, 1_000_000_000)
+    return seconds + nanoseconds * 1e-9
+
+
+class FileBatch:
+    """Collection de fichiers en colonnes: chemins, tailles, dates, identifiants et drapeaux"""
+
+    __slots__ = ("paths", "sizes", "mtimes_ns", "devices", "inodes", "flags")
+
+    def __init__(self):
+        self.paths: List[str] = []
+        self.sizes = array("q")      # int64
+        self.mtimes_ns = array("q")  # int64, nanosecondes (comparaison exacte)
+        self.devices = array("q")    # int64
+        self.inodes = array("Q")     # uint64
+        self.flags = array("B")      # uint8
+
+    @classmethod
+    def from_file_infos(cls, files: Iterable["FileInfo"]) -> "FileBatch":
+        """Construit un lot à partir d'objets FileInfo, colonne par colonne"""
+        files = files if isinstance(files, list) else list(files)
+        batch = cls()
+        batch.paths = [f.path for f in files]
+        batch.sizes = array("q", [f.size for f in files])
+        batch.mtimes_ns = array("q", [
+            f.mtime_ns if f.mtime_ns is not None else round(f.modified_time * 1_000_000_000)
+            for f in files
+        ])
+        batch.devices = array("q", [f.device_id or 0 for f in files])
+        batch.inodes = array("Q", [f.inode or 0 for f in files])
+
+        # Peu de combinaisons (type, supprimable) distinctes: drapeaux calculés une fois chacune
+        flags_cache: Dict[tuple, int] = {}
+        flags = array("B")
+        for f in files:
+            key = (f.file_type, f.is_removable)
+            row_flags = flags_cache.get(key)
+            if row_flags is None:
+                row_flags = flags_cache[key] = _row_flags(*key)
+            flags.append(row_flags)
+        batch.flags = flags
+        return batch
+
+    def append(self, file_info: "FileInfo"):
+        """Ajoute un fichier au lot"""
+        mtime_ns = file_info.mtime_ns
+        if mtime_ns is None:
+            mtime_ns = round(file_info.modified_time * 1_000_000_000)
+        self._append_row(file_info.path, file_info.size, mtime_ns,
+                         file_info.device_id or 0, file_info.inode or 0,
+                         file_info.file_type, file_info.is_removable)
+
+    def append_stat(self, path: str, st: os.stat_result, file_type: Optional[str] = None,
+                    is_removable: Optional[bool] = None):
+        """Ajoute un fichier directement depuis son stat, sans objet FileInfo.
+
+        Sans file_type ni is_removable, la ligne reste non classée (seul le lien symbolique
+        est connu): le classement est laissé aux fichiers qui survivent au filtrage.
+        """
+        if file_type is None and S_ISLNK(st.st_mode):
+            file_type = "symlink"
+        self._append_row(path, st.st_size, st.st_mtime_ns, st.st_dev, st.st_ino, file_type, is_removable)
+
+    def _append_row(self, path: str, size: int, mtime_ns: int, device: int, inode: int,
+                    file_type: Optional[str], is_removable: Optional[bool]):
+        self.paths.append(path)
+        self.sizes.append(size)
+        self.mtimes_ns.append(mtime_ns)
+        self.devices.append(device)
+        self.inodes.append(inode)
+        self.flags.append(_row_flags(file_type, is_removable))
+
+    def extend(self, other: "FileBatch"):
+        """Ajoute toutes les lignes d'un autre lot (concaténation colonne par colonne)"""
+        self.paths.extend(other.paths)
+        self.sizes.extend(other.sizes)
+        self.mtimes_ns.extend(other.mtimes_ns)
+        self.devices.extend(other.devices)
+        self.inodes.extend(other.inodes)
+        self.flags.extend(other.flags)
+
+    def take(self, indices: List[int]) -> "FileBatch":
+        """Nouveau lot formé des lignes aux index donnés, dans cet ordre (tri, filtrage)"""
+        batch = FileBatch()
+        batch.paths = list(map(self.paths.__getitem__, indices))
+        for name in ("sizes", "mtimes_ns", "devices", "inodes", "flags"):
+            column = getattr(self, name)
+            setattr(batch, name, array(column.typecode, map(column.__getitem__, indices)))
+        return batch
+
+    def remove_range(self, start: int, stop: int):
+        """Retire les lignes [start, stop) de chaque colonne, en place"""
+        for name in self.__slots__:
+            del getattr(self, name)[start:stop]
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def is_removable(self, index: int) -> Optional[bool]:
+        """Indique si le fichier à l'index donné peut être supprimé (None si non classé)"""
+        return flags_is_removable(self.flags[index])
+
+    def file_type(self, index: int) -> Optional[str]:
+        """Type du fichier à l'index donné (None si non classé)"""
+        return flags_file_type(self.flags[index])
+
+    def total_size(self, indices: Iterable[int] = None) -> int:
+        """Somme des tailles (de tout le lot ou des index donnés)"""
+        if indices is None:
+            return sum(self.sizes)
+        sizes = self.sizes
+        return sum(map(sizes.__getitem__, indices))
+
+    def group_indices_by_size(self, min_count: int = 1) -> Dict[int, List[int]]:
+        """Regroupe les index par taille: un tri des index puis une seule passe"""
+        sizes = self.sizes
+        order = sorted(range(len(sizes)), key=sizes.__getitem__)
+
+        groups: Dict[int, List[int]] = {}
+        start = 0
+        for end in range(1, len(order) + 1):
+            if end == len(order) or sizes[order[end]] != sizes[order[start]]:
+                if end - start >= min_count:
+                    groups[sizes[order[start]]] = order[start:end]
+                start = end
+        return groups
@@ -4,81 +4,683 @@ Optimisé pour Apple M1/M2 - Utilisation maximale des performances
 """
 
 import os
+import re
+import sys
+import glob
+import asyncio
+import functools
+import itertools
+import logging
 import hashlib
 import platform
 import concurrent.futures
 import multiprocessing
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional, AsyncIterator
-from dataclasses import dataclass, field
+from typing import List, Dict, Tuple, Optional, Iterator, AsyncIterator
+from dataclasses import InitVar, dataclass, field, fields
+from stat import S_ISLNK
 import psutil
 import mmap
 import threading
-from queue import Queue
+from queue import Queue, SimpleQueue
 import time
 
+from . import _ccrypto, _darwin_walk, _tuning
+from .batch import FileBatch, ns_to_seconds
+from .hashdb import FileKey, HashDatabase, file_key
 
-@dataclass
+try:
+    import fcntl  # Absent sous Windows
+except ImportError:
+    fcntl = None
+
+try:
+    from blake3 import blake3  # Optionnel : hash SIMD (NEON sur M1/M2)
+except ImportError:
+    blake3 = None
+
+try:
+    from scandir_rs import Scandir, ReturnType  # Optionnel : parcours + stat parallèles en Rust
+except ImportError:
+    Scandir = None
+
+try:
+    import xxhash  # Optionnel : empreinte rapide non cryptographique
+except ImportError:
+    xxhash = None
+
+# Journal des scans: aucun handler ici, la configuration revient au point d'entrée (GUI, CLI)
+_log = logging.getLogger(__name__)
+
+# Taille des blocs lus en début et fin de fichier pour le pré-filtre
+FINGERPRINT_BLOCK_SIZE = 4096
+
+# Détection ARM64 (M1/M2) une seule fois au chargement du module
+IS_APPLE_SILICON = platform.machine() in ('arm64', 'aarch64')
+
+# Nombre d'entrées traitées par lot dans les scans asynchrones
+SCAN_BATCH_SIZE = 256
+
+
+def _default_hash_algorithm() -> str:
+    """Retourne l'algorithme de hash le plus rapide disponible"""
+    # La détection de doublons n'a pas besoin d'un hash cryptographique:
+    # XXH3-128 (NEON) d'abord, puis BLAKE3, puis SHA-256
+    if xxhash is not None:
+        return "xxh3_128"
+    return "blake3" if blake3 is not None else "sha256"
+
+
+def hash_backend(algorithm: str) -> str:
+    """Décrit l'implémentation utilisée pour un algorithme (OpenSSL, CommonCrypto...)"""
+    if algorithm == "blake3":
+        return "blake3 (SIMD)"
+    if algorithm == "xxh3_128":
+        return "xxhash (SIMD)"
+    if algorithm == "sha256" and _ccrypto.AVAILABLE:
+        return "CommonCrypto (SHA2 ARMv8)"
+    
+    import ssl
+    return ssl.OPENSSL_VERSION
+
+
+# Hashers vierges par (algorithme, graine): copy() duplique un contexte déjà initialisé, sans
+# nouvelle recherche de l'algorithme ni initialisation côté OpenSSL (environ 2.5x plus rapide)
+_hasher_prototypes: Dict[Tuple[str, int], object] = {}
+
+
+def _new_hasher(algorithm: str, seed: int = 0):
+    """Crée un objet de hash pour l'algorithme demandé (graine utilisée par XXH3 seulement)"""
+    if algorithm == "sha256" and _ccrypto.AVAILABLE:
+        return _ccrypto.CCSHA256()  # CommonCrypto: instructions SHA2 ARMv8
+    
+    key = (algorithm, seed if algorithm == "xxh3_128" else 0)
+    prototype = _hasher_prototypes.get(key)
+    if prototype is None:
+        prototype = _hasher_prototypes.setdefault(key, _create_hasher(*key))
+    return prototype.copy()
+
+
+def _create_hasher(algorithm: str, seed: int):
+    """Construit un hasher vierge (prototype de _new_hasher)"""
+    if algorithm == "blake3":
+        if blake3 is None:
+            raise ValueError("Le module blake3 n'est pas installé")
+        return blake3()
+    if algorithm == "xxh3_128":
+        if xxhash is None:
+            raise ValueError("Le module xxhash n'est pas installé")
+        return xxhash.xxh3_128(seed=seed)
+    return hashlib.new(algorithm)
+
+
+# Tampons de lecture réutilisés, un par thread (évite une allocation par bloc lu)
+_thread_buffers = threading.local()
+
+# En dessous de cette taille, lecture directe plutôt que memory mapping
+SMALL_FILE_SIZE = 64 * 1024
+
+# Au-delà de cette taille, BLAKE3 hache un même fichier sur plusieurs threads
+BLAKE3_THREADED_SIZE = 8 * 1024 * 1024
+
+# Hash bloc par bloc des groupes de gros fichiers (au plus LOCKSTEP_MAX_LANES fichiers ouverts)
+LOCKSTEP_MIN_SIZE = 1024 * 1024
+LOCKSTEP_MAX_LANES = 16
+
+# En dessous de ce nombre de fichiers, le pool de processus cède la place aux threads
+PROCESS_POOL_MIN_BATCH = 8
+
+# Jusqu'à ce nombre de fichiers, hash dans le thread appelant: créer un pool coûte plus cher
+PARALLEL_HASH_MIN_BATCH = 4
+
+# Nombre maximal d'appels de progression par lot de hash (plus fin que ce qu'une barre affiche)
+PROGRESS_STEPS = 200
+
+# Hash enregistrés dans la base par transaction pendant le scan: un scan interrompu ne perd
+# que le lot en cours, le suivant reprend sans relire les fichiers déjà hachés
+HASH_DB_FLUSH_SIZE = 500
+
+# Threads de parcours sur macOS: getdirentries64 prend un verrou par volume APFS, au-delà
+# de 4 listages concurrents le parcours ralentit
+APFS_WALK_WORKERS = 4
+
+# Fenêtre de mapping maximale par fichier (limite l'espace d'adressage engagé par worker)
+MMAP_WINDOW_SIZE = 512 * 1024 * 1024
+
+# Début de fenêtre demandé au noyau dès le mapping (MADV_WILLNEED)
+MMAP_PREFETCH_SIZE = 4 * 1024 * 1024
+
+
+def _get_read_buffer(size: int) -> memoryview:
+    """Retourne un tampon de lecture d'au moins size octets, propre au thread courant"""
+    view = getattr(_thread_buffers, "view", None)
+    if view is None or len(view) < size:
+        view = memoryview(bytearray(size))
+        _thread_buffers.view = view
+    return view[:size]
+
+
+def _hash_stream(f, hasher, chunk_size: int):
+    """Hache un fichier par readinto dans un tampon réutilisé"""
+    buffer = _get_read_buffer(chunk_size)
+    while True:
+        n = f.readinto(buffer)
+        if not n:
+            break
+        hasher.update(buffer[:n])
+
+
+def _advise_read_once(fd: int):
+    """Lecture séquentielle unique: macOS F_NOCACHE, ailleurs POSIX_FADV_SEQUENTIAL"""
+    try:
+        if fcntl is not None and hasattr(fcntl, "F_NOCACHE"):
+            fcntl.fcntl(fd, fcntl.F_NOCACHE, 1)
+        elif hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except OSError:
+        pass
+
+
+def _release_page_cache(fd: int):
+    """Libère les pages lues du cache (Linux) pour ne pas évincer des données utiles"""
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+
+
+def _madvise(mm: mmap.mmap, advice_name: str, *span):
+    """Conseil madvise sur un mapping, ignoré si la plateforme ne le connaît pas (Windows)"""
+    advice = getattr(mmap, advice_name, None)
+    if advice is None or not hasattr(mm, "madvise"):
+        return
+    try:
+        mm.madvise(advice, *span)
+    except OSError:
+        pass
+
+
+def _hash_mapped(fd: int, file_size: int, hasher) -> bool:
+    """Hache un fichier par fenêtres mmap successives - False si le mmap est impossible"""
+    for window_start in range(0, file_size, MMAP_WINDOW_SIZE):
+        window_length = min(MMAP_WINDOW_SIZE, file_size - window_start)
+        # ACCESS_COPY: mapping privé dont les vues sont exposables à ctypes sans copie
+        try:
+            mm = mmap.mmap(fd, window_length, access=mmap.ACCESS_COPY, offset=window_start)
+        except (OSError, ValueError):
+            if window_start:
+                raise  # Échec en cours de fichier: ne pas reprendre la lecture au début
+            return False
+        
+        with mm:
+            # Lecture séquentielle: le noyau lit en avance et libère derrière; les premiers
+            # blocs sont demandés tout de suite
+            _madvise(mm, "MADV_SEQUENTIAL")
+            _madvise(mm, "MADV_WILLNEED", 0, min(MMAP_PREFETCH_SIZE, window_length))
+            
+            # Fenêtre entière en un appel sur une vue: la boucle tourne en C, GIL relâché tout
+            # du long, et la vue est libérée avant la fermeture du mapping
+            with memoryview(mm) as view:
+                hasher.update(view)
+            
+            # Fenêtre hachée: ses pages ne seront plus relues
+            _madvise(mm, "MADV_DONTNEED")
+    
+    return True
+
+
+def _hash_blake3_threaded(file_path: str) -> str:
+    """BLAKE3 multithread: mmap et découpage en arbre gérés côté Rust, sans boucle Python"""
+    hasher = blake3(max_threads=blake3.AUTO)
+    if hasattr(hasher, "update_mmap"):  # blake3 >= 0.4
+        hasher.update_mmap(file_path)
+    else:
+        with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            hasher.update(mm)
+    return hasher.hexdigest()
+
+
+def _hash_file(file_path: str, algorithm: str, chunk_size: int, seed: int = 0) -> str:
+    """Calcule le hash d'un fichier - memory mapping sans copie pour les gros fichiers"""
+    with open(file_path, "rb", buffering=0) as f:
+        hasher = _new_hasher(algorithm, seed)
+        fd = f.fileno()
+        file_size = os.fstat(fd).st_size
+        
+        # Pour les petits fichiers, lecture directe dans le tampon du thread
+        if file_size < SMALL_FILE_SIZE:
+            _hash_stream(f, hasher, SMALL_FILE_SIZE)
+            return hasher.hexdigest()
+        
+        # Très gros fichier en BLAKE3: hash multithread d'un seul fichier
+        if algorithm == "blake3" and file_size >= BLAKE3_THREADED_SIZE:
+            try:
+                return _hash_blake3_threaded(file_path)
+            finally:
+                _release_page_cache(fd)  # Le cache de pages est par fichier: vaut pour le mapping Rust
+        
+        # Gros fichier lu une seule fois: ne pas polluer le cache de pages
+        _advise_read_once(fd)
+        
+        try:
+            # Pour les gros fichiers, hacher le mmap directement (pas de copie en bytes)
+            if not _hash_mapped(fd, file_size, hasher):
+                # Système de fichiers sans mmap: lecture séquentielle par blocs
+                _hash_stream(f, hasher, chunk_size)
+        finally:
+            _release_page_cache(fd)
+        
+        return hasher.hexdigest()
+
+
+def _process_context():
+    """Contexte multiprocessing du pool de hash: fork (démarrage rapide) sauf sur macOS/Windows"""
+    if sys.platform == "darwin" or "fork" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")  # fork n'est pas sûr avec les frameworks macOS
+    return multiprocessing.get_context("fork")
+
+
+def _hash_group_lockstep(paths: List[str], algorithm: str, chunk_size: int, seed: int = 0,
+                        stop_event: Optional[threading.Event] = None) -> Dict[str, str]:
+    """Hache des fichiers de même taille bloc par bloc, ensemble.
+    
+    Après chaque bloc, les fichiers sont répartis selon l'état de leur hash: un fichier
+    dont le contenu ne correspond plus à aucun autre est abandonné sans être lu jusqu'au bout.
+    Seuls les fichiers restés identiques à au moins un autre reçoivent un hash.
+    stop_event, lu avant chaque bloc, arrête la lecture (seuls les hash complets sont rendus).
+    """
+    files = {}
+    try:
+        for path in paths:
+            try:
+                files[path] = open(path, "rb", buffering=0)
+            except OSError:
+                continue
+            _advise_read_once(files[path].fileno())
+        
+        hashers = {path: _new_hasher(algorithm, seed) for path in files}
+        buffer = _get_read_buffer(chunk_size)
+        results = {}
+        partitions = [list(files)] if len(files) > 1 else []
+        
+        while partitions:
+            if stop_event is not None and stop_event.is_set():
+                break
+            remaining = []
+            for partition in partitions:
+                by_state: Dict[Tuple[int, bytes], List[str]] = {}
+                for path in partition:
+                    try:
+                        n = files[path].readinto(buffer)
+                    except OSError:
+                        continue
+                    if n:
+                        hashers[path].update(buffer[:n])
+                    by_state.setdefault((n, hashers[path].digest()), []).append(path)
+                
+                for (n, _state), same in by_state.items():
+                    if len(same) < 2:
+                        continue  # Contenu unique: plus besoin de le lire
+                    if n:
+                        remaining.append(same)
+                    else:
+                        # Fin de fichier atteinte ensemble: contenus identiques
+                        for path in same:
+                            results[path] = hashers[path].hexdigest()
+            partitions = remaining
+        
+        return results
+    finally:
+        for f in files.values():
+            _release_page_cache(f.fileno())  # Gros fichiers lus une fois: pages rendues au système
+            f.close()
+
+
+def _hash_file_worker(job: Tuple[str, str, int, int]) -> Tuple[str, str]:
+    """Worker picklable pour le pool de processus: (chemin, hash) - hash vide en cas d'erreur"""
+    file_path, algorithm, chunk_size, seed = job
+    try:
+        return file_path, _hash_file(file_path, algorithm, chunk_size, seed)
+    except (OSError, IOError, ValueError):
+        return file_path, ""
+
+
+def _hash_files_worker(jobs: List[Tuple[str, str, int, int]]) -> List[Tuple[str, str]]:
+    """Lot de jobs pour le pool de processus: un message par lot amortit l'IPC"""
+    return [_hash_file_worker(job) for job in jobs]
+
+
+def _block_fingerprint(file_path: str, offset: int):
+    """Empreinte rapide d'un bloc de 4KB à l'offset donné (pread: pas de seek)"""
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        if hasattr(os, "pread"):
+            data = os.pread(fd, FINGERPRINT_BLOCK_SIZE, offset)
+        else:
+            os.lseek(fd, offset, os.SEEK_SET)
+            data = os.read(fd, FINGERPRINT_BLOCK_SIZE)
+    finally:
+        os.close(fd)
+    
+    # Sans xxhash, les octets eux-mêmes servent de clé (comparaison exacte)
+    return xxhash.xxh3_64_intdigest(data) if xxhash is not None else data
+
+
+def _tail_offset(size: int) -> int:
+    """Offset du dernier bloc, sans recouvrir le premier"""
+    return max(FINGERPRINT_BLOCK_SIZE, size - FINGERPRINT_BLOCK_SIZE)
+
+
+async def _to_thread(func, *args):
+    """Exécute func dans l'exécuteur par défaut (asyncio.to_thread n'existe qu'à partir de 3.9)"""
+    return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+
+def _list_directory(path: str) -> Tuple[List[os.DirEntry], List[str]]:
+    """Liste un répertoire en un seul scandir: (fichiers, sous-répertoires)"""
+    files, subdirs = [], []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file():
+                        files.append(entry)
+                except OSError:
+                    continue
+    except (OSError, PermissionError):
+        pass
+    return files, subdirs
+
+
+# macOS: getattrlistbulk (entrées avec leur stat, un appel système par lot d'entrées),
+# ailleurs os.scandir
+_platform_list_directory = _darwin_walk.list_directory if _darwin_walk.AVAILABLE else _list_directory
+
+
+def _walk_files_parallel(root: str, workers: int, skip_dir=None, list_directory=_platform_list_directory,
+                        stop_event: Optional[threading.Event] = None) -> list:
+    """Parcourt un répertoire avec quelques threads alimentés par une file partagée de répertoires
+    (stop_event, lu avant chaque répertoire, vide la file sans lister la suite)"""
+    directories: SimpleQueue = SimpleQueue()
+    directories.put(root)
+    pending = [1]  # Répertoires en file ou en cours de listage
+    lock = threading.Lock()
+    
+    def worker() -> list:
+        files = []  # Fichiers trouvés par ce thread, fusionnés à la fin
+        while True:
+            directory = directories.get()
+            if directory is None:
+                return files
+            
+            try:
+                if stop_event is not None and stop_event.is_set():
+                    continue  # Répertoire abandonné (compté terminé par le finally)
+                dir_files, subdirs = list_directory(directory)
+                files.extend(dir_files)
+                if skip_dir is not None:
+                    subdirs = [d for d in subdirs if not skip_dir(d)]
+                with lock:
+                    pending[0] += len(subdirs)
+                for subdir in subdirs:
+                    directories.put(subdir)
+            finally:
+                with lock:
+                    pending[0] -= 1
+                    finished = pending[0] == 0
+                if finished:
+                    # Plus aucun répertoire à lister: une sentinelle par thread
+                    for _ in range(workers):
+                        directories.put(None)
+    
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(worker) for _ in range(workers)]
+        return list(itertools.chain.from_iterable(future.result() for future in futures))
+
+
+def _walk_files(root: str, skip_dir=None, list_directory=_platform_list_directory,
+               stop_event: Optional[threading.Event] = None) -> Iterator[os.DirEntry]:
+    """Parcourt récursivement un répertoire avec une pile explicite (un scandir par répertoire,
+    stop_event lu avant chacun)"""
+    stack = [root]
+    while stack and not (stop_event is not None and stop_event.is_set()):
+        files, subdirs = list_directory(stack.pop())
+        yield from files
+        if skip_dir is not None:
+            subdirs = [d for d in subdirs if not skip_dir(d)]
+        stack.extend(subdirs)
+
+
+async def _walk_files_async(root: str, semaphore: asyncio.Semaphore, skip_dir=None,
+                            list_directory=_platform_list_directory, files: Optional[list] = None,
+                            stop_event: Optional[threading.Event] = None) -> list:
+    """Parcourt récursivement un répertoire avec plusieurs listages concurrents.
+    
+    Toute la récursion remplit une seule liste (files): chaque entrée n'est copiée qu'une fois,
+    au lieu d'être recopiée dans la liste de chaque répertoire parent. stop_event est lu avant
+    chaque répertoire: les répertoires pas encore listés sont abandonnés.
+    """
+    if files is None:
+        files = []
+    
+    async with semaphore:
+        if stop_event is not None and stop_event.is_set():
+            return files
+        dir_files, subdirs = await _to_thread(list_directory, root)
+    files.extend(dir_files)  # Dans la boucle d'événements: pas d'accès concurrent
+    
+    if skip_dir is not None:
+        subdirs = [d for d in subdirs if not skip_dir(d)]
+    
+    await asyncio.gather(*(
+        _walk_files_async(d, semaphore, skip_dir, list_directory, files, stop_event) for d in subdirs
+    ))
+    return files
+
+
+def _independent_roots(directories: List[str]) -> List[str]:
+    """Racines sans recouvrement: un répertoire inclus dans un autre n'est parcouru qu'une fois"""
+    roots: List[str] = []
+    for directory in sorted({os.path.realpath(d) for d in directories}):
+        if not any(directory == root or directory.startswith(root.rstrip(os.sep) + os.sep) for root in roots):
+            roots.append(directory)
+    return roots
+
+
+@functools.lru_cache(maxsize=4)
+def _cache_dir_candidates(system: str, home: str) -> Tuple[str, ...]:
+    """Répertoires de cache possibles pour un OS et un dossier personnel (motifs non développés),
+    calculés une fois: chaque nettoyeur créé ne refait que les tests d'existence"""
+    home = Path(home)
+    cache_dirs = []
+    
+    if system == "Darwin":  # macOS - Optimisations spéciales M1
+        cache_dirs.extend([
+            str(home / "Library/Caches"),
+            str(home / "Library/Application Support"),
+            "/tmp",
+            "/var/tmp",
+            str(home / "Library/Logs"),
+            str(home / "Library/Safari/LocalStorage"),
+            str(home / "Library/Safari/Databases"),
+            # Caches spécifiques M1/Apple Silicon
+            str(home / "Library/Developer/Xcode/DerivedData"),
+            str(home / "Library/Developer/CoreSimulator/Caches"),
+            str(home / "Library/Caches/com.apple.dt.Xcode"),
+            # Caches Rosetta 2 sur M1
+            "/var/folders",  # Caches temporaires système
+        ])
+    elif system == "Linux":
+        cache_dirs.extend([
+            str(home / ".cache"),
+            "/tmp",
+            "/var/tmp",
+            str(home / ".local/share/Trash"),
+            str(home / ".mozilla/firefox/*/Cache"),
+            str(home / ".config/google-chrome/Default/Cache"),
+        ])
+    elif system == "Windows":
+        cache_dirs.extend([
+            os.path.expandvars(r"%LOCALAPPDATA%\Temp"),
+            os.path.expandvars(r"%TEMP%"),
+            os.path.expandvars(r"%LOCALAPPDATA%\Microsoft\Windows\Temporary Internet Files"),
+            os.path.expandvars(r"%LOCALAPPDATA%\Google\Chrome\User Data\Default\Cache"),
+            os.path.expandvars(r"%APPDATA%\Mozilla\Firefox\Profiles\*\cache2"),
+        ])
+    
+    return tuple(cache_dirs)
+
+
+def _batches(entries: List[os.DirEntry]) -> List[List[os.DirEntry]]:
+    """Découpe les entrées en lots de SCAN_BATCH_SIZE"""
+    return [entries[i:i + SCAN_BATCH_SIZE] for i in range(0, len(entries), SCAN_BATCH_SIZE)]
+
+
+@functools.lru_cache(maxsize=2048)
+def file_type_from_extension(extension: str) -> str:
+    """Type associé à une extension (avec le point, en minuscules) - mis en cache, quelques
+    extensions couvrant l'essentiel des fichiers"""
+    import mimetypes
+    
+    mime_type, _ = mimetypes.guess_type("x" + extension)
+    if mime_type:
+        if mime_type.startswith('image/'):
+            return "image"
+        elif mime_type.startswith('video/'):
+            return "video"
+        elif mime_type.startswith('audio/'):
+            return "audio"
+    
+    return "file"
+
+
+def _file_type_from_name(path: str) -> str:
+    """Type déduit de l'extension (sans accès disque)"""
+    return file_type_from_extension(os.path.splitext(path)[1].lower())
+
+
+def _is_writable_path(path: str) -> bool:
+    """Supprimabilité d'un fichier ordinaire: règle unique quel que soit le parcours qui l'a
+    trouvé (os.access tient compte des ACL, que les bits de st_mode ignorent)"""
+    return os.access(path, os.W_OK) and not _is_system_path(path)
+
+
+def _is_system_path(path: str) -> bool:
+    """Fichier protégé du système macOS"""
+    return os.path.dirname(path).startswith(('/System', '/Library/System', '/usr/lib'))
+
+
+def _slotted_dataclass(cls):
+    """dataclass sans __dict__ par instance: slots=True à partir de Python 3.10,
+    classe recréée avec __slots__ avant (comme le fait dataclass lui-même)"""
+    if sys.version_info >= (3, 10):
+        return dataclass(slots=True)(cls)
+    
+    cls = dataclass(cls)
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict["__slots__"] = field_names
+    for name in field_names:
+        cls_dict.pop(name, None)  # Les valeurs par défaut vivent dans __init__
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
+@_slotted_dataclass
 class FileInfo:
     """Information sur un fichier - Optimisé pour M1"""
     path: str
     size: int
-    hash_md5: Optional[str] = None
+    hash_md5: Optional[str] = None  # Hash du contenu, nom conservé (algorithme: M1OptimizedDuplicateFinder.hash_algorithm)
     modified_time: float = 0.0
     device_id: Optional[int] = None  # Pour optimiser les accès disque sur M1
     inode: Optional[int] = None      # Pour détecter les liens physiques
-    file_type: str = "file"          # Type de fichier (image, video, symlink, etc.)
-    is_removable: bool = True        # Si le fichier peut être supprimé
+    file_type: Optional[str] = "file"    # Type de fichier (image, video, symlink, etc.) - None: pas encore déterminé
+    is_removable: Optional[bool] = True  # Si le fichier peut être supprimé - None: pas encore déterminé
+    mtime_ns: Optional[int] = None       # Date de modification exacte, clé des caches de hash
+    stat_result: InitVar[Optional[os.stat_result]] = None  # lstat déjà fait par le parcours
     
-    def __post_init__(self):
-        # Vérifier d'abord si c'est un lien symbolique
-        if os.path.islink(self.path):
+    def __post_init__(self, stat_result: Optional[os.stat_result] = None):
+        if stat_result is not None:
+            self._init_from_stat(stat_result)
+            return
+        
+        # Construction directe (chemin seul): un lstat par fichier, à éviter dans les parcours
+        # qui ont déjà le stat de l'entrée (voir from_stat et le paramètre stat_result)
+        try:
+            stat = os.lstat(self.path)  # lstat pour le lien, pas la cible
+        except (OSError, IOError):
+            return  # Fichier inexistant: garde la taille fournie
+        self._init_from_stat(stat)
+    
+    def _init_from_stat(self, st: os.stat_result):
+        """Renseigne les champs depuis un lstat existant (un seul access pour un fichier ordinaire)"""
+        self.size = st.st_size
+        self.modified_time = st.st_mtime
+        self.mtime_ns = st.st_mtime_ns
+        self.device_id = st.st_dev
+        self.inode = st.st_ino
+        
+        if S_ISLNK(st.st_mode):
             self.file_type = "symlink"
-            self.is_removable = self._is_removable()
-            
-            # Pour les liens symboliques, obtenir les infos du lien lui-même
-            try:
-                stat = os.lstat(self.path)  # lstat pour le lien, pas la cible
-                self.size = stat.st_size
-                self.modified_time = stat.st_mtime
-                self.device_id = stat.st_dev
-                self.inode = stat.st_ino
-            except (OSError, IOError):
-                pass
-        elif os.path.exists(self.path):
-            try:
-                stat = os.stat(self.path)
-                self.size = stat.st_size
-                self.modified_time = stat.st_mtime
-                self.device_id = stat.st_dev
-                self.inode = stat.st_ino
-                
-                # Déterminer le type de fichier
-                self.file_type = self._get_file_type()
-                
-                # Vérifier si le fichier peut être supprimé
-                self.is_removable = self._is_removable()
-                
-            except (OSError, IOError):
-                pass
+            self.is_removable = self._is_removable()  # La cible doit être vérifiée
+        else:
+            self.file_type = _file_type_from_name(self.path)
+            self.is_removable = _is_writable_path(self.path)
+    
+    def _finalize(self):
+        """Détermine le type et la supprimabilité laissés en attente (fichiers retenus seulement).
+        
+        Le stat du parcours a déjà marqué les liens symboliques (S_ISLNK): un type en attente
+        est celui d'un fichier ordinaire, sans nouveau lstat.
+        """
+        if self.file_type is None:
+            self.file_type = _file_type_from_name(self.path)
+        if self.is_removable is None:
+            if self.file_type == "symlink":
+                self.is_removable = self._is_removable()  # La cible doit être vérifiée
+            else:
+                self.is_removable = _is_writable_path(self.path)
+    
+    @classmethod
+    def from_stat(cls, path: str, st: os.stat_result) -> "FileInfo":
+        """FileInfo réduit aux champs du stat, type et supprimabilité en attente (voir _finalize)"""
+        file_info = cls.__new__(cls)
+        file_info.path = path
+        file_info.size = st.st_size
+        file_info.hash_md5 = None
+        file_info.modified_time = st.st_mtime
+        file_info.device_id = st.st_dev
+        file_info.inode = st.st_ino
+        file_info.file_type = "symlink" if S_ISLNK(st.st_mode) else None
+        file_info.is_removable = None
+        file_info.mtime_ns = st.st_mtime_ns
+        return file_info
+    
+    @classmethod
+    def from_batch(cls, batch: FileBatch, index: int) -> "FileInfo":
+        """Reconstruit le FileInfo d'une ligne de FileBatch, sans accès disque (voir _finalize)"""
+        file_info = cls.__new__(cls)
+        file_info.path = batch.paths[index]
+        file_info.size = batch.sizes[index]
+        file_info.hash_md5 = None
+        file_info.mtime_ns = batch.mtimes_ns[index]
+        file_info.modified_time = ns_to_seconds(file_info.mtime_ns)
+        file_info.device_id = batch.devices[index]
+        file_info.inode = batch.inodes[index]
+        file_info.file_type = batch.file_type(index)
+        file_info.is_removable = batch.is_removable(index)
+        return file_info
     
     def _get_file_type(self) -> str:
         """Détermine le type du fichier"""
-        import mimetypes
-        
         if os.path.islink(self.path):
             return "symlink"
-        
-        mime_type, _ = mimetypes.guess_type(self.path)
-        if mime_type:
-            if mime_type.startswith('image/'):
-                return "image"
-            elif mime_type.startswith('video/'):
-                return "video"
-            elif mime_type.startswith('audio/'):
-                return "audio"
-        
-        return "file"
+        return _file_type_from_name(self.path)
     
     def _is_removable(self) -> bool:
         """Vérifie si le fichier peut être supprimé"""
@@ -95,7 +697,7 @@ class FileInfo:
                 return False
             
             # Vérifier si c'est un fichier système sur macOS
-            if os.path.dirname(self.path).startswith(('/System', '/Library/System', '/usr/lib')):
+            if _is_system_path(self.path):
                 return False
                 
             return True
@@ -106,190 +708,442 @@ class FileInfo:
 class M1OptimizedDuplicateFinder:
     """Classe optimisée pour Apple M1 - Utilise tous les cœurs et la mémoire unifiée"""
     
-    def __init__(self, max_workers: Optional[int] = None):
+    def __init__(self, max_workers: Optional[int] = None, hash_algorithm: Optional[str] = None,
+                 use_processes: bool = False, hash_db: Optional[HashDatabase] = None):
+        # Réglages connus pour ce SoC (M1, M1 Pro, M3...), sinon valeurs génériques
+        tuning = _tuning.get_soc_tuning()
+        
         # Optimisation M1: utiliser tous les cœurs de performance + efficience
         cpu_count = os.cpu_count() or 8
-        self.max_workers = max_workers or min(cpu_count, 16)  # Limité à 16 pour éviter la sur-allocation
+        default_workers = tuning.max_workers if tuning else min(cpu_count, 16)  # Limité à 16 pour éviter la sur-allocation
+        self.max_workers = max_workers or default_workers
+        
+        # Threads de hash: le hash C relâche le GIL pendant toute la fenêtre, deux threads par
+        # cœur recouvrent les lectures disque
+        self.hash_threads = max_workers or 2 * cpu_count
+        
+        # Parcours limité par le verrou de répertoire APFS, hash limité par le CPU
+        self.walk_workers = min(APFS_WALK_WORKERS, self.max_workers) if sys.platform == "darwin" else self.max_workers
         
         # Détection si on est sur ARM64 (M1/M2)
-        self.is_apple_silicon = platform.machine() in ('arm64', 'aarch64')
+        self.is_apple_silicon = IS_APPLE_SILICON
         
         # Taille de chunk optimisée pour M1 (plus grande grâce à la mémoire unifiée)
-        self.chunk_size = 1024 * 1024 if self.is_apple_silicon else 64 * 1024  # 1MB vs 64KB
+        if tuning:
+            self.chunk_size = tuning.chunk_size
+        else:
+            self.chunk_size = 1024 * 1024 if self.is_apple_silicon else 64 * 1024  # 1MB vs 64KB
+        
+        # Hash du contenu pour la détection: XXH3-128 ou BLAKE3 si disponibles, sinon SHA-256
+        # (OpenSSL utilise les extensions SHA2 ARMv8 sur M1/M2)
+        self.hash_algorithm = hash_algorithm or _default_hash_algorithm()
+        
+        # Hash dans des processus séparés (un cœur par worker, aucun octet transféré: chaque
+        # worker relit le fichier par son chemin) - sinon threads, le hash C libérant le GIL
+        self.use_processes = use_processes
+        
+        # Cache pour éviter de recalculer les hash: signature (périphérique, inode) ->
+        # (taille, mtime_ns, hash), taille et date vérifiées à chaque succès
+        self.hash_cache: Dict[int, Tuple[int, int, str]] = {}
+        
+        # Cache persistant entre les exécutions (périphérique, inode, taille, mtime) -> hash
+        self.hash_db = hash_db
         
-        # Cache pour éviter de recalculer les hash
-        self.hash_cache: Dict[Tuple[int, float, int], str] = {}
+        # Graine XXH3 propre à la base: des collisions fabriquées à l'avance ne s'appliquent pas
+        self.hash_seed = hash_db.seed if hash_db is not None else 0
         
-        self.files_by_size: Dict[int, List[FileInfo]] = {}
+        self.file_batch = FileBatch()  # Fichiers du dernier scan, en colonnes
+        self.files_by_size: Dict[int, List[FileInfo]] = {}  # Tailles partagées par plusieurs fichiers
         self.duplicates: List[List[FileInfo]] = []
     
-    def _get_file_signature(self, file_info: FileInfo) -> Tuple[int, float, int]:
-        """Crée une signature unique pour le cache des hash"""
-        return (file_info.size, file_info.modified_time, file_info.inode or 0)
+    def _get_file_signature(self, file_info: FileInfo) -> int:
+        """Crée une signature unique pour le cache des hash: un seul entier (périphérique, inode)"""
+        return ((file_info.device_id or 0) << 64) | (file_info.inode or 0)
     
-    def calculate_md5_optimized(self, file_path: str) -> str:
-        """Calcule le hash MD5 optimisé pour M1 avec memory mapping"""
+    def _memory_lookup(self, key: FileKey) -> Optional[str]:
+        """Hash du cache mémoire si taille et date n'ont pas changé"""
+        dev, ino, size, mtime_ns = key
+        cached = self.hash_cache.get((dev << 64) | ino)
+        if cached is not None and cached[0] == size and cached[1] == mtime_ns:
+            return cached[2]
+        return None
+    
+    def _memory_store(self, key: FileKey, digest: str):
+        dev, ino, size, mtime_ns = key
+        self.hash_cache[(dev << 64) | ino] = (size, mtime_ns, digest)
+    
+    def _hash_path(self, file_path: str, algorithm: str) -> str:
+        """Lit et hache le fichier, chaîne vide en cas d'erreur"""
         try:
-            with open(file_path, "rb") as f:
-                # Pour les petits fichiers, lecture directe
-                file_size = os.path.getsize(file_path)
-                
-                if file_size < 64 * 1024:  # < 64KB
-                    return hashlib.md5(f.read()).hexdigest()
-                
-                # Pour les gros fichiers, utiliser memory mapping (plus efficace sur M1)
-                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
-                    hash_md5 = hashlib.md5()
-                    
-                    # Traitement par chunks optimisés pour M1
-                    for i in range(0, len(mm), self.chunk_size):
-                        chunk = mm[i:i + self.chunk_size]
-                        hash_md5.update(chunk)
-                    
-                    return hash_md5.hexdigest()
+            return _hash_file(file_path, algorithm, self.chunk_size, self.hash_seed)
         except (OSError, IOError, ValueError):
             return ""
     
-    def calculate_md5_batch(self, file_paths: List[str]) -> Dict[str, str]:
-        """Calcule les hash MD5 en parallèle sur plusieurs cœurs M1"""
-        results = {}
+    def _cached_hash(self, file_path: str, algorithm: str) -> str:
+        """Hash depuis le cache mémoire ou la base persistante si le fichier n'a pas changé, sinon lecture"""
+        key = file_key(file_path)  # Relevée avant la lecture: une modification pendant le hash l'invalide
+        if key is None:
+            return ""
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        # Le cache mémoire ne contient que l'algorithme du finder
+        use_memory = algorithm == self.hash_algorithm
+        digest = self._memory_lookup(key) if use_memory else None
+        if digest:
+            return digest
+        
+        digest = self.hash_db.lookup(key, algorithm) if self.hash_db is not None else None
+        if not digest:
+            digest = self._hash_path(file_path, algorithm)
+            if digest and self.hash_db is not None:
+                self.hash_db.store_many([(key, digest)], algorithm)
+        if digest and use_memory:
+            self._memory_store(key, digest)
+        return digest
+    
+    def calculate_hash(self, file_path: str) -> str:
+        """Calcule le hash du contenu avec l'algorithme rapide du finder"""
+        return self._cached_hash(file_path, self.hash_algorithm)
+    
+    def calculate_md5_optimized(self, file_path: str) -> str:
+        """Calcule le hash MD5 optimisé pour M1 avec memory mapping"""
+        return self._cached_hash(file_path, "md5")
+    
+    def _hash_in_threads(self, file_paths: List[str]):
+        """Hash en parallèle dans un pool de threads - (chemin, hash) au fil de l'eau
+        (générateur fermé avant la fin: les calculs non commencés sont annulés)"""
+        if len(file_paths) <= PARALLEL_HASH_MIN_BATCH:
+            for path in file_paths:
+                yield path, self._hash_path(path, self.hash_algorithm)
+            return
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.hash_threads) as executor:
             # Soumettre tous les calculs en parallèle
             future_to_path = {
-                executor.submit(self.calculate_md5_optimized, path): path 
+                executor.submit(self._hash_path, path, self.hash_algorithm): path
                 for path in file_paths
             }
             
             # Récupérer les résultats au fur et à mesure
-            for future in concurrent.futures.as_completed(future_to_path):
-                path = future_to_path[future]
+            try:
+                for future in concurrent.futures.as_completed(future_to_path):
+                    path = future_to_path[future]
+                    try:
+                        yield path, future.result()
+                    except Exception:
+                        yield path, ""  # Ignorer les erreurs
+            finally:
+                for future in future_to_path:
+                    future.cancel()
+    
+    def _hash_in_processes(self, file_paths: List[str]):
+        """Hash en parallèle dans un pool de processus - (chemin, hash) au fil de l'eau
+        (générateur fermé avant la fin: les lots non commencés sont annulés)"""
+        # Lots de plusieurs fichiers par message pour amortir l'IPC
+        chunksize = max(1, len(file_paths) // (self.max_workers * 4))
+        jobs = [(path, self.hash_algorithm, self.chunk_size, self.hash_seed) for path in file_paths]
+        
+        with concurrent.futures.ProcessPoolExecutor(max_workers=self.max_workers,
+                                                    mp_context=_process_context()) as executor:
+            futures = [executor.submit(_hash_files_worker, jobs[i:i + chunksize])
+                       for i in range(0, len(jobs), chunksize)]
+            try:
+                for future in concurrent.futures.as_completed(futures):
+                    yield from future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+    
+    def calculate_md5_batch(self, file_paths: List[str], progress_callback=None,
+                             on_hashed=None, stop_event: Optional[threading.Event] = None) -> Dict[str, str]:
+        """Calcule les hash (algorithme hash_algorithm, nom conservé) en parallèle sur plusieurs
+        cœurs M1 - on_hashed(chemin, hash) est appelé pour chaque hash obtenu, au fil de l'eau.
+        stop_event, lu après chaque fichier, annule les calculs en attente (hash partiels rendus)."""
+        results = {}
+        total = len(file_paths)
+        
+        # Petits lots: le démarrage des processus coûte plus que le hash lui-même
+        if self.use_processes and total >= PROCESS_POOL_MIN_BATCH:
+            completed = self._hash_in_processes(file_paths)
+        else:
+            completed = self._hash_in_threads(file_paths)
+        
+        step = max(1, total // PROGRESS_STEPS)
+        try:
+            for done, (path, hash_result) in enumerate(completed, 1):
+                if hash_result:
+                    results[path] = hash_result
+                    if on_hashed:
+                        on_hashed(path, hash_result)
+                if progress_callback and (done % step == 0 or done == total):
+                    progress_callback(done, total)
+                if stop_event is not None and stop_event.is_set():
+                    break
+        finally:
+            completed.close()  # Annule ce qui n'a pas commencé
+        
+        return results
+    
+    def hash_groups_lockstep(self, groups: List[List[FileInfo]], progress_callback=None,
+                             on_hashed=None, stop_event: Optional[threading.Event] = None) -> Dict[str, str]:
+        """Hache des groupes de fichiers de même taille, un groupe par worker, bloc par bloc
+        (on_hashed et stop_event comme pour calculate_md5_batch; stop_event est aussi lu par
+        chaque worker avant chaque bloc)"""
+        results = {}
+        total = sum(map(len, groups))
+        done = 0
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.hash_threads) as executor:
+            future_to_group = {
+                executor.submit(_hash_group_lockstep, [f.path for f in group], self.hash_algorithm,
+                                self.chunk_size, self.hash_seed, stop_event): group
+                for group in groups
+            }
+            
+            for future in concurrent.futures.as_completed(future_to_group):
+                if stop_event is not None and stop_event.is_set():
+                    for pending in future_to_group:
+                        pending.cancel()
+                    break
                 try:
-                    hash_result = future.result()
-                    if hash_result:
-                        results[path] = hash_result
-                except Exception:
-                    pass  # Ignorer les erreurs
+                    group_results = future.result()
+                except (OSError, IOError, ValueError):
+                    group_results = {}  # Groupe illisible: aucun doublon confirmé
+                results.update(group_results)
+                if on_hashed:
+                    for path, digest in group_results.items():
+                        on_hashed(path, digest)
+                done += len(future_to_group[future])
+                if progress_callback:
+                    progress_callback(done, total)
         
         return results
     
-    def scan_directory_optimized(self, directory: str, progress_callback=None) -> List[List[FileInfo]]:
+    def split_by_fingerprint(self, group: List[FileInfo]) -> List[List[FileInfo]]:
+        """Sous-groupe des fichiers de même taille par empreinte début+fin"""
+        return self.split_groups_by_fingerprint([group])
+    
+    def _split_by_block(self, executor, groups: List[List[FileInfo]], offset_of) -> List[List[FileInfo]]:
+        """Sous-groupe chaque groupe selon l'empreinte du bloc situé à offset_of(taille)"""
+        files_by_fingerprint: Dict[Tuple[int, object], List[FileInfo]] = {}
+        
+        future_to_file = {}
+        for group_index, group in enumerate(groups):
+            for f in group:
+                future = executor.submit(_block_fingerprint, f.path, offset_of(f.size))
+                future_to_file[future] = (group_index, f)
+        
+        for future in concurrent.futures.as_completed(future_to_file):
+            group_index, file_info = future_to_file[future]
+            try:
+                fingerprint = future.result()
+            except (OSError, IOError):
+                continue  # Fichier illisible: ne peut pas être un doublon vérifié
+            files_by_fingerprint.setdefault((group_index, fingerprint), []).append(file_info)
+        
+        return [files for files in files_by_fingerprint.values() if len(files) > 1]
+    
+    def split_groups_by_fingerprint(self, groups: List[List[FileInfo]]) -> List[List[FileInfo]]:
+        """Sous-groupe des groupes de même taille par empreintes progressives (un seul pool)"""
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # 1) premier bloc: la plupart des fichiers différents divergent dès le début
+            survivors = self._split_by_block(executor, groups, lambda size: 0)
+            
+            # 2) dernier bloc, seulement pour les survivants qui en ont un distinct du premier
+            short = [g for g in survivors if g[0].size <= FINGERPRINT_BLOCK_SIZE]
+            long = [g for g in survivors if g[0].size > FINGERPRINT_BLOCK_SIZE]
+            survivors = short + self._split_by_block(executor, long, _tail_offset)
+        
+        # Seules les collisions d'empreinte méritent un hash complet
+        return survivors
+    
+    def scan_directory_optimized(self, directory: str, progress_callback=None,
+                                 stop_event: Optional[threading.Event] = None) -> List[List[FileInfo]]:
         """Scanne un répertoire optimisé pour M1 - Parallélisation maximale"""
+        self.duplicates = list(self.iter_duplicates_optimized(directory, progress_callback, stop_event))
+        return self.duplicates
+    
+    def iter_duplicates_optimized(self, directory: str, progress_callback=None,
+                                  stop_event: Optional[threading.Event] = None) -> Iterator[List[FileInfo]]:
+        """Produit les groupes de doublons au fil du scan, sans matérialiser la liste complète.
+        
+        stop_event, s'il est positionné, interrompt le scan: le parcours (avant chaque
+        répertoire), le stat (entre deux lots) et le hash (avant chaque bloc ou fichier) s'arrêtent
+        et aucun groupe n'est produit (les hash déjà calculés restent enregistrés).
+        """
         self.files_by_size.clear()
-        self.duplicates.clear()
         
-        print(f"🚀 Scan optimisé M1 - Utilisation de {self.max_workers} workers")
+        _log.info(f"🚀 Scan optimisé M1 - Utilisation de {self.max_workers} workers")
         
         # Phase 1: Collecte rapide des fichiers avec parallélisation
         start_time = time.time()
-        all_files = []
-        
-        def collect_files_worker(root_path: Path) -> List[FileInfo]:
-            """Worker pour collecter les fichiers dans un thread"""
-            files = []
-            try:
-                for file_path in root_path.rglob('*'):
-                    if file_path.is_file():
-                        try:
-                            file_info = FileInfo(str(file_path), 0)
-                            if file_info.size > 0:  # Ignorer les fichiers vides
-                                files.append(file_info)
-                        except (OSError, IOError):
-                            continue
-            except (OSError, PermissionError):
-                pass
-            return files
+        self.file_batch = FileBatch()
         
-        # Diviser le travail par sous-répertoires pour paralléliser
-        root_path = Path(directory)
-        subdirs = [root_path]
+        def build_batch(entries) -> FileBatch:
+            """Stat d'un lot d'entrées, rangé en colonnes (aucun FileInfo, aucun classement)"""
+            batch = FileBatch()
+            for entry in entries:
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                except (OSError, IOError):
+                    continue
+                if st.st_size > 0:  # Ignorer les fichiers vides
+                    batch.append_stat(entry.path, st)
+            return batch
         
-        # Ajouter les sous-répertoires de premier niveau pour paralléliser
-        try:
-            for item in root_path.iterdir():
-                if item.is_dir() and not item.name.startswith('.'):
-                    subdirs.append(item)
-        except (OSError, PermissionError):
-            pass
+        # Parcours par quelques threads partageant une file de répertoires (équilibrage
+        # automatique quelle que soit la taille des sous-arbres)
+        entries = _walk_files_parallel(directory, self.walk_workers, stop_event=stop_event)
+        if stop_event is not None and stop_event.is_set():
+            return
         
-        # Traitement parallèle de la collecte
+        # Stat des fichiers par lots sur le pool complet
         with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_dir = {executor.submit(collect_files_worker, subdir): subdir for subdir in subdirs}
+            futures = [executor.submit(build_batch, batch) for batch in _batches(entries)]
             
-            for future in concurrent.futures.as_completed(future_to_dir):
+            for future in concurrent.futures.as_completed(futures):
+                if stop_event is not None and stop_event.is_set():
+                    for pending in futures:
+                        pending.cancel()
+                    return
                 try:
-                    files = future.result()
-                    all_files.extend(files)
+                    self.file_batch.extend(future.result())
                     
-                    if progress_callback and len(all_files) % 1000 == 0:
-                        progress_callback(len(all_files), 0)
+                    if progress_callback and len(self.file_batch) % 1000 == 0:
+                        progress_callback(len(self.file_batch), 0)
                         
                 except Exception:
                     continue
         
-        print(f"📁 {len(all_files)} fichiers collectés en {time.time() - start_time:.2f}s")
+        _log.info(f"📁 {len(self.file_batch)} fichiers collectés en {time.time() - start_time:.2f}s")
+        
+        # Phase 2: Groupement par taille sur la colonne des tailles (tri des index + une passe);
+        # les FileInfo ne sont construits que pour les tailles partagées par plusieurs fichiers
+        batch = self.file_batch
+        for size, indices in batch.group_indices_by_size(min_count=2).items():
+            self.files_by_size[size] = [FileInfo.from_batch(batch, i) for i in indices]
         
-        # Phase 2: Groupement par taille (optimisé)
-        for file_info in all_files:
-            size = file_info.size
-            if size not in self.files_by_size:
-                self.files_by_size[size] = []
-            self.files_by_size[size].append(file_info)
+        if stop_event is not None and stop_event.is_set():
+            return
         
         # Phase 3: Calcul des hash en parallèle pour les candidats doublons
-        candidate_groups = [files for files in self.files_by_size.values() if len(files) > 1]
+        candidate_groups = list(self.files_by_size.values())
         total_candidates = sum(len(group) for group in candidate_groups)
         
-        print(f"🔍 {total_candidates} fichiers candidats à analyser en {len(candidate_groups)} groupes")
+        _log.info(f"🔍 {total_candidates} fichiers candidats à analyser en {len(candidate_groups)} groupes")
         
-        processed = 0
-        for group in candidate_groups:
-            # Calculer les hash en parallèle pour ce groupe
-            file_paths = [f.path for f in group]
-            hash_results = self.calculate_md5_batch(file_paths)
-            
-            # Assigner les hash aux FileInfo
-            for file_info in group:
-                if file_info.path in hash_results:
-                    file_info.hash_md5 = hash_results[file_info.path]
+        # Pré-filtre: seuls les fichiers dont le début et la fin coïncident sont hachés
+        sub_groups = self.split_groups_by_fingerprint(candidate_groups)
+        if stop_event is not None and stop_event.is_set():
+            return
+        
+        # Hash déjà connus (cache mémoire, puis base persistante): seuls les fichiers nouveaux ou
+        # modifiés sont lus. Clés issues du stat du parcours, relevé avant toute lecture; les liens
+        # symboliques (contenu de la cible, stat du lien) ne sont pas mis en cache
+        hash_results: Dict[str, str] = {}
+        file_keys: Dict[str, FileKey] = {}
+        for sub_group in sub_groups:
+            for f in sub_group:
+                if f.file_type == "symlink" or f.mtime_ns is None:
+                    continue
+                key = (f.device_id or 0, f.inode or 0, f.size, f.mtime_ns)
+                digest = self._memory_lookup(key)
+                if digest:
+                    hash_results[f.path] = digest
+                else:
+                    file_keys[f.path] = key
+        if self.hash_db is not None:
+            for path, digest in self.hash_db.lookup_many(file_keys, self.hash_algorithm).items():
+                hash_results[path] = digest
+                self._memory_store(file_keys[path], digest)
+        
+        # Gros fichiers en petits groupes: hash bloc par bloc de tout le groupe (abandon précoce)
+        lockstep_groups = []
+        file_paths = []
+        for sub_group in sub_groups:
+            missing = [f for f in sub_group if f.path not in hash_results]
+            if not missing:
+                continue
+            if (len(missing) == len(sub_group) and sub_group[0].size >= LOCKSTEP_MIN_SIZE
+                    and len(sub_group) <= LOCKSTEP_MAX_LANES):
+                lockstep_groups.append(sub_group)
+            else:
+                file_paths.extend(f.path for f in missing)
+        processed = total_candidates - len(file_paths) - sum(map(len, lockstep_groups))
+        
+        def hash_progress(done: int, total: int):
+            # Les candidats écartés par l'empreinte comptent comme déjà traités
+            progress_callback(processed + done, total_candidates)
+        
+        # Nouveaux hash enregistrés au fil du hash, sous la clé relevée avant la lecture: la base
+        # reçoit une transaction par lot de HASH_DB_FLUSH_SIZE, le reste même si le scan échoue
+        unsaved: List[Tuple[FileKey, str]] = []
+        
+        def store_hash(path: str, digest: str):
+            key = file_keys.get(path)
+            if key is None:
+                return
+            self._memory_store(key, digest)
+            if self.hash_db is not None:
+                unsaved.append((key, digest))
+                if len(unsaved) >= HASH_DB_FLUSH_SIZE:
+                    self.hash_db.store_many(unsaved, self.hash_algorithm)
+                    unsaved.clear()
+        
+        try:
+            computed = self.hash_groups_lockstep(lockstep_groups, hash_progress if progress_callback else None,
+                                                 store_hash, stop_event)
+            processed += sum(map(len, lockstep_groups))
             
-            # Grouper par hash
+            # Un seul lot de hash pour tous les autres sous-groupes: un seul pool de workers
+            if stop_event is None or not stop_event.is_set():
+                computed.update(self.calculate_md5_batch(file_paths, hash_progress if progress_callback else None,
+                                                          store_hash, stop_event))
+        finally:
+            if unsaved:
+                self.hash_db.store_many(unsaved, self.hash_algorithm)
+        if stop_event is not None and stop_event.is_set():
+            return  # Hash incomplets: groupes non fiables
+        hash_results.update(computed)
+        
+        group_count = 0
+        for sub_group in sub_groups:
+            # Assigner les hash aux FileInfo et grouper par hash
             files_by_hash: Dict[str, List[FileInfo]] = {}
-            for file_info in group:
-                if file_info.hash_md5:
-                    hash_key = file_info.hash_md5
-                    if hash_key not in files_by_hash:
-                        files_by_hash[hash_key] = []
-                    files_by_hash[hash_key].append(file_info)
+            for file_info in sub_group:
+                hash_md5 = hash_results.get(file_info.path)
+                if hash_md5:
+                    file_info.hash_md5 = hash_md5
+                    files_by_hash.setdefault(hash_md5, []).append(file_info)
             
-            # Ajouter les groupes de doublons
+            # Ajouter les groupes de doublons (type et supprimabilité déterminés seulement ici)
             for hash_files in files_by_hash.values():
                 if len(hash_files) > 1:
-                    self.duplicates.append(hash_files)
-            
-            processed += len(group)
-            if progress_callback:
-                progress_callback(processed, total_candidates)
+                    for file_info in hash_files:
+                        file_info._finalize()
+                    group_count += 1
+                    yield hash_files
         
-        scan_time = time.time() - start_time
-        print(f"✅ Scan terminé en {scan_time:.2f}s - {len(self.duplicates)} groupes de doublons trouvés")
+        if progress_callback and not file_paths and not lockstep_groups:
+            progress_callback(total_candidates, total_candidates)
         
-        return self.duplicates
+        scan_time = time.time() - start_time
+        _log.info(f"✅ Scan terminé en {scan_time:.2f}s - {group_count} groupes de doublons trouvés")
 
 
 # Garde la classe originale pour compatibilité
 class DuplicateFinder(M1OptimizedDuplicateFinder):
     """Alias pour compatibilité - utilise automatiquement la version optimisée M1"""
-    def __init__(self):
-        super().__init__()
+    def __init__(self, hash_db: Optional[HashDatabase] = None, max_workers: Optional[int] = None):
+        super().__init__(max_workers=max_workers, hash_db=hash_db)
     
     def calculate_md5(self, file_path: str) -> str:
         """Méthode de compatibilité"""
         return self.calculate_md5_optimized(file_path)
     
-    def scan_directory(self, directory: str, progress_callback=None) -> List[List[FileInfo]]:
+    def scan_directory(self, directory: str, progress_callback=None,
+                       stop_event: Optional[threading.Event] = None) -> List[List[FileInfo]]:
         """Méthode de compatibilité - utilise la version optimisée"""
-        return self.scan_directory_optimized(directory, progress_callback)
+        return self.scan_directory_optimized(directory, progress_callback, stop_event)
 
 
 class M1OptimizedCacheCleaner:
@@ -298,112 +1152,97 @@ class M1OptimizedCacheCleaner:
     def __init__(self):
         # Optimisation M1: plus de workers pour l'I/O
         self.max_workers = min(os.cpu_count() or 8, 20)
-        self.is_apple_silicon = platform.machine() in ('arm64', 'aarch64')
+        self.is_apple_silicon = IS_APPLE_SILICON
         self.cache_directories = self._get_cache_directories()
     
     def _get_cache_directories(self) -> List[str]:
         """Retourne les répertoires de cache selon l'OS - Optimisé M1"""
-        system = platform.system()
-        home = Path.home()
-        cache_dirs = []
+        cache_dirs = _cache_dir_candidates(platform.system(), str(Path.home()))
         
-        if system == "Darwin":  # macOS - Optimisations spéciales M1
-            cache_dirs.extend([
-                str(home / "Library/Caches"),
-                str(home / "Library/Application Support"),
-                "/tmp",
-                "/var/tmp",
-                str(home / "Library/Logs"),
-                str(home / "Library/Safari/LocalStorage"),
-                str(home / "Library/Safari/Databases"),
-                # Caches spécifiques M1/Apple Silicon
-                str(home / "Library/Developer/Xcode/DerivedData"),
-                str(home / "Library/Developer/CoreSimulator/Caches"),
-                str(home / "Library/Caches/com.apple.dt.Xcode"),
-                # Caches Rosetta 2 sur M1
-                "/var/folders",  # Caches temporaires système
-            ])
-        elif system == "Linux":
-            cache_dirs.extend([
-                str(home / ".cache"),
-                "/tmp",
-                "/var/tmp",
-                str(home / ".local/share/Trash"),
-                str(home / ".mozilla/firefox/*/Cache"),
-                str(home / ".config/google-chrome/Default/Cache"),
-            ])
-        elif system == "Windows":
-            cache_dirs.extend([
-                os.path.expandvars(r"%LOCALAPPDATA%\Temp"),
-                os.path.expandvars(r"%TEMP%"),
-                os.path.expandvars(r"%LOCALAPPDATA%\Microsoft\Windows\Temporary Internet Files"),
-                os.path.expandvars(r"%LOCALAPPDATA%\Google\Chrome\User Data\Default\Cache"),
-                os.path.expandvars(r"%APPDATA%\Mozilla\Firefox\Profiles\*\cache2"),
-            ])
-        
-        return [d for d in cache_dirs if os.path.exists(d)]
+        # Développer les motifs (profils Firefox...) et ne garder que les racines existantes
+        # (jamais mis en cache: un répertoire peut apparaître entre deux scans)
+        existing = [match for d in cache_dirs for match in (glob.glob(d) if glob.has_magic(d) else [d])
+                    if os.path.exists(match)]
+        return _independent_roots(existing)
     
-    def _scan_cache_directory_worker(self, cache_dir: str) -> List[FileInfo]:
-        """Worker pour scanner un répertoire de cache en parallèle"""
+    def _build_cache_file_infos(self, entries: List[os.DirEntry]) -> List[FileInfo]:
+        """Construit les FileInfo d'un lot d'entrées (exécuté dans un thread)"""
         cache_files = []
-        try:
-            for file_path in Path(cache_dir).rglob('*'):
-                if file_path.is_file():
-                    try:
-                        file_info = FileInfo(str(file_path), 0)
-                        # Filtrer les fichiers cache récents (< 1 jour) pour macOS M1
-                        if self.is_apple_silicon:
-                            age_hours = (time.time() - file_info.modified_time) / 3600
-                            if age_hours < 24:  # Garde les caches récents
-                                continue
-                        cache_files.append(file_info)
-                    except (OSError, IOError):
-                        continue
-        except (OSError, PermissionError):
-            pass
+        # Filtrer les fichiers cache récents (< 1 jour) pour macOS M1 - test hors de la boucle
+        skip_recent = self.is_apple_silicon
+        recent_cutoff = time.time() - 24 * 3600
+        for entry in entries:
+            try:
+                file_info = FileInfo(entry.path, 0, stat_result=entry.stat(follow_symlinks=False))
+                if skip_recent and file_info.modified_time > recent_cutoff:
+                    continue  # Garde les caches récents
+                cache_files.append(file_info)
+            except (OSError, IOError):
+                continue
         return cache_files
     
-    def scan_cache_files_optimized(self, progress_callback=None) -> List[FileInfo]:
-        """Scanne les fichiers de cache en parallèle - Optimisé M1"""
-        print(f"🧹 Scan cache optimisé M1 - {len(self.cache_directories)} répertoires")
+    async def _scan_cache_directory_async(self, cache_dir: str, semaphore: asyncio.Semaphore,
+                                          stop_event: Optional[threading.Event] = None) -> Tuple[str, List[FileInfo]]:
+        """Scanne un répertoire de cache: parcours puis stat par lots concurrents"""
+        entries = await _walk_files_async(cache_dir, semaphore, stop_event=stop_event)
+        if stop_event is not None and stop_event.is_set():
+            return cache_dir, []
+        results = await asyncio.gather(*(
+            _to_thread(self._build_cache_file_infos, batch) for batch in _batches(entries)
+        ))
+        return cache_dir, list(itertools.chain.from_iterable(results))
+    
+    async def scan_cache_files_async(self, progress_callback=None,
+                                     stop_event: Optional[threading.Event] = None) -> List[FileInfo]:
+        """Scanne les fichiers de cache de manière asynchrone - Optimisé M1 (liste vide si
+        stop_event est positionné pendant le scan)"""
+        _log.info(f"🧹 Scan cache optimisé M1 - {len(self.cache_directories)} répertoires")
         
         all_cache_files = []
+        semaphore = asyncio.Semaphore(self.max_workers)
         
-        # Traitement parallèle des répertoires de cache
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_dir = {
-                executor.submit(self._scan_cache_directory_worker, cache_dir): cache_dir 
-                for cache_dir in self.cache_directories
-            }
+        # Tous les répertoires de cache sont parcourus en parallèle
+        tasks = [self._scan_cache_directory_async(cache_dir, semaphore, stop_event)
+                 for cache_dir in self.cache_directories]
+        
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                cache_dir, cache_files = await next_done
+            except Exception as e:
+                _log.warning(f"⚠️  Erreur pendant le scan du cache: {e}")
+                continue
             
-            for future in concurrent.futures.as_completed(future_to_dir):
-                cache_dir = future_to_dir[future]
-                try:
-                    cache_files = future.result()
-                    all_cache_files.extend(cache_files)
-                    
-                    if progress_callback:
-                        progress_callback(len(all_cache_files))
-                        
-                    print(f"📂 {cache_dir}: {len(cache_files)} fichiers cache")
-                except Exception as e:
-                    print(f"⚠️  Erreur dans {cache_dir}: {e}")
+            all_cache_files.extend(cache_files)
+            
+            if progress_callback:
+                progress_callback(len(all_cache_files))
+            
+            _log.debug(f"📂 {cache_dir}: {len(cache_files)} fichiers cache")
+        
+        if stop_event is not None and stop_event.is_set():
+            return []
         
         # Tri par taille décroissante pour faciliter le nettoyage
         all_cache_files.sort(key=lambda x: x.size, reverse=True)
         
         total_size = sum(f.size for f in all_cache_files)
-        print(f"💾 Total cache: {len(all_cache_files)} fichiers, {total_size / (1024*1024):.1f} MB")
+        _log.info(f"💾 Total cache: {len(all_cache_files)} fichiers, {total_size / (1024*1024):.1f} MB")
         
         return all_cache_files
+    
+    def scan_cache_files_optimized(self, progress_callback=None,
+                                   stop_event: Optional[threading.Event] = None) -> List[FileInfo]:
+        """Scanne les fichiers de cache en parallèle - Optimisé M1"""
+        return asyncio.run(self.scan_cache_files_async(progress_callback, stop_event))
 
 
 # Classe de compatibilité
 class CacheCleaner(M1OptimizedCacheCleaner):
     """Alias pour compatibilité - utilise automatiquement la version optimisée M1"""
-    def scan_cache_files(self, progress_callback=None) -> List[FileInfo]:
+    def scan_cache_files(self, progress_callback=None,
+                         stop_event: Optional[threading.Event] = None) -> List[FileInfo]:
         """Méthode de compatibilité"""
-        return self.scan_cache_files_optimized(progress_callback)
+        return self.scan_cache_files_optimized(progress_callback, stop_event)
 
 
 class OrphanedFilesFinder:
@@ -450,37 +1289,41 @@ class OrphanedFilesFinder:
         system = platform.system()
         
         if system == "Darwin":  # macOS
-            apps_dir = Path("/Applications")
-            if apps_dir.exists():
-                for app in apps_dir.iterdir():
-                    if app.suffix == ".app":
-                        apps.append(app.stem)
+            try:
+                with os.scandir("/Applications") as it:
+                    apps.extend(entry.name[:-len(".app")] for entry in it if entry.name.endswith(".app"))
+            except OSError:
+                pass
         
         # Ajouter d'autres méthodes selon l'OS
         return apps
     
-    def find_orphaned_files(self, progress_callback=None) -> List[FileInfo]:
-        """Trouve les fichiers orphelins"""
+    def find_orphaned_files(self, progress_callback=None,
+                            stop_event: Optional[threading.Event] = None) -> List[FileInfo]:
+        """Trouve les fichiers orphelins (liste vide si stop_event est positionné pendant le scan)"""
         orphaned_files = []
         
         for app_dir in self.application_dirs:
-            try:
-                for file_path in Path(app_dir).rglob('*'):
-                    if file_path.is_file():
-                        # Logique pour déterminer si le fichier est orphelin
-                        # (simplifié pour cet exemple)
-                        file_info = FileInfo(str(file_path), 0)
-                        
-                        # Vérifier si le fichier appartient à une app désinstallée
-                        if self._is_orphaned(file_info):
-                            orphaned_files.append(file_info)
-                        
-                        if progress_callback and len(orphaned_files) % 50 == 0:
-                            progress_callback(len(orphaned_files))
-            
-            except (OSError, PermissionError):
-                continue
+            for entry in _walk_files(app_dir, stop_event=stop_event):
+                # Logique pour déterminer si le fichier est orphelin
+                # (simplifié pour cet exemple)
+                try:
+                    # Stat déjà obtenu par le parcours; type et supprimabilité (os.access) ne sont
+                    # déterminés que pour les fichiers retenus
+                    file_info = FileInfo.from_stat(entry.path, entry.stat(follow_symlinks=False))
+                except (OSError, IOError):
+                    continue
+                
+                # Vérifier si le fichier appartient à une app désinstallée
+                if self._is_orphaned(file_info):
+                    file_info._finalize()
+                    orphaned_files.append(file_info)
+                    
+                    if progress_callback and len(orphaned_files) % 50 == 0:
+                        progress_callback(len(orphaned_files))
         
+        if stop_event is not None and stop_event.is_set():
+            return []
         return orphaned_files
     
     def _is_orphaned(self, file_info: FileInfo) -> bool:
@@ -488,25 +1331,31 @@ class OrphanedFilesFinder:
         # Ici on pourrait implémenter une logique plus sophistiquée
         # Pour l'instant, on considère les fichiers de plus de 30 jours 
         # dans certains répertoires comme potentiellement orphelins
-        import time
-        
-        path = Path(file_info.path)
+        path = file_info.path
         current_time = time.time()
         
         # Fichiers de plus de 30 jours dans les logs
-        if "log" in str(path).lower() or "Log" in str(path):
+        if "log" in path.lower():
             return (current_time - file_info.modified_time) > (30 * 24 * 3600)
         
         return False
 
 
+def _exclude_glob(pattern: str) -> str:
+    """Glob scandir-rs (chemins relatifs à la racine) des répertoires dont le chemin contient le
+    motif: '/' initial = début d'un composant, '/' final = suivi d'un sous-répertoire"""
+    head = "" if pattern.startswith("/") else "*"
+    tail = "/*" if pattern.endswith("/") else "*"
+    return f"**/{head}{pattern.strip('/')}{tail}"
+
+
 class M1OptimizedLargeFilesFinder:
     """Chercheur de gros fichiers optimisé pour Apple M1"""
     
     def __init__(self, min_size_mb: int = 100):
         self.min_size_bytes = min_size_mb * 1024 * 1024
         self.max_workers = min(os.cpu_count() or 8, 16)
-        self.is_apple_silicon = platform.machine() in ('arm64', 'aarch64')
+        self.is_apple_silicon = IS_APPLE_SILICON
         
         # Optimisation M1: exclusions intelligentes
         self.excluded_dirs = {
@@ -516,98 +1365,143 @@ class M1OptimizedLargeFilesFinder:
             # Génériques
             '/.git', '/node_modules', '__pycache__', '.venv'
         }
-    
-    def _should_skip_directory(self, dir_path: Path) -> bool:
-        """Détermine si un répertoire doit être ignoré - Optimisé M1"""
-        dir_str = str(dir_path)
         
-        # Exclusions spéciales pour M1/macOS
+        # Tous les motifs en une seule expression: une recherche en C par répertoire
+        patterns = set(self.excluded_dirs)
         if self.is_apple_silicon:
-            if any(exclude in dir_str for exclude in [
-                '/System/', '/Library/Developer/', '/private/var/vm/',
-                'com.apple.', '.Spotlight-V100', '.fseventsd'
-            ]):
-                return True
-        
-        # Exclusions générales
-        return any(exclude in dir_str for exclude in self.excluded_dirs)
+            # Exclusions spéciales pour M1/macOS
+            patterns.update(['/System/', '/Library/Developer/', '/private/var/vm/',
+                             'com.apple.', '.Spotlight-V100', '.fseventsd'])
+        self._skip_re = re.compile('|'.join(map(re.escape, sorted(patterns, key=len, reverse=True))))
+        # Mêmes motifs en globs pour scandir-rs, qui élague pendant le parcours: chaque glob ne
+        # retient que des chemins contenant le motif (jamais plus que _skip_re)
+        self._exclude_globs = sorted(_exclude_glob(pattern) for pattern in patterns)
     
-    def _scan_directory_worker(self, directory: Path) -> List[FileInfo]:
-        """Worker pour scanner un répertoire en parallèle"""
+    def _should_skip_directory(self, dir_path: str) -> bool:
+        """Détermine si un répertoire doit être ignoré - Optimisé M1"""
+        return self._skip_re.search(os.fspath(dir_path)) is not None  # Chaîne telle quelle, Path accepté
+    
+    def _skip_below(self, root: str):
+        """Filtre des sous-répertoires de root, appliqué au chemin relatif à root ('/' initial
+        gardé): une racine choisie dans un arbre exclu (.venv, node_modules...) est parcourue
+        de la même façon par les trois parcours"""
+        offset = len(root.rstrip(os.sep))
+        return lambda dir_path: self._should_skip_directory(dir_path[offset:])
+    
+    def _build_large_file_infos(self, entries: List[os.DirEntry]) -> List[FileInfo]:
+        """Filtre un lot d'entrées sur la taille (exécuté dans un thread)"""
         large_files = []
-        
-        try:
-            for file_path in directory.rglob('*'):
-                if file_path.is_file():
+        for entry in entries:
+            try:
+                # Vérification rapide de la taille sans FileInfo complet
+                # (stat du lien lui-même: un lien vers un gros fichier n'est pas compté deux fois)
+                stat_result = entry.stat(follow_symlinks=False)
+                if stat_result.st_size >= self.min_size_bytes:
+                    large_files.append(FileInfo.from_stat(entry.path, stat_result))
+            except (OSError, IOError):
+                continue
+        return large_files
+    
+    def _find_large_files_scandir_rs(self, directory: str,
+                                     stop_event: Optional[threading.Event] = None) -> List[FileInfo]:
+        """Parcours et stat côté Rust (scandir-rs): seuls les gros fichiers remontent en Python"""
+        large_files = []
+        # Répertoires exclus élagués par scandir-rs (globs relatifs à la racine); le même filtre
+        # que les autres parcours reste sur le répertoire relatif, pour un résultat identique
+        scandir = Scandir(directory, skip_hidden=False, return_type=ReturnType.Ext,
+                          dir_exclude=self._exclude_globs, case_sensitive=True)
+        for entry in scandir:
+            if stop_event is not None and stop_event.is_set():
+                scandir.stop()  # Arrête aussi le parcours côté Rust
+                return []
+            if entry.is_file and entry.st_size >= self.min_size_bytes:
+                file_path = os.path.join(directory, entry.path)
+                if not self._should_skip_directory(os.sep + os.path.dirname(entry.path)):
+                    # Un seul lstat: type par extension et supprimabilité déduits du stat
+                    # (FileInfo(path, size) refaisait islink + exists + stat)
                     try:
-                        # Vérification rapide de la taille sans FileInfo complet
-                        size = file_path.stat().st_size
-                        if size >= self.min_size_bytes:
-                            file_info = FileInfo(str(file_path), size)
-                            large_files.append(file_info)
-                    except (OSError, IOError):
+                        stat_result = os.lstat(file_path)
+                    except OSError:
                         continue
-                elif file_path.is_dir() and self._should_skip_directory(file_path):
-                    continue
-        except (OSError, PermissionError):
-            pass
-        
+                    large_files.append(FileInfo(file_path, 0, stat_result=stat_result))
         return large_files
     
-    def find_large_files_optimized(self, directory: str, progress_callback=None) -> List[FileInfo]:
-        """Trouve les gros fichiers en parallèle - Optimisé M1"""
-        print(f"🔍 Recherche gros fichiers optimisée M1 (≥{self.min_size_bytes/(1024*1024):.0f}MB)")
+    async def find_large_files_async(self, directory: str, progress_callback=None,
+                                     stop_event: Optional[threading.Event] = None) -> List[FileInfo]:
+        """Trouve les gros fichiers de manière asynchrone - Optimisé M1 (liste vide si stop_event
+        est positionné pendant le scan)"""
+        _log.info(f"🔍 Recherche gros fichiers optimisée M1 (≥{self.min_size_bytes/(1024*1024):.0f}MB)")
+        
+        semaphore = asyncio.Semaphore(self.max_workers)
+        skip_dir = self._skip_below(directory)
+        
+        if _darwin_walk.AVAILABLE:
+            # macOS: getattrlistbulk renvoie les entrées avec leur stat, le filtre ne fait aucun appel système
+            entries = await _walk_files_async(directory, semaphore, skip_dir, stop_event=stop_event)
+            if stop_event is not None and stop_event.is_set():
+                return []
+            all_large_files = await _to_thread(self._build_large_file_infos, entries)
+            if progress_callback:
+                progress_callback(len(all_large_files))
+            return self._sort_and_report(all_large_files)
+        
+        if Scandir is not None:
+            all_large_files = await _to_thread(self._find_large_files_scandir_rs, directory, stop_event)
+            if stop_event is not None and stop_event.is_set():
+                return []
+            if progress_callback:
+                progress_callback(len(all_large_files))
+            return self._sort_and_report(all_large_files)
         
-        root_path = Path(directory)
         all_large_files = []
         
-        # Découper le travail par sous-répertoires pour paralléliser
-        subdirs = [root_path]
+        # Parcours concurrent de l'arborescence, les répertoires exclus ne sont pas visités
+        entries = await _walk_files_async(directory, semaphore, skip_dir, stop_event=stop_event)
+        if stop_event is not None and stop_event.is_set():
+            return []
         
-        try:
-            # Ajouter les sous-répertoires de premier niveau
-            for item in root_path.iterdir():
-                if item.is_dir() and not self._should_skip_directory(item):
-                    subdirs.append(item)
-        except (OSError, PermissionError):
-            pass
+        _log.debug(f"📁 {len(entries)} fichiers à examiner")
         
-        print(f"📁 Scan de {len(subdirs)} répertoires en parallèle")
+        # Stat des fichiers par lots concurrents
+        tasks = [_to_thread(self._build_large_file_infos, batch) for batch in _batches(entries)]
         
-        # Traitement parallèle
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_dir = {
-                executor.submit(self._scan_directory_worker, subdir): subdir 
-                for subdir in subdirs
-            }
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                large_files = await next_done
+            except Exception as e:
+                _log.warning(f"⚠️  Erreur pendant le scan de {directory}: {e}")
+                continue
             
-            for future in concurrent.futures.as_completed(future_to_dir):
-                subdir = future_to_dir[future]
-                try:
-                    large_files = future.result()
-                    all_large_files.extend(large_files)
-                    
-                    if progress_callback:
-                        progress_callback(len(all_large_files))
-                    
-                    if large_files:
-                        print(f"📂 {subdir}: {len(large_files)} gros fichiers")
-                        
-                except Exception as e:
-                    print(f"⚠️  Erreur dans {subdir}: {e}")
+            all_large_files.extend(large_files)
+            
+            if progress_callback:
+                progress_callback(len(all_large_files))
         
-        # Tri par taille décroissante avec optimisation M1
+        if stop_event is not None and stop_event.is_set():
+            return []
+        return self._sort_and_report(all_large_files)
+    
+    def _sort_and_report(self, all_large_files: List[FileInfo]) -> List[FileInfo]:
+        """Tri par taille décroissante et résumé du scan"""
         all_large_files.sort(key=lambda x: x.size, reverse=True)
+        for file_info in all_large_files:
+            file_info._finalize()  # Type et supprimabilité des seuls fichiers retenus
         
         total_size = sum(f.size for f in all_large_files)
-        print(f"💾 {len(all_large_files)} gros fichiers trouvés, {total_size/(1024**3):.2f} GB total")
+        _log.info(f"💾 {len(all_large_files)} gros fichiers trouvés, {total_size/(1024**3):.2f} GB total")
         
         return all_large_files
+    
+    def find_large_files_optimized(self, directory: str, progress_callback=None,
+                                   stop_event: Optional[threading.Event] = None) -> List[FileInfo]:
+        """Trouve les gros fichiers en parallèle - Optimisé M1"""
+        return asyncio.run(self.find_large_files_async(directory, progress_callback, stop_event))
 
 
 # Classe de compatibilité
 class LargeFilesFinder(M1OptimizedLargeFilesFinder):
     """Alias pour compatibilité - utilise automatiquement la version optimisée M1"""
-    def find_large_files(self, directory: str, progress_callback=None) -> List[FileInfo]:
+    def find_large_files(self, directory: str, progress_callback=None,
+                         stop_event: Optional[threading.Event] = None) -> List[FileInfo]:
         """Méthode de compatibilité"""
-        return self.find_large_files_optimized(directory, progress_callback)
+        return self.find_large_files_optimized(directory, progress_callback, stop_event)
@@ -0,0 +1,118 @@
+"""
+Base persistante des hash de contenu (SQLite)
+Un fichier inchangé (même périphérique, inode, taille et mtime) n'est jamais relu d'un scan à l'autre
+"""
+
+import os
+import secrets
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+# (périphérique, inode, taille, mtime en nanosecondes)
+FileKey = Tuple[int, int, int, int]
+
+DEFAULT_HASH_DB_PATH = str(Path.home() / ".cache" / "macclean" / "hashdb.sqlite")
+
+# Clés cherchées par requête dans lookup_many (2 paramètres chacune, sous la limite de 999
+# paramètres des anciennes versions de SQLite)
+LOOKUP_BATCH_SIZE = 400
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS hashes (
+    dev INTEGER NOT NULL,
+    ino INTEGER NOT NULL,
+    algorithm TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    digest TEXT NOT NULL,
+    PRIMARY KEY (dev, ino, algorithm)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+def file_key(file_path: str) -> Optional[FileKey]:
+    """Clé de cache d'un fichier, None s'il est inaccessible"""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+class HashDatabase:
+    """Cache des hash sur disque, partageable entre les threads de hash"""
+
+    def __init__(self, path: str = DEFAULT_HASH_DB_PATH):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        # WAL: lectures sans blocage pendant les écritures, fsync seulement aux checkpoints
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+        # Graine de hash tirée à la création de la base et conservée avec les hash
+        self._conn.execute("INSERT OR IGNORE INTO meta VALUES ('seed', ?)", (secrets.randbits(63),))
+        self._conn.commit()
+        self.seed: int = self._conn.execute("SELECT value FROM meta WHERE key='seed'").fetchone()[0]
+
+    def lookup(self, key: FileKey, algorithm: str) -> Optional[str]:
+        """Hash enregistré pour cette clé, None si absent ou périmé"""
+        dev, ino, size, mtime_ns = key
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT digest FROM hashes WHERE dev=? AND ino=? AND algorithm=? AND size=? AND mtime_ns=?",
+                (dev, ino, algorithm, size, mtime_ns),
+            ).fetchone()
+        return row[0] if row else None
+
+    def lookup_many(self, keys: Dict[str, FileKey], algorithm: str) -> Dict[str, str]:
+        """Hash enregistrés pour plusieurs fichiers {chemin: clé} - seulement les présents.
+
+        Une requête par lot de LOOKUP_BATCH_SIZE clés (au lieu d'une par fichier): un nouveau
+        scan d'une arborescence inchangée ne coûte que quelques allers-retours SQLite.
+        """
+        # (périphérique, inode) -> chemins (liens physiques) et clé relevée au parcours
+        paths_by_id: Dict[Tuple[int, int], list] = {}
+        for path, key in keys.items():
+            paths_by_id.setdefault((key[0], key[1]), []).append((path, key))
+
+        results = {}
+        ids = list(paths_by_id)
+        with self._lock:
+            for start in range(0, len(ids), LOOKUP_BATCH_SIZE):
+                batch = ids[start:start + LOOKUP_BATCH_SIZE]
+                rows = self._conn.execute(
+                    "SELECT dev, ino, size, mtime_ns, digest FROM hashes WHERE algorithm=? AND "
+                    f"(dev, ino) IN (VALUES {', '.join(['(?, ?)'] * len(batch))})",
+                    (algorithm, *(value for file_id in batch for value in file_id)),
+                ).fetchall()
+                for dev, ino, size, mtime_ns, digest in rows:
+                    for path, key in paths_by_id[(dev, ino)]:
+                        if key[2] == size and key[3] == mtime_ns:  # Sinon périmé
+                            results[path] = digest
+        return results
+
+    def store_many(self, entries: Iterable[Tuple[FileKey, str]], algorithm: str):
+        """Enregistre des hash en une seule transaction (clés relevées avant la lecture)"""
+        rows = [(dev, ino, algorithm, size, mtime_ns, digest)
+                for (dev, ino, size, mtime_ns), digest in entries]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?, ?, ?)", rows)
+            self._conn.commit()
+
+    def close(self):
+        """Ferme la base"""
+        with self._lock:
+            self._conn.close()
@@ -4,75 +4,116 @@ Fenêtre principale de l'application MacClean
 
 import sys
 import os
+import time
+import functools
+import itertools
+import logging
+import threading
+from collections import Counter, OrderedDict
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Set
 
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QTabWidget, QLabel, QPushButton, QTableWidget, 
-    QTableWidgetItem, QCheckBox, QProgressBar, 
+    QTabWidget, QLabel, QPushButton, QTableView, 
+    QProgressBar, 
     QFileDialog, QMessageBox, QHeaderView, QGroupBox,
-    QSpinBox, QComboBox, QTextEdit, QSplitter,
+    QSpinBox, QComboBox, QTextEdit, QDockWidget,
     QStatusBar, QMenuBar, QMenu, QToolBar, QFrame,
-    QScrollArea
+    QScrollArea, QStyledItemDelegate, QStyle, QStyleOptionButton, QApplication,
+    QSystemTrayIcon
 )
 from PySide6.QtCore import (
-    Qt, QThread, QObject, Signal, QTimer, QSettings
+    Qt, QObject, QRunnable, QThread, QThreadPool, Signal, Slot, QTimer, QSettings,
+    QAbstractTableModel, QModelIndex, QEvent, QRect
 )
 from PySide6.QtGui import (
-    QAction, QIcon, QFont, QPalette, QPixmap
+    QAction, QColor, QIcon, QImage, QPalette, QPixmap
 )
 
 from macclean.core import (
     DuplicateFinder, CacheCleaner, OrphanedFilesFinder, 
-    LargeFilesFinder, FileInfo
+    LargeFilesFinder, FileInfo, FileBatch, HashDatabase
 )
+from macclean.core.batch import FLAG_REMOVABLE, FLAG_UNCLASSIFIED, flags_file_type, flags_is_removable
 from macclean.utils import (
-    format_file_size, safe_delete_file, export_to_json,
+    format_file_size, safe_delete_files, safe_verify_duplicate_group, export_to_json_stream,
     export_to_csv, export_to_txt, get_system_info,
     get_file_type, is_removable_file
 )
 
+_log = logging.getLogger(__name__)
 
-class ScanWorker(QObject):
-    """Worker thread pour les opérations de scan"""
+
+class ScanSignals(QObject):
+    """Signaux d'un scan (un QRunnable n'étant pas un QObject, il ne peut pas en porter)"""
+    
+    progress = Signal(int, int)      # current, total
+    finished = Signal(str, object, object)  # scan_type, FileBatch, hashes (par ligne)
+    error = Signal(str, str)         # scan_type, error message
+
+
+class ScanWorker(QRunnable):
+    """Tâche de scan exécutée dans le pool de threads de l'application"""
     
-    progress = Signal(int, int)  # current, total
-    finished = Signal(object)    # results
-    error = Signal(str)         # error message
+    # Intervalle minimal entre deux signaux de progression (~30 Hz, ce que la barre peut afficher)
+    PROGRESS_INTERVAL = 1 / 30
     
     def __init__(self, scan_type: str, parameters: dict):
         super().__init__()
+        # Durée de vie gérée côté Python (référence gardée par l'application jusqu'à la fin du scan)
+        self.setAutoDelete(False)
+        self.signals = ScanSignals()
         self.scan_type = scan_type
         self.parameters = parameters
-        self.should_stop = False
+        self._stop_event = threading.Event()
+        self._last_emit = 0.0
+        self._pending_progress = None
+        
+        # Callbacks passés directement aux scanners: pas de méthode intermédiaire par appel
+        self._progress_callback = self._emit_progress
+        self._cache_progress_callback = functools.partial(self._emit_progress, total=0)
+        self._orphan_progress_callback = self._cache_progress_callback
+        self._large_progress_callback = self._cache_progress_callback
+    
+    @property
+    def should_stop(self) -> bool:
+        """Indique si l'arrêt du scan a été demandé"""
+        return self._stop_event.is_set()
     
     def run(self):
         """Exécute le scan"""
         try:
-            results = []
+            results: List[FileInfo] = []
             
             if self.scan_type == "duplicates":
-                finder = DuplicateFinder()
-                directory = self.parameters.get("directory", str(Path.home()))
-                duplicates = finder.scan_directory(
-                    directory, 
-                    progress_callback=self._progress_callback
-                )
+                # Base de hash persistante: les fichiers inchangés ne sont pas relus
+                hash_db = HashDatabase()
+                try:
+                    finder = DuplicateFinder(hash_db=hash_db)
+                    directory = self.parameters.get("directory", str(Path.home()))
+                    duplicates = finder.scan_directory(
+                        directory, 
+                        progress_callback=self._progress_callback,
+                        stop_event=self._stop_event
+                    )
+                finally:
+                    hash_db.close()
                 # Aplatir la liste des groupes de doublons
-                for group in duplicates:
-                    results.extend(group)
+                results = list(itertools.chain.from_iterable(duplicates))
             
             elif self.scan_type == "cache":
                 cleaner = CacheCleaner()
                 results = cleaner.scan_cache_files(
-                    progress_callback=self._cache_progress_callback
+                    progress_callback=self._cache_progress_callback,
+                    stop_event=self._stop_event
                 )
             
             elif self.scan_type == "orphans":
                 finder = OrphanedFilesFinder()
                 results = finder.find_orphaned_files(
-                    progress_callback=self._orphan_progress_callback
+                    progress_callback=self._orphan_progress_callback,
+                    stop_event=self._stop_event
                 )
             
             elif self.scan_type == "large":
@@ -82,58 +123,566 @@ class ScanWorker(QObject):
                 directory = self.parameters.get("directory", str(Path.home()))
                 results = finder.find_large_files(
                     directory,
-                    progress_callback=self._large_progress_callback
+                    progress_callback=self._large_progress_callback,
+                    stop_event=self._stop_event
                 )
             
-            self.finished.emit(results)
+            if self._stop_event.is_set():
+                results = []  # Scan annulé: l'application garde les résultats précédents
+            
+            # Colonnes construites ici, hors du thread GUI: le modèle les reprend sans copie
+            batch = FileBatch.from_file_infos(results)
+            hashes = [file_info.hash_md5 for file_info in results]
+            self._flush_progress()
+            self.signals.finished.emit(self.scan_type, batch, hashes)
         
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(self.scan_type, str(e))
+    
+    def _emit_progress(self, current: int, total: int):
+        """Émet la progression au plus ~30 fois par seconde (chaque émission traverse la boucle
+        d'événements du thread GUI) - la dernière valeur retenue est émise en fin de scan"""
+        if self._stop_event.is_set():
+            return
+        now = time.monotonic()
+        if now - self._last_emit < self.PROGRESS_INTERVAL and current != total:
+            self._pending_progress = (current, total)
+            return
+        self._last_emit = now
+        self._pending_progress = None
+        self.signals.progress.emit(current, total)
     
-    def _progress_callback(self, current: int, total: int):
-        """Callback pour le progrès des doublons"""
-        if not self.should_stop:
-            self.progress.emit(current, total)
+    def _flush_progress(self):
+        """Émet la dernière progression retenue par la limitation de fréquence"""
+        if self._pending_progress is not None and not self._stop_event.is_set():
+            self.signals.progress.emit(*self._pending_progress)
+        self._pending_progress = None
     
-    def _cache_progress_callback(self, count: int):
-        """Callback pour le progrès du cache"""
-        if not self.should_stop:
-            self.progress.emit(count, 0)
+    def stop(self):
+        """Arrête le scan"""
+        self._stop_event.set()
+
+
+class DeleteSignals(QObject):
+    """Signaux d'une suppression par lot"""
+    
+    progress = Signal(int, int)     # fichiers traités, total
+    finished = Signal(str, object)  # scan_type, succès par fichier (dans l'ordre des chemins)
+
+
+class DeleteWorker(QRunnable):
+    """Supprime une liste de fichiers hors du thread GUI, par lots de chemins en parallèle"""
+    
+    # Au-delà, les suppressions se sérialisent sur les métadonnées du volume
+    MAX_WORKERS = 4
+    
+    def __init__(self, scan_type: str, rows: List[int], paths: List[str],
+                 references: Optional[List[Optional[str]]] = None):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.signals = DeleteSignals()
+        self.scan_type = scan_type
+        self.rows = rows
+        self.paths = paths
+        # Copie conservée de chaque fichier (doublons): supprimé seulement s'il lui est identique
+        self.references = references
+        self.started_at = time.monotonic()
+        self._last_emit = 0.0
     
-    def _orphan_progress_callback(self, count: int):
-        """Callback pour le progrès des orphelins"""
-        if not self.should_stop:
-            self.progress.emit(count, 0)
+    def run(self):
+        """Supprime les fichiers puis émet un seul signal de fin"""
+        verified = self._verify() if self.references is not None else [True] * len(self.paths)
+        deleted = iter(safe_delete_files(list(itertools.compress(self.paths, verified)),
+                                         max_workers=self.MAX_WORKERS,
+                                         progress_callback=self._emit_progress))
+        results = [next(deleted) if ok else False for ok in verified]
+        self.signals.finished.emit(self.scan_type, results)
     
-    def _large_progress_callback(self, count: int):
-        """Callback pour le progrès des gros fichiers"""
-        if not self.should_stop:
-            self.progress.emit(count, 0)
+    def _verify(self) -> List[bool]:
+        """Compare octet par octet chaque doublon à la copie conservée (une collision de hash
+        ne doit jamais faire perdre un fichier); sans copie conservée, rien n'est comparé"""
+        by_reference: Dict[str, List[str]] = {}
+        for path, reference in zip(self.paths, self.references):
+            if reference is not None:
+                by_reference.setdefault(reference, []).append(path)
+        
+        mismatched = set()
+        for reference, paths in by_reference.items():
+            classes = safe_verify_duplicate_group([reference, *paths], max_workers=self.MAX_WORKERS)
+            for other_class in classes[1:]:
+                mismatched.update(other_class)
+        return [path not in mismatched for path in self.paths]
+    
+    def _emit_progress(self, done: int, total: int):
+        """Progression par lot de chemins, au plus ~30 fois par seconde (dernier lot toujours émis)"""
+        now = time.monotonic()
+        if now - self._last_emit < ScanWorker.PROGRESS_INTERVAL and done != total:
+            return
+        self._last_emit = now
+        self.signals.progress.emit(done, total)
+
+
+class ExportSignals(QObject):
+    """Signal de fin d'un export"""
+    
+    finished = Signal(str, bool)  # chemin du fichier, succès
+
+
+class ExportWorker(QRunnable):
+    """Exporte les résultats d'un onglet hors du thread GUI, annulable"""
+    
+    def __init__(self, format_type: str, file_path: str, batch: FileBatch, hashes: List[Optional[str]]):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.signals = ExportSignals()
+        self.format_type = format_type
+        self.file_path = file_path
+        # Copie des colonnes: le modèle peut être modifié (suppression) pendant l'export
+        self.batch = batch.take(range(len(batch)))
+        self.hashes = list(hashes)
+        self._stop_event = threading.Event()
+    
+    @property
+    def cancelled(self) -> bool:
+        """Indique si l'annulation de l'export a été demandée"""
+        return self._stop_event.is_set()
     
     def stop(self):
-        """Arrête le scan"""
-        self.should_stop = True
+        """Annule l'export (le fichier partiel est supprimé)"""
+        self._stop_event.set()
+    
+    def run(self):
+        """Écrit le fichier puis émet un seul signal de fin"""
+        exporter = {"json": export_to_json_stream, "csv": export_to_csv, "txt": export_to_txt}[self.format_type]
+        # Colonnes du lot lues directement, sans FileInfo par ligne; arrêt au lot suivant si annulé
+        # (l'exporteur renvoie alors False et supprime lui-même le fichier partiel)
+        success = exporter(self.batch, self.file_path, hashes=self.hashes, stop_event=self._stop_event)
+        self.signals.finished.emit(self.file_path, success)
+
+
+class PreviewSignals(QObject):
+    """Signal de la tâche de décodage d'un aperçu"""
+    
+    ready = Signal(object, QImage)  # clé (chemin, date), image réduite (nulle si illisible)
+
+
+class PreviewTask(QRunnable):
+    """Décode et réduit une image hors du thread GUI (QImage: QPixmap n'est utilisable que
+    dans le thread GUI)"""
+    
+    WIDTH, HEIGHT = 250, 200
+    
+    def __init__(self, key: tuple, path: str):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.signals = PreviewSignals()
+        self.key = key
+        self.path = path
+    
+    def run(self):
+        image = QImage(self.path)
+        if not image.isNull():
+            image = image.scaled(self.WIDTH, self.HEIGHT, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        self.signals.ready.emit(self.key, image)
 
 
-class FileTableWidget(QTableWidget):
-    """Widget de table personnalisé pour afficher les fichiers"""
+class SystemInfoSignals(QObject):
+    """Signal de la tâche de lecture des informations système"""
+    
+    ready = Signal(object)  # dict de get_system_info()
+
+
+class SystemInfoTask(QRunnable):
+    """Lit les informations système (statfs, sysctl) hors du thread GUI"""
+    
+    def __init__(self):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.signals = SystemInfoSignals()
+    
+    def run(self):
+        self.signals.ready.emit(get_system_info())
+
+
+def _warm_imports():
+    """Charge en arrière-plan ce que le premier scan ou le premier export initialiserait sinon
+    (modules importés à la demande par core et utils, tables mime.types lues au premier appel)"""
+    import mimetypes
+    import platform
+    mimetypes.init()
+    platform.machine()  # uname mis en cache par platform
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_minute(minute: int) -> str:
+    """Date affichée pour une minute depuis l'epoch, mise en cache - clé entière à la minute
+    (précision de l'affichage), beaucoup de fichiers partageant la même minute.
+    time.strftime sur un struct_time évite l'objet datetime intermédiaire (~3x plus rapide)"""
+    return time.strftime("%Y-%m-%d %H:%M", time.localtime(minute * 60))
+
+
+if os.altsep:
+    _basename = os.path.basename  # Windows: deux séparateurs possibles
+else:
+    def _basename(path: str) -> str:
+        """Nom du fichier - un seul rpartition en C, sans la logique de os.path.basename"""
+        return path.rpartition(os.sep)[2]
+
+
+def _row_background(flags: int) -> Optional[QColor]:
+    """Couleur du nom selon le type et la supprimabilité (dans cet ordre de priorité)"""
+    file_type = flags_file_type(flags)
+    if file_type == "symlink":
+        return QColor(Qt.yellow)     # Liens symboliques en jaune
+    if not flags_is_removable(flags):
+        return QColor(Qt.red)        # Non supprimable en rouge
+    if file_type in ("image", "video"):
+        return QColor(173, 216, 230)  # Médias en bleu clair (lightblue)
+    return None
+
+
+# Couleur de fond pour chacune des valeurs de drapeaux possibles (uint8 sur 5 bits):
+# une indexation par ligne au lieu de décoder les drapeaux à chaque repaint
+_ROW_BACKGROUNDS = tuple(_row_background(flags) for flags in range(FLAG_UNCLASSIFIED << 1))
+
+
+class FileTableModel(QAbstractTableModel):
+    """Modèle de table adossé aux colonnes d'un FileBatch (cellules calculées à la demande)"""
+    
+    HEADERS = ["Sélection", "Nom", "Taille", "Type", "Chemin", "Date modif."]
+    
+    # Lignes exposées à la vue par lot (les suivantes arrivent au défilement via fetchMore)
+    FETCH_BATCH_SIZE = 500
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Une colonne par attribut plutôt qu'un FileInfo par ligne: tailles et dates en
+        # tableaux int64, drapeaux type/supprimable en uint8, cases cochées en octets
+        self.batch = FileBatch()
+        self.hashes: List[Optional[str]] = []
+        self.checked = bytearray()
+        # Résumé des lignes cochées, tenu à jour à chaque changement:
+        # [nombre, taille totale, médias, liens symboliques, non supprimables]
+        self.selection_summary = [0, 0, 0, 0, 0]
+        self._sort_keys: Dict[int, list] = {}
+        self._loaded = 0
+    
+    def set_files(self, files: List[FileInfo]):
+        """Remplace les fichiers affichés en une seule réinitialisation du modèle"""
+        self.set_batch(FileBatch.from_file_infos(files), [file_info.hash_md5 for file_info in files])
+    
+    def set_batch(self, batch: FileBatch, hashes: List[Optional[str]],
+                  sort_column: int = -1, order=Qt.AscendingOrder):
+        """Remplace les fichiers affichés par un lot déjà construit (repris tel quel, sans copie).
+        
+        Le tri éventuel est appliqué avant que la vue ne soit prévenue: une seule
+        réinitialisation du modèle, quelle que soit la taille du lot.
+        """
+        self.beginResetModel()
+        self.batch = batch
+        self.hashes = hashes
+        self.checked = bytearray(len(batch))
+        self.selection_summary = [0, 0, 0, 0, 0]
+        self._sort_keys = {}
+        self._apply_sort(sort_column, order)
+        self._loaded = min(self.FETCH_BATCH_SIZE, len(batch))
+        self.endResetModel()
+    
+    def file_count(self) -> int:
+        """Nombre total de fichiers, chargés ou non dans la vue"""
+        return len(self.batch)
+    
+    def file_info(self, row: int) -> FileInfo:
+        """Reconstruit le FileInfo d'une ligne (export, suppression, prévisualisation)"""
+        file_info = FileInfo.from_batch(self.batch, row)
+        file_info.hash_md5 = self.hashes[row]
+        return file_info
+    
+    def checked_rows(self) -> List[int]:
+        """Index des lignes cochées"""
+        return list(itertools.compress(range(len(self.checked)), self.checked))
+    
+    def last_checked_row(self) -> int:
+        """Index de la dernière ligne cochée (-1 si aucune)"""
+        return self.checked.rfind(1)
+    
+    def _tally(self, rows: Optional[List[int]] = None) -> List[int]:
+        """Résumé (voir selection_summary) des lignes données, ou de toutes les lignes.
+        
+        Les drapeaux ne prennent que quelques valeurs: ils sont comptés puis décodés une fois
+        par valeur distincte.
+        """
+        sizes, flags = self.batch.sizes, self.batch.flags
+        if rows is None:
+            count, total_size, flag_counts = len(sizes), sum(sizes), Counter(flags)
+        else:
+            count = len(rows)
+            total_size = sum(map(sizes.__getitem__, rows))
+            flag_counts = Counter(map(flags.__getitem__, rows))
+        
+        media_count = symlink_count = non_removable_count = 0
+        for value, value_count in flag_counts.items():
+            file_type = flags_file_type(value)
+            if file_type in ("image", "video"):
+                media_count += value_count
+            elif file_type == "symlink":
+                symlink_count += value_count
+            if not flags_is_removable(value):
+                non_removable_count += value_count
+        return [count, total_size, media_count, symlink_count, non_removable_count]
+    
+    def _add_to_summary(self, tally: List[int], sign: int):
+        """Ajoute (sign=1) ou retire (sign=-1) un résumé de lignes au résumé de la sélection"""
+        self.selection_summary = [
+            total + sign * value for total, value in zip(self.selection_summary, tally)
+        ]
+    
+    def remove_rows(self, rows: List[int]):
+        """Retire des lignes par plages contiguës, de la fin vers le début (index stables)"""
+        rows = sorted(rows, reverse=True)
+        start = 0
+        while start < len(rows):
+            # Plage contiguë [first, last]
+            end = start + 1
+            while end < len(rows) and rows[end] == rows[end - 1] - 1:
+                end += 1
+            first, last = rows[end - 1], rows[start]
+            start = end
+            
+            # Seules les lignes déjà exposées à la vue sont signalées
+            removed_checked = [row for row in range(first, last + 1) if self.checked[row]]
+            if removed_checked:
+                self._add_to_summary(self._tally(removed_checked), -1)
+            
+            visible_last = min(last, self._loaded - 1)
+            visible = first <= visible_last
+            if visible:
+                self.beginRemoveRows(QModelIndex(), first, visible_last)
+            self.batch.remove_range(first, last + 1)
+            del self.hashes[first:last + 1]
+            del self.checked[first:last + 1]
+            for keys in self._sort_keys.values():
+                del keys[first:last + 1]
+            if visible:
+                self._loaded -= visible_last - first + 1
+                self.endRemoveRows()
+    
+    def set_all_checked(self, checked: bool):
+        """Coche/décoche toutes les lignes avec un seul signal dataChanged"""
+        count = len(self.batch)
+        if self.selection_summary[0] == (count if checked else 0):
+            return  # Déjà toutes dans cet état (ou table vide): aucun signal
+        # Toutes les lignes, chargées ou non, mais le signal ne porte que sur les lignes chargées
+        self.checked = bytearray(b"\x01") * count if checked else bytearray(count)
+        self.selection_summary = self._tally() if checked else [0, 0, 0, 0, 0]
+        self.dataChanged.emit(
+            self.index(0, 0), self.index(self._loaded - 1, 0), [Qt.CheckStateRole]
+        )
+    
+    def sort_keys(self, column: int):
+        """Clés de tri d'une colonne, alignées sur les lignes (None si la colonne ne se trie pas).
+        
+        Tailles et dates sont lues directement dans les tableaux int64; les clés texte sont
+        calculées une seule fois (casefold) puis permutées et réduites avec les lignes.
+        """
+        batch = self.batch
+        if column == 2:
+            return batch.sizes
+        if column == 5:
+            return batch.mtimes_ns
+        keys = self._sort_keys.get(column)
+        if keys is None:
+            if column == 1:
+                keys = [_basename(path).casefold() for path in batch.paths]
+            elif column == 3:
+                keys = [batch.file_type(row) or "file" for row in range(len(batch))]
+            elif column == 4:
+                keys = [path.casefold() for path in batch.paths]
+            else:
+                return None
+            self._sort_keys[column] = keys
+        return keys
+    
+    def sort(self, column: int, order=Qt.AscendingOrder):
+        """Trie les lignes par permutation des colonnes, selon les clés de sort_keys"""
+        if self.sort_keys(column) is None:
+            return
+        self.beginResetModel()
+        self._apply_sort(column, order)
+        self.endResetModel()
+    
+    def _apply_sort(self, column: int, order):
+        """Permute toutes les colonnes selon le tri demandé, sans signal à la vue"""
+        keys = self.sort_keys(column)
+        if keys is None:
+            return
+        
+        permutation = sorted(
+            range(len(self.batch)), key=keys.__getitem__, reverse=order == Qt.DescendingOrder
+        )
+        self.batch = self.batch.take(permutation)
+        self.hashes = list(map(self.hashes.__getitem__, permutation))
+        self.checked = bytearray(map(self.checked.__getitem__, permutation))
+        self._sort_keys = {
+            key_column: list(map(column_keys.__getitem__, permutation))
+            for key_column, column_keys in self._sort_keys.items()
+        }
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._loaded
+    
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self._loaded < len(self.batch)
+    
+    def fetchMore(self, parent=QModelIndex()):
+        count = min(self.FETCH_BATCH_SIZE, len(self.batch) - self._loaded)
+        if parent.isValid() or count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if index.column() == 0:
+            flags |= Qt.ItemIsUserCheckable
+        return flags
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        row, column = index.row(), index.column()
+        batch = self.batch
+        
+        if role == Qt.CheckStateRole:
+            if column == 0:
+                return Qt.Checked if self.checked[row] else Qt.Unchecked
+            return None
+        
+        if role == Qt.DisplayRole:
+            if column == 1:
+                return _basename(batch.paths[row])
+            if column == 2:
+                return format_file_size(batch.sizes[row])
+            if column == 3:
+                type_text = (batch.file_type(row) or "file").upper()
+                if not batch.is_removable(row):
+                    type_text += " ⚠️"
+                return type_text
+            if column == 4:
+                return batch.paths[row]
+            if column == 5:
+                return _format_minute(batch.mtimes_ns[row] // 60_000_000_000)
+            return None
+        
+        if role == Qt.UserRole:
+            keys = self.sort_keys(column)  # Pour le tri
+            return None if keys is None else keys[row]
+        
+        # Colorer le nom selon le type et la supprimabilité
+        if role == Qt.BackgroundRole and column == 1:
+            return _ROW_BACKGROUNDS[batch.flags[row]]
+        
+        return None
+    
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or index.column() != 0 or role != Qt.CheckStateRole:
+            return False
+        row = index.row()
+        checked = Qt.CheckState(value) == Qt.Checked
+        if checked == bool(self.checked[row]):
+            return True  # Aucun changement: ni repaint ni résumé à recalculer
+        self.checked[row] = checked
+        self._add_to_summary(self._tally([row]), 1 if checked else -1)
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
+
+
+class CheckBoxDelegate(QStyledItemDelegate):
+    """Case à cocher dessinée par le style (aucun widget par ligne), basculée d'un clic sur la cellule"""
+    
+    def _indicator_rect(self, option) -> QRect:
+        """Rectangle de la case, centré dans la cellule"""
+        style = option.widget.style() if option.widget else QApplication.style()
+        size = style.subElementRect(QStyle.SE_CheckBoxIndicator, QStyleOptionButton(), option.widget).size()
+        rect = QRect(0, 0, size.width(), size.height())
+        rect.moveCenter(option.rect.center())
+        return rect
+    
+    def paint(self, painter, option, index):
+        style = option.widget.style() if option.widget else QApplication.style()
+        
+        # Fond de la cellule (sélection, couleur alternée) puis la case elle-même
+        style.drawPrimitive(QStyle.PE_PanelItemViewItem, option, painter, option.widget)
+        
+        button = QStyleOptionButton()
+        button.rect = self._indicator_rect(option)
+        button.state = QStyle.State_Enabled
+        button.state |= QStyle.State_On if index.data(Qt.CheckStateRole) == Qt.Checked else QStyle.State_Off
+        style.drawControl(QStyle.CE_CheckBox, button, painter, option.widget)
+    
+    def editorEvent(self, event, model, option, index):
+        event_type = event.type()
+        if event_type == QEvent.MouseButtonRelease:
+            if event.button() != Qt.LeftButton or not option.rect.contains(event.position().toPoint()):
+                return False
+        elif event_type == QEvent.MouseButtonDblClick:
+            return True  # Le double-clic ne bascule pas deux fois
+        elif event_type == QEvent.KeyPress:
+            if event.key() not in (Qt.Key_Space, Qt.Key_Select):
+                return False
+        else:
+            return False
+        
+        checked = index.data(Qt.CheckStateRole) == Qt.Checked
+        return model.setData(index, Qt.Unchecked if checked else Qt.Checked, Qt.CheckStateRole)
+
+
+class FileTableWidget(QTableView):
+    """Vue de table personnalisée pour afficher les fichiers"""
+    
+    # type de scan, count, taille totale, médias, liens symboliques, non supprimables
+    selection_summary_changed = Signal(str, int, object, int, int, int)
+    
+    def __init__(self, parent=None, scan_type: str = ""):
+        super().__init__(parent)
+        self.scan_type = scan_type
+        self.file_model = FileTableModel(self)
+        self.setModel(self.file_model)
+        self.checkbox_delegate = CheckBoxDelegate(self)
+        self.setItemDelegateForColumn(0, self.checkbox_delegate)
         self.setup_table()
-        self.files_data: List[FileInfo] = []
-        self.parent_widget = parent
         
-        # Signal pour la sélection
-        self.itemSelectionChanged.connect(self.on_selection_changed)
+        # Mises à jour de la sélection regroupées: au plus une par tour de boucle d'événements
+        # (un glissé sur les lignes émet selectionChanged à chaque ligne survolée)
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(0)
+        self._selection_timer.timeout.connect(self._do_selection_update)
+        
+        # Le résumé ne dépend que des cases cochées: seul dataChanged du modèle est suivi
+        # (les lignes surlignées n'y changent rien)
+        self.file_model.dataChanged.connect(self.on_data_changed)
+    
+    @property
+    def files_data(self) -> List[FileInfo]:
+        """Fichiers affichés, reconstruits depuis les colonnes du modèle"""
+        model = self.file_model
+        return [model.file_info(row) for row in range(model.file_count())]
     
     def setup_table(self):
         """Configure la table"""
-        self.setColumnCount(6)
-        self.setHorizontalHeaderLabels([
-            "Sélection", "Nom", "Taille", "Type", "Chemin", "Date modif."
-        ])
-        
         header = self.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeToContents)  # Checkbox
         header.setSectionResizeMode(1, QHeaderView.ResizeToContents)  # Nom
@@ -141,130 +690,138 @@ class FileTableWidget(QTableWidget):
         header.setSectionResizeMode(3, QHeaderView.ResizeToContents)  # Type
         header.setSectionResizeMode(4, QHeaderView.Stretch)           # Chemin
         header.setSectionResizeMode(5, QHeaderView.ResizeToContents)  # Date
+        # Largeurs ajustées d'après les seules lignes visibles: par défaut Qt relit jusqu'à
+        # 1000 lignes de chaque colonne à chaque réinitialisation du modèle et à chaque lot chargé
+        header.setResizeContentsPrecision(0)
         
-        self.setSelectionBehavior(QTableWidget.SelectRows)
+        self.setSelectionBehavior(QTableView.SelectRows)
         self.setAlternatingRowColors(True)
+        self.setSortingEnabled(True)
+    
+    def rowCount(self) -> int:
+        """Nombre de lignes affichées"""
+        return self.file_model.rowCount()
+    
+    def columnCount(self) -> int:
+        """Nombre de colonnes"""
+        return self.file_model.columnCount()
     
     def populate_table(self, files: List[FileInfo]):
         """Remplit la table avec les fichiers"""
-        print(f"🔄 populate_table appelée avec {len(files)} fichiers")
-        
-        self.files_data = files
-        self.setRowCount(len(files))
-        
-        for row, file_info in enumerate(files):
-            # Checkbox
-            checkbox = QCheckBox()
-            # Connecter le signal de changement de checkbox
-            checkbox.stateChanged.connect(self.on_checkbox_changed)
-            self.setCellWidget(row, 0, checkbox)
-            
-            # Nom du fichier
-            filename = os.path.basename(file_info.path)
-            name_item = QTableWidgetItem(filename)
-            
-            # Colorer selon le type et la supprimabilité
-            if file_info.file_type == "symlink":
-                name_item.setBackground(Qt.yellow)  # Liens symboliques en jaune
-            elif not file_info.is_removable:
-                name_item.setBackground(Qt.red)     # Non supprimable en rouge
-            elif file_info.file_type in ["image", "video"]:
-                name_item.setBackground(Qt.lightBlue)  # Médias en bleu clair
-            
-            self.setItem(row, 1, name_item)
-            
-            # Taille
-            size_item = QTableWidgetItem(format_file_size(file_info.size))
-            size_item.setData(Qt.UserRole, file_info.size)  # Pour le tri
-            self.setItem(row, 2, size_item)
-            
-            # Type de fichier
-            type_text = file_info.file_type.upper()
-            if not file_info.is_removable:
-                type_text += " ⚠️"
-            type_item = QTableWidgetItem(type_text)
-            self.setItem(row, 3, type_item)
-            
-            # Chemin
-            self.setItem(row, 4, QTableWidgetItem(file_info.path))
-            
-            # Date de modification
-            import datetime
-            date_str = datetime.datetime.fromtimestamp(
-                file_info.modified_time
-            ).strftime("%Y-%m-%d %H:%M")
-            self.setItem(row, 5, QTableWidgetItem(date_str))
-        
-        print(f"✅ Table remplie avec {len(files)} fichiers, {self.rowCount()} lignes")
-        
-        # Déclencher une mise à jour de l'affichage
-        self.update()
-        self.repaint()
+        self.populate_batch(FileBatch.from_file_infos(files), [file_info.hash_md5 for file_info in files])
+    
+    def populate_batch(self, batch: FileBatch, hashes: List[Optional[str]]):
+        """Remplit la table avec un lot en colonnes (résultat d'un ScanWorker)"""
+        # Aucune cellule n'est créée: la vue interroge le modèle pour les lignes visibles,
+        # et seul le premier lot de lignes est exposé avant défilement. Le tri choisi dans
+        # l'en-tête est conservé, appliqué dans la même réinitialisation du modèle.
+        header = self.horizontalHeader()
+        self.file_model.set_batch(batch, hashes, header.sortIndicatorSection(), header.sortIndicatorOrder())
+        _log.debug("Table %s remplie: %d fichiers, %d lignes chargées", self.scan_type, len(batch), self.rowCount())
+    
+    def is_row_checked(self, row: int) -> bool:
+        """Indique si la case de la ligne est cochée"""
+        return bool(self.file_model.checked[row])
     
-    def on_checkbox_changed(self):
-        """Appelé quand une checkbox change d'état"""
-        self.on_selection_changed()
+    @Slot(QModelIndex, QModelIndex, list)
+    def on_data_changed(self, top_left, bottom_right, roles=()):
+        """Appelé quand des cellules changent - seule la colonne des cases est suivie"""
+        if top_left.column() == 0:
+            self.on_selection_changed()
     
+    @Slot()
     def on_selection_changed(self):
-        """Signal émis quand la sélection change"""
-        # Calculer la taille totale sélectionnée
-        total_size = 0
-        selected_count = 0
-        media_count = 0
-        symlink_count = 0
-        non_removable_count = 0
-        
-        for row in range(self.rowCount()):
-            checkbox = self.cellWidget(row, 0)
-            if checkbox and checkbox.isChecked() and row < len(self.files_data):
-                file_info = self.files_data[row]
-                total_size += file_info.size
-                selected_count += 1
-                
-                if file_info.file_type in ["image", "video"]:
-                    media_count += 1
-                elif file_info.file_type == "symlink":
-                    symlink_count += 1
-                
-                if not file_info.is_removable:
-                    non_removable_count += 1
-        
-        # Mettre à jour l'affichage de la sélection
-        if self.parent_widget and hasattr(self.parent_widget, 'update_selection_info'):
-            self.parent_widget.update_selection_info(
-                selected_count, total_size, media_count, 
-                symlink_count, non_removable_count
-            )
+        """Programme l'émission du résumé de la sélection (regroupée avec les suivantes)"""
+        if not self._selection_timer.isActive():
+            self._selection_timer.start()
+    
+    @Slot()
+    def _do_selection_update(self):
+        """Émet le résumé de la sélection, tenu à jour par le modèle (aucun parcours des lignes)"""
+        self.selection_summary_changed.emit(self.scan_type, *self.file_model.selection_summary)
     
     def get_selected_files(self) -> List[FileInfo]:
         """Retourne les fichiers sélectionnés"""
-        selected_files = []
-        for row in range(self.rowCount()):
-            checkbox = self.cellWidget(row, 0)
-            if checkbox and checkbox.isChecked():
-                selected_files.append(self.files_data[row])
-        return selected_files
+        model = self.file_model
+        return [model.file_info(row) for row in model.checked_rows()]
+    
+    @Slot()
+    def check_all(self):
+        """Coche tous les fichiers"""
+        self.select_all(True)
+    
+    @Slot()
+    def uncheck_all(self):
+        """Décoche tous les fichiers"""
+        self.select_all(False)
     
     def select_all(self, checked: bool):
         """Sélectionne/désélectionne tous les fichiers"""
-        for row in range(self.rowCount()):
-            checkbox = self.cellWidget(row, 0)
-            if checkbox:
-                checkbox.setChecked(checked)
-            if checkbox:
-                checkbox.setChecked(checked)
+        # Un seul signal dataChanged, donc un seul recalcul de la sélection
+        self.file_model.set_all_checked(checked)
+
+
+# Onglets de scan: (titre, type de scan, libellé du bouton, nom d'export,
+# sélection de répertoire, taille minimale)
+TAB_CONFIGS = [
+    ("Doublons", "duplicates", "Scanner", "doublons", True, False),
+    ("Cache", "cache", "Scanner le cache", "cache", False, False),
+    ("Fichiers orphelins", "orphans", "Scanner les fichiers orphelins", "orphelins", False, False),
+    ("Gros fichiers", "large", "Scanner", "gros_fichiers", True, True),
+]
 
 
 class MacCleanApp(QMainWindow):
     """Fenêtre principale de l'application MacClean"""
+
+    SCAN_POOL_SIZE = 4
+    TASK_POOL_SIZE = 4
+    SYSTEM_INFO_INTERVAL_MS = 10_000
+    PREVIEW_CACHE_SIZE = 64  # Aperçus réduits (250x200) gardés, environ 200 Ko chacun
+    STATUS_MESSAGE_MS = 5000
+    NOTIFY_AFTER_SECONDS = 5.0  # Suppressions plus longues: notification système en plus
     
     def __init__(self):
         super().__init__()
         self.settings = QSettings("MacClean", "MacClean")
         self.setup_ui()
         self.setup_connections()
-        self.current_worker: Optional[ScanWorker] = None
-        self.current_thread: Optional[QThread] = None
+        
+        # Imports et initialisations différés préchargés pendant l'affichage de la fenêtre
+        threading.Thread(target=_warm_imports, name="macclean-warm-imports", daemon=True).start()
+        
+        # Pool de threads persistant: pas de création de thread par scan, un scan par onglet
+        # en parallèle, et au plus 4 parcours simultanés (au-delà, APFS sérialise les accès).
+        # Chaque scan a ses propres workers de hash/stat: quelques cœurs leur sont laissés
+        self.scan_pool = QThreadPool(self)
+        self.scan_pool.setMaxThreadCount(
+            max(2, min(self.SCAN_POOL_SIZE, QThread.idealThreadCount() - 3))
+        )
+        # Tâches courtes de l'interface (aperçus, infos système) et suppressions/exports dans
+        # un pool à part: deux scans en cours ne les font jamais attendre
+        self.task_pool = QThreadPool(self)
+        self.task_pool.setMaxThreadCount(max(2, min(self.TASK_POOL_SIZE, QThread.idealThreadCount())))
+        self.active_scans: Dict[str, ScanWorker] = {}
+        self.active_deletes: Dict[str, DeleteWorker] = {}
+        self.export_worker: Optional[ExportWorker] = None
+        # Scans annulés pour laisser passer une suppression: relancés quand elle se termine
+        self.pending_rescans: Set[str] = set()
+        self.tray_icon: Optional[QSystemTrayIcon] = None  # Créée à la première notification
+        
+        # Aperçus déjà réduits, par (chemin, date de modification), du plus ancien au plus récent
+        self.preview_cache: "OrderedDict[tuple, QPixmap]" = OrderedDict()
+        self.preview_tasks: Dict[tuple, PreviewTask] = {}
+        self.preview_key: Optional[tuple] = None
+        # Fichier actuellement décrit par le panneau: (type de scan, chemin, date) ou (type, None)
+        self.preview_source: Optional[tuple] = None
+        
+        # Informations système lues en arrière-plan au démarrage puis toutes les 10 s
+        self.system_info_task: Optional[SystemInfoTask] = None
+        self.system_info_timer = QTimer(self)
+        self.system_info_timer.setInterval(self.SYSTEM_INFO_INTERVAL_MS)
+        self.system_info_timer.timeout.connect(self.refresh_system_info)
+        self.system_info_timer.start()
+        self.refresh_system_info()
         
         # Charger les paramètres
         self.load_settings()
@@ -292,18 +849,24 @@ class MacCleanApp(QMainWindow):
         self.tabs = QTabWidget()
         main_layout.addWidget(self.tabs)
         
-        # Onglet Doublons
-        self.create_duplicates_tab()
-        
-        # Onglet Cache
-        self.create_cache_tab()
-        
-        # Onglet Fichiers orphelins
-        self.create_orphans_tab()
-        
-        # Onglet Gros fichiers
-        self.create_large_files_tab()
-        
+        # Onglets de scan, construits à partir de TAB_CONFIGS (dans l'ordre des index d'onglet)
+        self.tab_keys: List[str] = []
+        self.tables: Dict[str, FileTableWidget] = {}
+        self.selection_labels: Dict[str, QLabel] = {}
+        self.dir_labels: Dict[str, QLabel] = {}
+        self.directories: Dict[str, str] = {}
+        for config in TAB_CONFIGS:
+            self._build_scan_tab(config)
+        
+        # Prévisualisation partagée par tous les onglets: un seul panneau, ancré à droite
+        # (jamais reparenté d'un onglet à l'autre)
+        self.preview_widget = self.create_preview_panel()
+        self.preview_dock = QDockWidget("Prévisualisation", self)
+        self.preview_dock.setObjectName("preview_dock")  # Requis par saveState/restoreState
+        self.preview_dock.setFeatures(QDockWidget.DockWidgetMovable | QDockWidget.DockWidgetFloatable)
+        self.preview_dock.setWidget(self.preview_widget)
+        self.addDockWidget(Qt.RightDockWidgetArea, self.preview_dock)
+
         # Barre de statut
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
@@ -313,6 +876,12 @@ class MacCleanApp(QMainWindow):
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
         self.status_bar.addPermanentWidget(self.progress_bar)
+        
+        # Annulation des scans et de l'export en cours (une suppression n'est pas interrompue)
+        self.cancel_button = QPushButton("Annuler")
+        self.cancel_button.setVisible(False)
+        self.cancel_button.clicked.connect(self.cancel_operations)
+        self.status_bar.addPermanentWidget(self.cancel_button)
     
     def create_toolbar(self):
         """Crée la barre d'outils"""
@@ -343,25 +912,43 @@ class MacCleanApp(QMainWindow):
         self.system_info_group = QGroupBox("Informations système")
         layout = QHBoxLayout(self.system_info_group)
         
-        # Récupérer les infos système
-        sys_info = get_system_info()
+        # Rempli par update_system_info une fois les infos lues hors du thread GUI
+        self.platform_label = QLabel("Système: …")
+        layout.addWidget(self.platform_label)
+        
+        self.disk_label = QLabel("Disque: …")
+        layout.addWidget(self.disk_label)
+        
+        layout.addStretch()
+    
+    @Slot()
+    def refresh_system_info(self):
+        """Lance la lecture des informations système dans le pool (une seule à la fois)"""
+        if self.system_info_task is not None:
+            return
+        self.system_info_task = SystemInfoTask()
+        self.system_info_task.signals.ready.connect(self.update_system_info, Qt.QueuedConnection)
+        self.task_pool.start(self.system_info_task)
+    
+    @Slot(object)
+    def update_system_info(self, sys_info: dict):
+        """Affiche les informations système lues"""
+        self.system_info_task = None
         
         # Plateforme
-        platform_label = QLabel(f"Système: {sys_info['platform']}")
-        layout.addWidget(platform_label)
+        self.platform_label.setText(f"Système: {sys_info['platform']}")
         
         # Espace disque
-        disk_label = QLabel(
+        self.disk_label.setText(
             f"Disque: {format_file_size(sys_info['disk_used'])} / "
             f"{format_file_size(sys_info['disk_total'])} "
             f"({sys_info['disk_percent']:.1f}%)"
         )
-        layout.addWidget(disk_label)
-        
-        layout.addStretch()
     
-    def create_duplicates_tab(self):
-        """Crée l'onglet des doublons"""
+    def _build_scan_tab(self, config: tuple):
+        """Crée un onglet de scan décrit par une entrée de TAB_CONFIGS"""
+        title, scan_type, scan_label, _export_name, has_dir_picker, has_size_spinbox = config
+        
         tab_widget = QWidget()
         layout = QVBoxLayout(tab_widget)
         
@@ -369,72 +956,81 @@ class MacCleanApp(QMainWindow):
         controls_layout = QHBoxLayout()
         
         # Sélection du répertoire
-        self.duplicate_dir_label = QLabel("Répertoire: " + str(Path.home()))
-        controls_layout.addWidget(self.duplicate_dir_label)
+        if has_dir_picker:
+            self.directories[scan_type] = str(Path.home())
+            dir_label = QLabel(f"Répertoire: {self.directories[scan_type]}")
+            controls_layout.addWidget(dir_label)
+            self.dir_labels[scan_type] = dir_label
         
-        browse_btn = QPushButton("Parcourir")
-        browse_btn.clicked.connect(self.browse_duplicate_directory)
-        controls_layout.addWidget(browse_btn)
+            browse_btn = QPushButton("Parcourir")
+            browse_btn.clicked.connect(self.browse_directory)
+            controls_layout.addWidget(browse_btn)
         
-        scan_btn = QPushButton("Scanner")
-        scan_btn.clicked.connect(self.scan_duplicates)
+        # Taille minimale
+        if has_size_spinbox:
+            controls_layout.addWidget(QLabel("Taille min (MB):"))
+            self.min_size_spinbox = QSpinBox()
+            self.min_size_spinbox.setRange(1, 10000)
+            self.min_size_spinbox.setValue(100)
+            controls_layout.addWidget(self.min_size_spinbox)
+        
+        # Les boutons d'un onglet n'agissent que lorsqu'il est affiché: ils passent par
+        # les mêmes slots que la barre d'outils, qui opèrent sur l'onglet courant
+        scan_btn = QPushButton(scan_label)
+        scan_btn.clicked.connect(self.refresh_current_tab)
         controls_layout.addWidget(scan_btn)
         
         controls_layout.addStretch()
         layout.addLayout(controls_layout)
         
-        # Panneau principal avec splitter
-        main_splitter = QSplitter(Qt.Horizontal)
-        layout.addWidget(main_splitter)
-        
         # Table des résultats
         table_widget = QWidget()
         table_layout = QVBoxLayout(table_widget)
         
-        self.duplicates_table = FileTableWidget(self)
-        table_layout.addWidget(self.duplicates_table)
+        table = FileTableWidget(self, scan_type)
+        table.selection_summary_changed.connect(self.update_selection_info)
+        table_layout.addWidget(table)
         
         # Info de sélection
-        self.duplicates_selection_label = QLabel("Aucun fichier sélectionné")
-        self.duplicates_selection_label.setStyleSheet("QLabel { background-color: #f0f0f0; padding: 5px; border: 1px solid #ccc; }")
-        table_layout.addWidget(self.duplicates_selection_label)
-        
-        main_splitter.addWidget(table_widget)
+        selection_label = QLabel("Aucun fichier sélectionné")
+        selection_label.setStyleSheet("QLabel { background-color: #f0f0f0; padding: 5px; border: 1px solid #ccc; }")
+        table_layout.addWidget(selection_label)
         
-        # Panneau de prévisualisation
-        self.duplicates_preview_widget = self.create_preview_panel()
-        main_splitter.addWidget(self.duplicates_preview_widget)
-        
-        # Ajuster les proportions du splitter
-        main_splitter.setSizes([700, 300])
+        layout.addWidget(table_widget)
         
         # Boutons d'action
         actions_layout = QHBoxLayout()
         
         select_all_btn = QPushButton("Tout sélectionner")
-        select_all_btn.clicked.connect(
-            lambda: self.duplicates_table.select_all(True)
-        )
+        select_all_btn.clicked.connect(table.check_all)
         actions_layout.addWidget(select_all_btn)
         
         deselect_all_btn = QPushButton("Tout désélectionner")
-        deselect_all_btn.clicked.connect(
-            lambda: self.duplicates_table.select_all(False)
-        )
+        deselect_all_btn.clicked.connect(table.uncheck_all)
         actions_layout.addWidget(deselect_all_btn)
         
         actions_layout.addStretch()
         
         delete_btn = QPushButton("Supprimer sélectionnés")
-        delete_btn.clicked.connect(
-            lambda: self.delete_selected_files(self.duplicates_table)
-        )
+        delete_btn.clicked.connect(self.delete_selected)
         actions_layout.addWidget(delete_btn)
         
         layout.addLayout(actions_layout)
         
-        self.tabs.addTab(tab_widget, "Doublons")
+        self.tab_keys.append(scan_type)
+        self.tables[scan_type] = table
+        self.selection_labels[scan_type] = selection_label
+        self.tabs.addTab(tab_widget, title)
+        
+        return tab_widget, table
     
+    def current_scan_type(self) -> Optional[str]:
+        """Type de scan de l'onglet affiché"""
+        current_tab = self.tabs.currentIndex()
+        if 0 <= current_tab < len(self.tab_keys):
+            return self.tab_keys[current_tab]
+        return None
+
     def create_preview_panel(self):
         """Crée le panneau de prévisualisation des médias"""
         widget = QFrame()
@@ -443,11 +1039,6 @@ class MacCleanApp(QMainWindow):
         
         layout = QVBoxLayout(widget)
         
-        # Titre
-        title_label = QLabel("Prévisualisation")
-        title_label.setFont(QFont("Arial", 12, QFont.Bold))
-        layout.addWidget(title_label)
-        
         # Zone de prévisualisation d'image
         self.preview_scroll = QScrollArea()
         self.preview_label = QLabel("Sélectionnez un fichier média pour le prévisualiser")
@@ -469,9 +1060,10 @@ class MacCleanApp(QMainWindow):
         
         return widget
     
-    def update_selection_info(self, selected_count: int, total_size: int, 
+    @Slot(str, int, object, int, int, int)
+    def update_selection_info(self, scan_type: str, selected_count: int, total_size: int, 
                              media_count: int, symlink_count: int, non_removable_count: int):
-        """Met à jour les informations de sélection"""
+        """Met à jour les informations de sélection de la table émettrice"""
         if selected_count == 0:
             info_text = "Aucun fichier sélectionné"
         else:
@@ -488,47 +1080,42 @@ class MacCleanApp(QMainWindow):
             if details:
                 info_text += f" - {', '.join(details)}"
         
-        # Mettre à jour le label de sélection approprié selon l'onglet actuel
-        current_tab = self.tabs.currentIndex()
-        if current_tab == 0 and hasattr(self, 'duplicates_selection_label'):
-            self.duplicates_selection_label.setText(info_text)
-        elif current_tab == 1 and hasattr(self, 'cache_selection_label'):
-            self.cache_selection_label.setText(info_text)
-        elif current_tab == 2 and hasattr(self, 'orphans_selection_label'):
-            self.orphans_selection_label.setText(info_text)
-        elif current_tab == 3 and hasattr(self, 'large_files_selection_label'):
-            self.large_files_selection_label.setText(info_text)
-        
-        # Mettre à jour la prévisualisation
-        self.update_preview()
+        # Le label de la table émettrice, même si elle n'est pas affichée (fin de suppression
+        # dans un autre onglet): l'onglet courant n'est consulté que pour la prévisualisation
+        self.selection_labels[scan_type].setText(info_text)
+        if scan_type == self.current_scan_type():
+            self.update_preview()
     
     def update_preview(self):
         """Met à jour la prévisualisation du fichier sélectionné"""
-        current_tab = self.tabs.currentIndex()
-        
-        # Déterminer quelle table utiliser
-        if current_tab == 0:
-            table = self.duplicates_table
-        elif current_tab == 1:
-            table = self.cache_table
-        elif current_tab == 2:
-            table = self.orphans_table
-        elif current_tab == 3:
-            table = self.large_files_table
-        else:
+        scan_type = self.current_scan_type()
+        table = self.tables.get(scan_type)
+        if table is None:
             return
         
         # Trouver le dernier fichier sélectionné
-        selected_files = table.get_selected_files()
+        last_row = table.file_model.last_checked_row()
+        
+        # Même fichier que celui déjà affiché (cocher d'autres lignes avant lui): rien à refaire
+        batch = table.file_model.batch
+        if last_row < 0:
+            source = (scan_type, None)
+        else:
+            source = (scan_type, batch.paths[last_row], batch.mtimes_ns[last_row])
+        if source == self.preview_source:
+            return
+        self.preview_source = source
+        self.drop_queued_previews(keep=source[1:])
         
-        if not selected_files:
+        if last_row < 0:
+            self.preview_key = None
             self.preview_label.setText("Sélectionnez un fichier média pour le prévisualiser")
             self.preview_label.setPixmap(QPixmap())
             self.file_info_label.setText("Aucun fichier sélectionné")
             return
         
         # Prendre le dernier fichier sélectionné
-        file_info = selected_files[-1]
+        file_info = table.file_model.file_info(last_row)
         
         # Mettre à jour les informations du fichier
         info_text = f"""<b>Fichier:</b> {os.path.basename(file_info.path)}<br>
@@ -545,304 +1132,113 @@ class MacCleanApp(QMainWindow):
         
         self.file_info_label.setText(info_text)
         
-        # Prévisualisation pour les images
+        # Prévisualisation pour les images: depuis le cache, sinon décodée dans le pool
         if file_info.file_type == "image":
-            try:
-                pixmap = QPixmap(file_info.path)
-                if not pixmap.isNull():
-                    # Redimensionner l'image pour la prévisualisation
-                    scaled_pixmap = pixmap.scaled(
-                        250, 200, Qt.KeepAspectRatio, Qt.SmoothTransformation
-                    )
-                    self.preview_label.setPixmap(scaled_pixmap)
-                    self.preview_label.setText("")
-                else:
-                    self.preview_label.setText("Impossible de charger l'image")
-                    self.preview_label.setPixmap(QPixmap())
-            except Exception:
-                self.preview_label.setText("Erreur lors du chargement de l'image")
+            key = (file_info.path, file_info.mtime_ns)
+            self.preview_key = key
+            pixmap = self.preview_cache.get(key)
+            if pixmap is not None:
+                self.preview_cache.move_to_end(key)
+                self.show_preview_pixmap(pixmap)
+            else:
+                self.preview_label.setText("Chargement de l'aperçu…")
                 self.preview_label.setPixmap(QPixmap())
-        elif file_info.file_type == "video":
+                if key not in self.preview_tasks:
+                    task = PreviewTask(key, file_info.path)
+                    task.signals.ready.connect(self.preview_ready, Qt.QueuedConnection)
+                    self.preview_tasks[key] = task
+                    self.task_pool.start(task)
+            return
+        
+        self.preview_key = None
+        if file_info.file_type == "video":
             self.preview_label.setText(f"🎬 Fichier vidéo\n{os.path.basename(file_info.path)}\n{format_file_size(file_info.size)}")
             self.preview_label.setPixmap(QPixmap())
         else:
             self.preview_label.setText(f"📄 {file_info.file_type.upper()}\n{os.path.basename(file_info.path)}")
             self.preview_label.setPixmap(QPixmap())
     
-    def create_cache_tab(self):
-        """Crée l'onglet du cache"""
-        tab_widget = QWidget()
-        layout = QVBoxLayout(tab_widget)
-        
-        # Contrôles
-        controls_layout = QHBoxLayout()
-        
-        scan_btn = QPushButton("Scanner le cache")
-        scan_btn.clicked.connect(self.scan_cache)
-        controls_layout.addWidget(scan_btn)
-        
-        controls_layout.addStretch()
-        layout.addLayout(controls_layout)
-        
-        # Panneau principal avec splitter
-        main_splitter = QSplitter(Qt.Horizontal)
-        layout.addWidget(main_splitter)
-        
-        # Table des résultats
-        table_widget = QWidget()
-        table_layout = QVBoxLayout(table_widget)
-        
-        self.cache_table = FileTableWidget(self)
-        table_layout.addWidget(self.cache_table)
-        
-        # Info de sélection
-        self.cache_selection_label = QLabel("Aucun fichier sélectionné")
-        self.cache_selection_label.setStyleSheet("QLabel { background-color: #f0f0f0; padding: 5px; border: 1px solid #ccc; }")
-        table_layout.addWidget(self.cache_selection_label)
-        
-        main_splitter.addWidget(table_widget)
-        
-        # Panneau de prévisualisation (réutiliser le même)
-        main_splitter.addWidget(self.duplicates_preview_widget)
-        main_splitter.setSizes([700, 300])
-        
-        # Boutons d'action
-        actions_layout = QHBoxLayout()
-        
-        select_all_btn = QPushButton("Tout sélectionner")
-        select_all_btn.clicked.connect(
-            lambda: self.cache_table.select_all(True)
-        )
-        actions_layout.addWidget(select_all_btn)
-        
-        deselect_all_btn = QPushButton("Tout désélectionner")
-        deselect_all_btn.clicked.connect(
-            lambda: self.cache_table.select_all(False)
-        )
-        actions_layout.addWidget(deselect_all_btn)
-        
-        actions_layout.addStretch()
-        
-        delete_btn = QPushButton("Supprimer sélectionnés")
-        delete_btn.clicked.connect(
-            lambda: self.delete_selected_files(self.cache_table)
-        )
-        actions_layout.addWidget(delete_btn)
-        
-        layout.addLayout(actions_layout)
-        
-        self.tabs.addTab(tab_widget, "Cache")
+    def drop_queued_previews(self, keep: Optional[tuple] = None):
+        """Retire du pool les décodages d'aperçu pas encore démarrés, sauf celui de keep
+        (défilement rapide: seul le dernier fichier sera affiché)"""
+        for key, task in list(self.preview_tasks.items()):
+            if key != keep and self.task_pool.tryTake(task):
+                del self.preview_tasks[key]
     
-    def create_orphans_tab(self):
-        """Crée l'onglet des fichiers orphelins"""
-        tab_widget = QWidget()
-        layout = QVBoxLayout(tab_widget)
-        
-        # Contrôles
-        controls_layout = QHBoxLayout()
-        
-        scan_btn = QPushButton("Scanner les fichiers orphelins")
-        scan_btn.clicked.connect(self.scan_orphans)
-        controls_layout.addWidget(scan_btn)
-        
-        controls_layout.addStretch()
-        layout.addLayout(controls_layout)
-        
-        # Panneau principal avec splitter
-        main_splitter = QSplitter(Qt.Horizontal)
-        layout.addWidget(main_splitter)
-        
-        # Table des résultats
-        table_widget = QWidget()
-        table_layout = QVBoxLayout(table_widget)
-        
-        self.orphans_table = FileTableWidget(self)
-        table_layout.addWidget(self.orphans_table)
-        
-        # Info de sélection
-        self.orphans_selection_label = QLabel("Aucun fichier sélectionné")
-        self.orphans_selection_label.setStyleSheet("QLabel { background-color: #f0f0f0; padding: 5px; border: 1px solid #ccc; }")
-        table_layout.addWidget(self.orphans_selection_label)
-        
-        main_splitter.addWidget(table_widget)
-        
-        # Panneau de prévisualisation (réutiliser le même)
-        main_splitter.addWidget(self.duplicates_preview_widget)
-        main_splitter.setSizes([700, 300])
-        
-        # Boutons d'action
-        actions_layout = QHBoxLayout()
-        
-        select_all_btn = QPushButton("Tout sélectionner")
-        select_all_btn.clicked.connect(
-            lambda: self.orphans_table.select_all(True)
-        )
-        actions_layout.addWidget(select_all_btn)
-        
-        deselect_all_btn = QPushButton("Tout désélectionner")
-        deselect_all_btn.clicked.connect(
-            lambda: self.orphans_table.select_all(False)
-        )
-        actions_layout.addWidget(deselect_all_btn)
-        
-        actions_layout.addStretch()
-        
-        delete_btn = QPushButton("Supprimer sélectionnés")
-        delete_btn.clicked.connect(
-            lambda: self.delete_selected_files(self.orphans_table)
-        )
-        actions_layout.addWidget(delete_btn)
-        
-        layout.addLayout(actions_layout)
-        
-        self.tabs.addTab(tab_widget, "Fichiers orphelins")
+    @Slot(object, QImage)
+    def preview_ready(self, key: tuple, image: QImage):
+        """Met en cache un aperçu décodé et l'affiche s'il correspond toujours à la sélection"""
+        self.preview_tasks.pop(key, None)
+        pixmap = QPixmap.fromImage(image)
+        self.preview_cache[key] = pixmap
+        if len(self.preview_cache) > self.PREVIEW_CACHE_SIZE:
+            self.preview_cache.popitem(last=False)
+        if key == self.preview_key:
+            self.show_preview_pixmap(pixmap)
     
-    def create_large_files_tab(self):
-        """Crée l'onglet des gros fichiers"""
-        tab_widget = QWidget()
-        layout = QVBoxLayout(tab_widget)
-        
-        # Contrôles
-        controls_layout = QHBoxLayout()
-        
-        # Sélection du répertoire
-        self.large_files_dir_label = QLabel("Répertoire: " + str(Path.home()))
-        controls_layout.addWidget(self.large_files_dir_label)
-        
-        browse_btn = QPushButton("Parcourir")
-        browse_btn.clicked.connect(self.browse_large_files_directory)
-        controls_layout.addWidget(browse_btn)
-        
-        # Taille minimale
-        controls_layout.addWidget(QLabel("Taille min (MB):"))
-        self.min_size_spinbox = QSpinBox()
-        self.min_size_spinbox.setRange(1, 10000)
-        self.min_size_spinbox.setValue(100)
-        controls_layout.addWidget(self.min_size_spinbox)
-        
-        scan_btn = QPushButton("Scanner")
-        scan_btn.clicked.connect(self.scan_large_files)
-        controls_layout.addWidget(scan_btn)
-        
-        controls_layout.addStretch()
-        layout.addLayout(controls_layout)
-        
-        # Panneau principal avec splitter
-        main_splitter = QSplitter(Qt.Horizontal)
-        layout.addWidget(main_splitter)
-        
-        # Table des résultats
-        table_widget = QWidget()
-        table_layout = QVBoxLayout(table_widget)
-        
-        self.large_files_table = FileTableWidget(self)
-        table_layout.addWidget(self.large_files_table)
-        
-        # Info de sélection
-        self.large_files_selection_label = QLabel("Aucun fichier sélectionné")
-        self.large_files_selection_label.setStyleSheet("QLabel { background-color: #f0f0f0; padding: 5px; border: 1px solid #ccc; }")
-        table_layout.addWidget(self.large_files_selection_label)
-        
-        main_splitter.addWidget(table_widget)
-        
-        # Panneau de prévisualisation (réutiliser le même)
-        main_splitter.addWidget(self.duplicates_preview_widget)
-        main_splitter.setSizes([700, 300])
-        
-        # Boutons d'action
-        actions_layout = QHBoxLayout()
-        
-        select_all_btn = QPushButton("Tout sélectionner")
-        select_all_btn.clicked.connect(
-            lambda: self.large_files_table.select_all(True)
-        )
-        actions_layout.addWidget(select_all_btn)
-        
-        deselect_all_btn = QPushButton("Tout désélectionner")
-        deselect_all_btn.clicked.connect(
-            lambda: self.large_files_table.select_all(False)
-        )
-        actions_layout.addWidget(deselect_all_btn)
-        
-        actions_layout.addStretch()
-        
-        delete_btn = QPushButton("Supprimer sélectionnés")
-        delete_btn.clicked.connect(
-            lambda: self.delete_selected_files(self.large_files_table)
-        )
-        actions_layout.addWidget(delete_btn)
-        
-        layout.addLayout(actions_layout)
-        
-        self.tabs.addTab(tab_widget, "Gros fichiers")
+    def show_preview_pixmap(self, pixmap: QPixmap):
+        """Affiche un aperçu réduit (ou le message d'erreur s'il est vide)"""
+        if pixmap.isNull():
+            self.preview_label.setText("Impossible de charger l'image")
+            self.preview_label.setPixmap(QPixmap())
+        else:
+            self.preview_label.setPixmap(pixmap)
+            self.preview_label.setText("")
     
     def setup_connections(self):
         """Configure les connexions des signaux"""
-        pass
+        self.tabs.currentChanged.connect(self.on_tab_changed)
     
-    def browse_duplicate_directory(self):
-        """Ouvre le dialogue de sélection de répertoire pour les doublons"""
-        directory = QFileDialog.getExistingDirectory(
-            self, "Sélectionner le répertoire à scanner"
-        )
-        if directory:
-            self.duplicate_dir_label.setText(f"Répertoire: {directory}")
+    @Slot(int)
+    def on_tab_changed(self, index: int):
+        """Affiche dans le panneau partagé la prévisualisation de l'onglet devenu courant"""
+        self.update_preview()
     
-    def browse_large_files_directory(self):
-        """Ouvre le dialogue de sélection de répertoire pour les gros fichiers"""
+    @Slot()
+    def browse_directory(self):
+        """Ouvre le dialogue de sélection de répertoire de l'onglet actuel"""
+        scan_type = self.current_scan_type()
+        if scan_type not in self.directories:
+            return
         directory = QFileDialog.getExistingDirectory(
             self, "Sélectionner le répertoire à scanner"
         )
         if directory:
-            self.large_files_dir_label.setText(f"Répertoire: {directory}")
+            self.directories[scan_type] = directory
+            self.dir_labels[scan_type].setText(f"Répertoire: {directory}")
     
-    def scan_duplicates(self):
-        """Lance le scan des doublons"""
-        directory = self.duplicate_dir_label.text().replace("Répertoire: ", "")
-        self.start_scan("duplicates", {"directory": directory})
-    
-    def scan_cache(self):
-        """Lance le scan du cache"""
-        self.start_scan("cache", {})
-    
-    def scan_orphans(self):
-        """Lance le scan des fichiers orphelins"""
-        self.start_scan("orphans", {})
-    
-    def scan_large_files(self):
-        """Lance le scan des gros fichiers"""
-        directory = self.large_files_dir_label.text().replace("Répertoire: ", "")
-        min_size = self.min_size_spinbox.value()
-        self.start_scan("large", {"directory": directory, "min_size_mb": min_size})
+    def scan_parameters(self, scan_type: str) -> dict:
+        """Paramètres du scan lus dans les contrôles de l'onglet"""
+        parameters = {}
+        if scan_type in self.directories:
+            parameters["directory"] = self.directories[scan_type]
+        if scan_type == "large":
+            parameters["min_size_mb"] = self.min_size_spinbox.value()
+        return parameters
     
     def start_scan(self, scan_type: str, parameters: dict):
         """Démarre un scan en arrière-plan"""
-        if self.current_thread and self.current_thread.isRunning():
-            QMessageBox.warning(self, "Scan en cours", "Un scan est déjà en cours.")
+        if scan_type in self.active_scans:
+            QMessageBox.warning(self, "Scan en cours", "Ce scan est déjà en cours.")
+            return
+        if scan_type in self.active_deletes:
+            QMessageBox.warning(self, "Suppression en cours", "Attendez la fin de la suppression.")
             return
         
-        # Créer le worker et le thread
-        self.current_worker = ScanWorker(scan_type, parameters)
-        self.current_thread = QThread()
-        
-        # Déplacer le worker vers le thread
-        self.current_worker.moveToThread(self.current_thread)
+        worker = ScanWorker(scan_type, parameters)
         
-        # Connecter les signaux
-        self.current_thread.started.connect(self.current_worker.run)
-        self.current_worker.progress.connect(self.update_progress)
-        self.current_worker.finished.connect(self.scan_finished)
-        self.current_worker.error.connect(self.scan_error)
-        self.current_worker.finished.connect(self.current_thread.quit)
-        self.current_worker.finished.connect(self.current_worker.deleteLater)
-        self.current_thread.finished.connect(self.current_thread.deleteLater)
+        # Connecter les signaux - émis depuis le pool, livrés via la file d'attente du thread GUI
+        worker.signals.progress.connect(self.update_progress, Qt.QueuedConnection)
+        worker.signals.finished.connect(self.scan_finished, Qt.QueuedConnection)
+        worker.signals.error.connect(self.scan_error, Qt.QueuedConnection)
+        self.active_scans[scan_type] = worker
         
         # Démarrer le scan
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setValue(0)
+        self._show_progress(indeterminate=False)
         self.status_bar.showMessage(f"Scan en cours: {scan_type}")
-        self.current_thread.start()
+        self.scan_pool.start(worker)
     
+    @Slot(int, int)
     def update_progress(self, current: int, total: int):
         """Met à jour la barre de progression"""
         if total > 0:
@@ -853,66 +1249,90 @@ class MacCleanApp(QMainWindow):
             self.progress_bar.setMaximum(0)
             self.progress_bar.setValue(0)
     
-    def scan_finished(self, results: List[FileInfo]):
+    def _end_scan(self, scan_type: str):
+        """Retire un scan terminé et masque la progression s'il n'en reste aucun"""
+        self.active_scans.pop(scan_type, None)
+        self._update_progress_visibility()
+    
+    def _show_progress(self, indeterminate: bool):
+        """Affiche la progression (indéterminée pour une suppression ou un export) et l'annulation"""
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setMaximum(0 if indeterminate else 100)
+        self.progress_bar.setValue(0)
+        self.cancel_button.setVisible(bool(self.active_scans) or self.export_worker is not None)
+    
+    def _update_progress_visibility(self):
+        """Masque la progression quand aucun scan ni aucune suppression n'est en cours"""
+        if not self.active_scans and not self.active_deletes and self.export_worker is None:
+            self.progress_bar.setVisible(False)
+        self.cancel_button.setVisible(bool(self.active_scans) or self.export_worker is not None)
+    
+    @Slot()
+    def cancel_operations(self):
+        """Arrête les scans et l'export en cours (leurs signaux de fin suivent normalement)"""
+        for worker in self.active_scans.values():
+            worker.stop()
+        self.pending_rescans.clear()  # Pas de relance après une suppression en cours
+        if self.export_worker is not None:
+            self.export_worker.stop()
+        self.status_bar.showMessage("Annulation en cours...")
+    
+    @Slot(str, object, object)
+    def scan_finished(self, scan_type: str, batch: FileBatch, hashes: List[Optional[str]]):
         """Appelé quand le scan est terminé"""
-        self.progress_bar.setVisible(False)
-        self.status_bar.showMessage(f"Scan terminé. {len(results)} fichiers trouvés.")
+        worker = self.active_scans.get(scan_type)
+        self._end_scan(scan_type)
+        if scan_type in self.pending_rescans:
+            # Scan interrompu par une suppression: résultat partiel ignoré, scan relancé ensuite
+            self._restart_pending_scan(scan_type)
+            return
+        if worker is not None and worker.should_stop:
+            # Scan annulé: les résultats précédents restent affichés
+            self.status_bar.showMessage("Scan annulé")
+            return
+        self.status_bar.showMessage(f"Scan terminé. {len(batch)} fichiers trouvés.")
         
-        # Déterminer quelle table mettre à jour selon le type de scan
-        if hasattr(self.current_worker, 'scan_type'):
-            scan_type = self.current_worker.scan_type
-            
-            if scan_type == "duplicates":
-                self.duplicates_table.populate_table(results)
-                print(f"✅ Table doublons mise à jour avec {len(results)} fichiers")
-            elif scan_type == "cache":
-                self.cache_table.populate_table(results)
-                print(f"✅ Table cache mise à jour avec {len(results)} fichiers")
-            elif scan_type == "orphans":
-                self.orphans_table.populate_table(results)
-                print(f"✅ Table orphelins mise à jour avec {len(results)} fichiers")
-            elif scan_type == "large":
-                self.large_files_table.populate_table(results)
-                print(f"✅ Table gros fichiers mise à jour avec {len(results)} fichiers")
-        else:
-            # Fallback : mettre à jour l'onglet actuel
-            current_tab = self.tabs.currentIndex()
-            
-            if current_tab == 0:  # Doublons
-                self.duplicates_table.populate_table(results)
-            elif current_tab == 1:  # Cache
-                self.cache_table.populate_table(results)
-            elif current_tab == 2:  # Orphelins
-                self.orphans_table.populate_table(results)
-            elif current_tab == 3:  # Gros fichiers
-                self.large_files_table.populate_table(results)
-    
-    def scan_error(self, error_message: str):
+        # Mettre à jour la table du type de scan
+        self.tables[scan_type].populate_batch(batch, hashes)
+    
+    @Slot(str, str)
+    def scan_error(self, scan_type: str, error_message: str):
         """Appelé en cas d'erreur de scan"""
-        self.progress_bar.setVisible(False)
+        self._end_scan(scan_type)
+        self.pending_rescans.discard(scan_type)
         self.status_bar.showMessage("Erreur de scan")
         QMessageBox.critical(self, "Erreur", f"Erreur lors du scan: {error_message}")
     
-    def delete_selected_files(self, table: FileTableWidget):
-        """Supprime les fichiers sélectionnés"""
-        selected_files = table.get_selected_files()
+    def delete_selected_files(self, scan_type: str):
+        """Supprime les fichiers sélectionnés (un scan en cours de l'onglet est annulé puis
+        relancé après la suppression)"""
+        if scan_type in self.active_deletes:
+            QMessageBox.warning(self, "Opération en cours", "Attendez la fin de la suppression en cours.")
+            return
         
-        if not selected_files:
+        model = self.tables[scan_type].file_model
+        batch = model.batch
+        selected_rows = model.checked_rows()
+        
+        if not selected_rows:
             QMessageBox.information(self, "Aucune sélection", "Aucun fichier sélectionné.")
             return
         
-        # Vérifier s'il y a des fichiers non supprimables
-        non_removable_files = [f for f in selected_files if not f.is_removable]
-        removable_files = [f for f in selected_files if f.is_removable]
-        
-        if non_removable_files:
-            non_removable_names = [os.path.basename(f.path) for f in non_removable_files[:5]]
-            if len(non_removable_files) > 5:
-                non_removable_names.append(f"... et {len(non_removable_files) - 5} autre(s)")
+        # Vérifier s'il y a des fichiers non supprimables: une passe sur les drapeaux bruts
+        # (une ligne non classée n'a pas le bit supprimable, comme is_removable() -> None)
+        flags = batch.flags
+        removable_rows, non_removable_rows = [], []
+        for row in selected_rows:
+            (removable_rows if flags[row] & FLAG_REMOVABLE else non_removable_rows).append(row)
+        
+        if non_removable_rows:
+            non_removable_names = [os.path.basename(batch.paths[row]) for row in non_removable_rows[:5]]
+            if len(non_removable_rows) > 5:
+                non_removable_names.append(f"... et {len(non_removable_rows) - 5} autre(s)")
             
-            message = f"⚠️ {len(non_removable_files)} fichier(s) ne peuvent pas être supprimés :\n"
+            message = f"⚠️ {len(non_removable_rows)} fichier(s) ne peuvent pas être supprimés :\n"
             message += "\n".join(f"• {name}" for name in non_removable_names)
-            message += f"\n\nContinuer avec les {len(removable_files)} fichier(s) supprimables ?"
+            message += f"\n\nContinuer avec les {len(removable_rows)} fichier(s) supprimables ?"
             
             reply = QMessageBox.question(
                 self, "Fichiers protégés détectés", message,
@@ -922,74 +1342,132 @@ class MacCleanApp(QMainWindow):
             if reply == QMessageBox.No:
                 return
             
-            selected_files = removable_files
+            selected_rows = removable_rows
         
-        if not selected_files:
+        if not selected_rows:
             QMessageBox.information(self, "Aucun fichier supprimable", 
                                    "Aucun fichier sélectionné ne peut être supprimé.")
             return
         
         # Confirmation finale
-        total_size = sum(f.size for f in selected_files)
+        total_size = batch.total_size(selected_rows)
         reply = QMessageBox.question(
             self, "Confirmation",
-            f"Êtes-vous sûr de vouloir supprimer {len(selected_files)} fichier(s) ?\n"
+            f"Êtes-vous sûr de vouloir supprimer {len(selected_rows)} fichier(s) ?\n"
             f"Taille totale : {format_file_size(total_size)}",
             QMessageBox.Yes | QMessageBox.No
         )
         
         if reply == QMessageBox.Yes:
-            successful_deletions = 0
-            
-            for file_info in selected_files:
-                if safe_delete_file(file_info.path):
-                    successful_deletions += 1
-            
-            QMessageBox.information(
-                self, "Suppression terminée",
-                f"{successful_deletions}/{len(selected_files)} fichier(s) supprimé(s)."
-            )
-            
-            # Rafraîchir la table
-            self.refresh_current_tab()
+            scan_worker = self.active_scans.get(scan_type)
+            if scan_worker is not None:
+                scan_worker.stop()
+                self.pending_rescans.add(scan_type)
+            paths = [batch.paths[row] for row in selected_rows]
+            if scan_type == "duplicates":
+                references = self._duplicate_references(model, selected_rows)
+                self.start_delete(scan_type, selected_rows, paths, references)
+            else:
+                self.start_delete(scan_type, selected_rows, paths)
+    
+    @staticmethod
+    def _duplicate_references(model: "FileTableModel", rows: List[int]) -> List[Optional[str]]:
+        """Pour chaque ligne à supprimer, un fichier de même hash qui reste sur le disque
+        (None si toutes les copies sont supprimées)"""
+        deleted = set(rows)
+        kept: Dict[str, str] = {}
+        for row, (path, digest) in enumerate(zip(model.batch.paths, model.hashes)):
+            if digest and row not in deleted:
+                kept.setdefault(digest, path)
+        return [kept.get(model.hashes[row]) for row in rows]
+    
+    def start_delete(self, scan_type: str, rows: List[int], paths: List[str],
+                     references: Optional[List[Optional[str]]] = None):
+        """Lance la suppression dans le pool, progression par lot de chemins supprimés"""
+        worker = DeleteWorker(scan_type, rows, paths, references)
+        worker.signals.progress.connect(self.update_progress, Qt.QueuedConnection)
+        worker.signals.finished.connect(self.delete_finished, Qt.QueuedConnection)
+        self.active_deletes[scan_type] = worker
+        
+        self._show_progress(indeterminate=False)
+        self.status_bar.showMessage(f"Suppression de {len(paths)} fichier(s)...")
+        self.task_pool.start(worker)
+    
+    @Slot(str, object)
+    def delete_finished(self, scan_type: str, results: List[bool]):
+        """Appelé quand la suppression est terminée"""
+        worker = self.active_deletes.pop(scan_type)
+        self._update_progress_visibility()
+        
+        # Retirer du modèle les seules lignes supprimées, sans rescanner le disque
+        table = self.tables[scan_type]
+        paths = table.file_model.batch.paths
+        deleted = [(row, path) for row, path, ok in zip(worker.rows, worker.paths, results) if ok]
+        if all(row < len(paths) and paths[row] == path for row, path in deleted):
+            rows = [row for row, _path in deleted]
+        else:
+            # Lignes réordonnées entre-temps (tri): retrouver les fichiers par chemin
+            deleted_paths = {path for _row, path in deleted}
+            rows = [row for row, path in enumerate(paths) if path in deleted_paths]
+        table.file_model.remove_rows(rows)
+        table.on_selection_changed()
+        self._restart_pending_scan(scan_type)
+        
+        # Bilan non modal: aucune boucle d'événements imbriquée à la fin d'une suppression
+        message = f"{sum(results)}/{len(results)} fichier(s) supprimé(s)."
+        self.status_bar.showMessage(message, self.STATUS_MESSAGE_MS)
+        if time.monotonic() - worker.started_at > self.NOTIFY_AFTER_SECONDS:
+            self.notify("Suppression terminée", message)
+    
+    def notify(self, title: str, message: str):
+        """Notification système non bloquante (sans effet si aucune zone de notification)"""
+        if not QSystemTrayIcon.isSystemTrayAvailable():
+            return
+        if self.tray_icon is None:
+            self.tray_icon = QSystemTrayIcon(self.style().standardIcon(QStyle.SP_TrashIcon), self)
+            self.tray_icon.setToolTip("MacClean")
+        self.tray_icon.show()
+        self.tray_icon.showMessage(title, message, QSystemTrayIcon.Information, self.STATUS_MESSAGE_MS)
     
+    def _restart_pending_scan(self, scan_type: str):
+        """Relance un scan annulé par une suppression, une fois scan et suppression terminés"""
+        if (scan_type in self.pending_rescans and scan_type not in self.active_scans
+                and scan_type not in self.active_deletes):
+            self.pending_rescans.discard(scan_type)
+            self.start_scan(scan_type, self.scan_parameters(scan_type))
+    
+    @Slot()
+    def delete_selected(self):
+        """Supprime les fichiers sélectionnés de l'onglet actuel"""
+        scan_type = self.current_scan_type()
+        if scan_type is not None:
+            self.delete_selected_files(scan_type)
+    
+    @Slot()
     def refresh_current_tab(self):
         """Rafraîchit l'onglet actuel"""
-        current_tab = self.tabs.currentIndex()
-        
-        if current_tab == 0:  # Doublons
-            self.scan_duplicates()
-        elif current_tab == 1:  # Cache
-            self.scan_cache()
-        elif current_tab == 2:  # Orphelins
-            self.scan_orphans()
-        elif current_tab == 3:  # Gros fichiers
-            self.scan_large_files()
+        scan_type = self.current_scan_type()
+        if scan_type is not None:
+            self.start_scan(scan_type, self.scan_parameters(scan_type))
     
+    @Slot()
     def export_results(self):
         """Exporte les résultats de l'onglet actuel"""
         current_tab = self.tabs.currentIndex()
-        
-        # Déterminer quelle table utiliser
-        if current_tab == 0:
-            table = self.duplicates_table
-            tab_name = "doublons"
-        elif current_tab == 1:
-            table = self.cache_table
-            tab_name = "cache"
-        elif current_tab == 2:
-            table = self.orphans_table
-            tab_name = "orphelins"
-        elif current_tab == 3:
-            table = self.large_files_table
-            tab_name = "gros_fichiers"
-        else:
+        if not 0 <= current_tab < len(TAB_CONFIGS):
             return
         
-        if not table.files_data:
+        scan_type, tab_name = TAB_CONFIGS[current_tab][1], TAB_CONFIGS[current_tab][3]
+        table = self.tables[scan_type]
+        
+        if not table.file_model.file_count():
             QMessageBox.information(self, "Aucune donnée", "Aucune donnée à exporter.")
             return
         
+        if self.export_worker is not None:
+            QMessageBox.warning(self, "Export en cours", "Un export est déjà en cours.")
+            return
+        
         # Sélectionner le format d'export
         formats = {
             "JSON (*.json)": "json",
@@ -1004,21 +1482,34 @@ class MacCleanApp(QMainWindow):
         )
         
         if file_path:
-            format_type = formats[selected_filter]
-            
-            success = False
-            if format_type == "json":
-                success = export_to_json(table.files_data, file_path)
-            elif format_type == "csv":
-                success = export_to_csv(table.files_data, file_path)
-            elif format_type == "txt":
-                success = export_to_txt(table.files_data, file_path)
-            
-            if success:
-                QMessageBox.information(self, "Export réussi", f"Données exportées vers {file_path}")
-            else:
-                QMessageBox.critical(self, "Erreur d'export", "Échec de l'export des données.")
+            self.start_export(formats[selected_filter], file_path, table.file_model)
+    
+    def start_export(self, format_type: str, file_path: str, model: FileTableModel):
+        """Lance l'export dans le pool, la progression restant indéterminée jusqu'à la fin"""
+        worker = ExportWorker(format_type, file_path, model.batch, model.hashes)
+        worker.signals.finished.connect(self.export_finished, Qt.QueuedConnection)
+        self.export_worker = worker
+        
+        self._show_progress(indeterminate=True)
+        self.status_bar.showMessage(f"Export en cours: {file_path}")
+        self.task_pool.start(worker)
+    
+    @Slot(str, bool)
+    def export_finished(self, file_path: str, success: bool):
+        """Appelé quand l'export est terminé"""
+        worker, self.export_worker = self.export_worker, None
+        self._update_progress_visibility()
+        
+        if worker is not None and worker.cancelled:
+            self.status_bar.showMessage("Export annulé")
+        elif success:
+            self.status_bar.showMessage(f"Données exportées vers {file_path}")
+            QMessageBox.information(self, "Export réussi", f"Données exportées vers {file_path}")
+        else:
+            self.status_bar.showMessage("Échec de l'export")
+            QMessageBox.critical(self, "Erreur d'export", "Échec de l'export des données.")
     
+    @Slot()
     def show_about(self):
         """Affiche la boîte de dialogue À propos"""
         QMessageBox.about(
@@ -1036,32 +1527,41 @@ class MacCleanApp(QMainWindow):
     
     def load_settings(self):
         """Charge les paramètres de l'application"""
-        # Restaurer la géométrie de la fenêtre
+        self.settings.beginGroup("window")
         geometry = self.settings.value("geometry")
+        state = self.settings.value("state")
+        self.settings.endGroup()
+        
+        # Restaurer la géométrie de la fenêtre
         if geometry:
             self.restoreGeometry(geometry)
         
         # Restaurer l'état de la fenêtre
-        state = self.settings.value("windowState")
         if state:
             self.restoreState(state)
     
     def save_settings(self):
-        """Sauvegarde les paramètres de l'application"""
+        """Sauvegarde les paramètres de l'application (écrits sur disque par closeEvent)"""
+        self.settings.beginGroup("window")
         self.settings.setValue("geometry", self.saveGeometry())
-        self.settings.setValue("windowState", self.saveState())
+        self.settings.setValue("state", self.saveState())
+        self.settings.endGroup()
     
     def closeEvent(self, event):
         """Gestionnaire de fermeture de l'application"""
-        # Arrêter les scans en cours
-        if self.current_worker:
-            self.current_worker.stop()
-        
-        if self.current_thread and self.current_thread.isRunning():
-            self.current_thread.quit()
-            self.current_thread.wait()
-        
-        # Sauvegarder les paramètres
+        # Arrêter scans et export en cours et retirer les aperçus pas encore décodés:
+        # l'attente ne porte plus que sur des tâches courtes (les suppressions vont à leur terme)
+        self.system_info_timer.stop()
+        for worker in self.active_scans.values():
+            worker.stop()
+        if self.export_worker is not None:
+            self.export_worker.stop()
+        self.drop_queued_previews()
+        self.scan_pool.waitForDone()
+        self.task_pool.waitForDone()
+        
+        # Sauvegarder les paramètres: setValue reste en mémoire, une seule écriture disque
         self.save_settings()
+        self.settings.sync()
         
         event.accept()
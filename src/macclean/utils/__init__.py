@@ -3,19 +3,19 @@ Module utils pour les fonctions utilitaires
 """
 
 from .helpers import (
-    format_file_size, safe_delete_file, safe_delete_file_optimized,
-    safe_delete_files_batch,
+    format_file_size, format_file_sizes, safe_delete_file, safe_delete_file_optimized,
+    safe_delete_files, safe_delete_files_batch, files_identical, safe_verify_duplicate_group,
     export_to_json, export_to_csv, export_to_txt,
-    export_to_json_optimized, export_to_csv_optimized,
+    export_to_json_optimized, export_to_csv_optimized, export_to_json_stream,
     get_system_info, get_system_info_m1_optimized,
     is_apple_silicon, get_file_type, is_removable_file
 )
 
 __all__ = [
-    "format_file_size", "safe_delete_file", "safe_delete_file_optimized",
-    "safe_delete_files_batch",
+    "format_file_size", "format_file_sizes", "safe_delete_file", "safe_delete_file_optimized",
+    "safe_delete_files", "safe_delete_files_batch", "files_identical", "safe_verify_duplicate_group",
     "export_to_json", "export_to_csv", "export_to_txt", 
-    "export_to_json_optimized", "export_to_csv_optimized",
+    "export_to_json_optimized", "export_to_csv_optimized", "export_to_json_stream",
     "get_system_info", "get_system_info_m1_optimized",
     "is_apple_silicon", "get_file_type", "is_removable_file"
 ]
@@ -8,47 +8,68 @@ import json
 import csv
 import concurrent.futures
 import platform
-from typing import List, Dict, Any
+import functools
+import itertools
+import operator
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from pathlib import Path
-from macclean.core import FileInfo
+from macclean.core import FileBatch, FileInfo, file_type_from_extension
+from macclean.core.batch import ns_to_seconds
+from macclean.core._tuning import get_cpu_brand, sysctl_int
 
+try:
+    import orjson  # Optionnel : sérialisation JSON en Rust, directement en bytes
+except ImportError:
+    orjson = None
 
+# Lignes sérialisées puis écrites ensemble, et taille du tampon d'écriture des exports
+EXPORT_CHUNK_ROWS = 4096
+EXPORT_BUFFER_SIZE = 1 << 20  # 1 Mio: peu de vidages, même pour des milliers de lignes courtes
+
+# Chemins supprimés par tâche: un unlink est bref, une tâche par fichier coûterait plus cher
+DELETE_CHUNK_SIZE = 512
+
+
+@functools.lru_cache(maxsize=1)
 def is_apple_silicon() -> bool:
     """Détecte si on est sur Apple Silicon (M1/M2)"""
     return platform.system() == "Darwin" and platform.machine() in ('arm64', 'aarch64')
 
 
+SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+@functools.lru_cache(maxsize=4096)
 def format_file_size(size_bytes: int) -> str:
-    """Formate la taille d'un fichier en unités lisibles"""
-    if size_bytes == 0:
+    """Formate la taille d'un fichier en unités lisibles - mis en cache: exports et repaints
+    de la table redemandent sans cesse les mêmes tailles (doublons d'un groupe, cellules visibles)"""
+    if size_bytes <= 0:
         return "0 B"
     
-    size_names = ["B", "KB", "MB", "GB", "TB"]
-    import math
-    i = int(math.floor(math.log(size_bytes, 1024)))
-    p = math.pow(1024, i)
-    s = round(size_bytes / p, 2)
-    return f"{s} {size_names[i]}"
+    # Unité = nombre de tranches de 10 bits, en entiers (ni log flottant ni pow): exact aux
+    # frontières (1024**n - 1 reste dans l'unité inférieure), plafonnée au To
+    i = min((size_bytes.bit_length() - 1) // 10, len(SIZE_UNITS) - 1)
+    s = round(size_bytes / (1 << (10 * i)), 2)
+    return f"{s} {SIZE_UNITS[i]}"
+
+
+def format_file_sizes(sizes: Iterable[int]) -> List[str]:
+    """Formate une colonne de tailles: chaque taille distincte une seule fois (un dict local
+    plutôt que le cache LRU, que des milliers de tailles toutes différentes feraient tourner)"""
+    sizes = sizes if isinstance(sizes, (list, tuple)) else list(sizes)
+    formatted = {size: format_file_size.__wrapped__(size) for size in set(sizes)}
+    return list(map(formatted.__getitem__, sizes))
 
 
 def get_file_type(file_path: str) -> str:
     """Détermine le type d'un fichier"""
-    import mimetypes
     import os
     
     if os.path.islink(file_path):
         return "symlink"
     
-    mime_type, _ = mimetypes.guess_type(file_path)
-    if mime_type:
-        if mime_type.startswith('image/'):
-            return "image"
-        elif mime_type.startswith('video/'):
-            return "video"
-        elif mime_type.startswith('audio/'):
-            return "audio"
-    
-    return "file"
+    return file_type_from_extension(os.path.splitext(file_path)[1].lower())
 
 
 def is_removable_file(file_path: str) -> bool:
@@ -77,203 +98,323 @@ def is_removable_file(file_path: str) -> bool:
 
 
 def safe_delete_file_optimized(file_path: str) -> bool:
-    """Supprime un fichier de manière sécurisée - Optimisé M1"""
+    """Supprime un fichier de manière sécurisée - Optimisé M1.
+
+    Un seul appel système: unlink échoue déjà si le chemin n'existe pas, sans stat préalable.
+    Un lien symbolique (même brisé) est supprimé lui-même, jamais sa cible.
+    """
     try:
-        if os.path.exists(file_path):
-            # Sur M1, utiliser la suppression système optimisée
-            if is_apple_silicon():
-                # Préférer unlink direct sur M1 pour les performances
-                os.unlink(file_path)
-            else:
-                os.remove(file_path)
-            return True
-        return False
-    except (OSError, IOError, PermissionError):
+        os.unlink(file_path)
+        return True
+    except OSError:  # FileNotFoundError, PermissionError, IsADirectoryError...
         return False
 
 
-def safe_delete_files_batch(file_paths: List[str], max_workers: int = None) -> Dict[str, bool]:
-    """Supprime plusieurs fichiers en parallèle - Optimisé M1"""
+def _delete_chunk(file_paths: List[str]) -> List[bool]:
+    """Supprime un lot de fichiers en séquence (exécuté dans un thread) - unlink en ligne,
+    un seul try par fichier, comme safe_delete_file_optimized"""
+    results = []
+    append = results.append
+    unlink = os.unlink
+    for path in file_paths:
+        try:
+            unlink(path)
+        except Exception:  # OSError, ou ValueError pour un chemin contenant un octet nul
+            append(False)
+        else:
+            append(True)
+    return results
+
+
+def safe_delete_files(file_paths: List[str], max_workers: int = None,
+                      progress_callback=None) -> List[bool]:
+    """Supprime plusieurs fichiers, succès dans l'ordre des chemins - Optimisé M1.
+    
+    Les chemins sont répartis en lots de DELETE_CHUNK_SIZE: une tâche par lot et non par
+    fichier, et aucun thread pour un seul lot. progress_callback(done, total) est appelé
+    une fois par lot terminé.
+    """
     if not max_workers:
         max_workers = min(os.cpu_count() or 8, 16) if is_apple_silicon() else 4
     
-    results = {}
-    
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_path = {
-            executor.submit(safe_delete_file_optimized, path): path 
-            for path in file_paths
-        }
-        
-        for future in concurrent.futures.as_completed(future_to_path):
-            path = future_to_path[future]
-            try:
-                success = future.result()
-                results[path] = success
-            except Exception:
-                results[path] = False
+    total = len(file_paths)
+    chunks = [file_paths[start:start + DELETE_CHUNK_SIZE]
+              for start in range(0, total, DELETE_CHUNK_SIZE)]
+    if len(chunks) <= 1 or max_workers == 1:
+        results = []
+        for chunk in chunks:
+            results.extend(_delete_chunk(chunk))
+            if progress_callback:
+                progress_callback(len(results), total)
+        return results
     
+    results = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+        for chunk_results in executor.map(_delete_chunk, chunks):
+            results.extend(chunk_results)
+            if progress_callback:
+                progress_callback(len(results), total)
     return results
 
 
+def safe_delete_files_batch(file_paths: List[str], max_workers: int = None) -> Dict[str, bool]:
+    """Supprime plusieurs fichiers en parallèle - Optimisé M1"""
+    return dict(zip(file_paths, safe_delete_files(file_paths, max_workers)))
+
+
+# Taille des blocs relus par la comparaison octet par octet
+COMPARE_CHUNK_SIZE = 1024 * 1024
+
+
+def files_identical(path_a: str, path_b: str) -> bool:
+    """Compare deux fichiers octet par octet (False si l'un est illisible).
+    
+    Les tailles sont comparées d'abord. Un petit fichier (un seul bloc) est lu d'un coup et
+    comparé par memcmp, sans lecture de fin de fichier; sinon les blocs sont lus par readinto
+    dans deux tampons réutilisés (aucune allocation par bloc) et la comparaison s'arrête au
+    premier bloc différent.
+    """
+    try:
+        with open(path_a, 'rb', buffering=0) as fa, open(path_b, 'rb', buffering=0) as fb:
+            size = os.fstat(fa.fileno()).st_size
+            if size != os.fstat(fb.fileno()).st_size:
+                return False
+            if size <= COMPARE_CHUNK_SIZE:
+                block = fa.read(size)
+                return len(block) == size and block == fb.read(size)
+            buffer_a, buffer_b = bytearray(COMPARE_CHUNK_SIZE), bytearray(COMPARE_CHUNK_SIZE)
+            view_a, view_b = memoryview(buffer_a), memoryview(buffer_b)
+            for offset in range(0, size, COMPARE_CHUNK_SIZE):
+                n = min(size - offset, COMPARE_CHUNK_SIZE)
+                if fa.readinto(view_a[:n]) != n or fb.readinto(view_b[:n]) != n:
+                    return False  # Lecture courte: fichier modifié pendant la comparaison
+                if n < COMPARE_CHUNK_SIZE:
+                    return buffer_a[:n] == buffer_b[:n]  # Dernier bloc partiel
+                if buffer_a != buffer_b:  # memcmp des tampons entiers, sans copie
+                    return False
+            return True
+    except OSError:
+        return False
+
+
+def safe_verify_duplicate_group(file_paths: List[str], max_workers: int = None) -> List[List[str]]:
+    """Répartit un groupe de doublons présumés (même hash) en classes de fichiers identiques
+    octet par octet, la classe du premier chemin en tête.
+    
+    Chaque classe compare ses candidats à son premier fichier en parallèle (lectures en C,
+    GIL relâché: des threads suffisent). Un fichier illisible forme sa propre classe.
+    """
+    classes = []
+    remaining = list(file_paths)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while remaining:
+            reference, candidates = remaining[0], remaining[1:]
+            identical = list(executor.map(functools.partial(files_identical, reference), candidates))
+            classes.append([reference, *itertools.compress(candidates, identical)])
+            remaining = [path for path, same in zip(candidates, identical) if not same]
+    return classes
+
+
 # Garde la fonction originale pour compatibilité
 def safe_delete_file(file_path: str) -> bool:
     """Fonction de compatibilité"""
     return safe_delete_file_optimized(file_path)
 
 
-def export_to_json_optimized(data: List[FileInfo], output_path: str) -> bool:
-    """Exporte les données vers un fichier JSON - Optimisé M1"""
+# Colonnes d'une ligne exportée: chemin, taille, hash, date de modification, périphérique, inode
+ExportRow = Tuple[str, int, Optional[str], float, Optional[int], Optional[int]]
+
+# Ligne d'un FileInfo lue en un seul appel C (champs en slots: lectures à offset fixe)
+_file_info_row = operator.attrgetter("path", "size", "hash_md5", "modified_time", "device_id", "inode")
+
+
+def _export_rows(data: Union[Iterable[FileInfo], FileBatch],
+                 hashes: Optional[Iterable[Optional[str]]] = None) -> Iterator[ExportRow]:
+    """Lignes à exporter, depuis des FileInfo ou directement depuis les colonnes d'un FileBatch
+    (zip en C sur les tableaux, aucun objet par fichier)"""
+    if isinstance(data, FileBatch):
+        return zip(data.paths, data.sizes, hashes if hashes is not None else itertools.repeat(None),
+                   map(ns_to_seconds, data.mtimes_ns), data.devices, data.inodes)
+    return map(_file_info_row, data)
+
+
+class _ExportCancelled(Exception):
+    """Export interrompu par stop_event avant la dernière ligne"""
+
+
+def _export_chunks(data, hashes, stop_event: Optional[threading.Event]) -> Iterator[List[ExportRow]]:
+    """Lignes par lots de EXPORT_CHUNK_ROWS - _ExportCancelled dès que stop_event est levé"""
+    rows = _export_rows(data, hashes)
+    while True:
+        if stop_event is not None and stop_event.is_set():
+            raise _ExportCancelled()
+        chunk = list(itertools.islice(rows, EXPORT_CHUNK_ROWS))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _discard_partial_export(output_path: str) -> bool:
+    """Supprime le fichier d'un export annulé (jamais de fichier tronqué d'apparence valide)"""
     try:
-        export_data = []
-        
-        # Traitement en parallèle pour les gros datasets sur M1
-        if is_apple_silicon() and len(data) > 1000:
-            def process_file_info(file_info: FileInfo) -> Dict:
-                return {
-                    "path": file_info.path,
-                    "size": file_info.size,
-                    "size_formatted": format_file_size(file_info.size),
-                    "hash_md5": file_info.hash_md5,
-                    "modified_time": file_info.modified_time,
-                    "device_id": getattr(file_info, 'device_id', None),
-                    "inode": getattr(file_info, 'inode', None)
-                }
-            
-            max_workers = min(os.cpu_count() or 8, 12)
-            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-                export_data = list(executor.map(process_file_info, data))
-        else:
-            # Traitement séquentiel pour les petits datasets
-            for file_info in data:
-                export_data.append({
-                    "path": file_info.path,
-                    "size": file_info.size,
-                    "size_formatted": format_file_size(file_info.size),
-                    "hash_md5": file_info.hash_md5,
-                    "modified_time": file_info.modified_time,
-                    "device_id": getattr(file_info, 'device_id', None),
-                    "inode": getattr(file_info, 'inode', None)
-                })
-        
-        # Écriture optimisée avec buffer plus grand sur M1
-        with open(output_path, 'w', encoding='utf-8', buffering=8192 if is_apple_silicon() else -1) as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        os.remove(output_path)
+    except OSError:
+        pass
+    return False
+
+
+def _export_record(row: ExportRow) -> Dict:
+    """Entrée JSON d'un fichier exporté"""
+    path, size, hash_md5, modified_time, device_id, inode = row
+    return {
+        "path": path,
+        "size": size,
+        "size_formatted": format_file_size(size),
+        "hash_md5": hash_md5,
+        "modified_time": modified_time,
+        "device_id": device_id,
+        "inode": inode
+    }
+
+
+if orjson is not None:
+    _json_dumps = orjson.dumps  # Entrée JSON directement en bytes UTF-8, encodeur en Rust
+else:
+    def _json_dumps(record: Dict) -> bytes:
+        """Entrée JSON encodée en UTF-8"""
+        return json.dumps(record, ensure_ascii=False).encode('utf-8')
+
+
+def export_to_json_stream(data: Union[Iterable[FileInfo], FileBatch], output_path: str,
+                          hashes: Optional[List[Optional[str]]] = None,
+                          stop_event: Optional[threading.Event] = None) -> bool:
+    """Exporte un itérable quelconque (liste, générateur d'un scanner) ou un FileBatch et ses
+    hashes vers un fichier JSON - écrit au fil de l'eau, par lots de lignes: seul le lot courant
+    est en mémoire"""
+    try:
+        with open(output_path, 'wb', buffering=EXPORT_BUFFER_SIZE) as f:
+            f.write(b"[")
+            separator = b"\n  "
+            for chunk in _export_chunks(data, hashes, stop_event):
+                f.write(separator)
+                f.write(b",\n  ".join(_json_dumps(_export_record(row)) for row in chunk))
+                separator = b",\n  "
+            f.write(b"\n]\n")
         
         return True
+    except _ExportCancelled:
+        return _discard_partial_export(output_path)
     except Exception:
         return False
 
 
-def export_to_csv_optimized(data: List[FileInfo], output_path: str) -> bool:
-    """Exporte les données vers un fichier CSV - Optimisé M1"""
+def export_to_json_optimized(data: Union[Iterable[FileInfo], FileBatch], output_path: str,
+                             hashes: Optional[List[Optional[str]]] = None,
+                             stop_event: Optional[threading.Event] = None) -> bool:
+    """Exporte les données (itérable de FileInfo ou FileBatch) vers un fichier JSON, sans
+    construire le document complet en mémoire.
+    
+    Aucun thread ni processus: la construction des entrées est du Python lié au GIL et
+    l'écriture dans un seul fichier est séquentielle, des workers ne feraient qu'ajouter
+    leur coût de coordination.
+    """
+    return export_to_json_stream(data, output_path, hashes, stop_event)
+
+
+def export_to_csv_optimized(data: Union[Iterable[FileInfo], FileBatch], output_path: str,
+                            hashes: Optional[List[Optional[str]]] = None,
+                            stop_event: Optional[threading.Event] = None) -> bool:
+    """Exporte les données (itérable de FileInfo ou FileBatch) vers un fichier CSV - écrit par
+    lots de lignes"""
     try:
-        # Buffer plus grand sur M1 pour les performances I/O
-        with open(output_path, 'w', newline='', encoding='utf-8', 
-                  buffering=8192 if is_apple_silicon() else -1) as f:
-            writer = csv.writer(f)
+        with open(output_path, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+            # Fin de ligne Unix plutôt que le '\r\n' par défaut du module csv: un octet de moins par ligne
+            writer = csv.writer(f, lineterminator='\n')
             writer.writerow(['Chemin', 'Taille (octets)', 'Taille', 'Hash MD5', 
                            'Date modification', 'Device ID', 'Inode'])
             
-            # Traitement par batch sur M1 pour optimiser les performances
-            if is_apple_silicon() and len(data) > 1000:
-                batch_size = 1000
-                for i in range(0, len(data), batch_size):
-                    batch = data[i:i + batch_size]
-                    rows = []
-                    for file_info in batch:
-                        rows.append([
-                            file_info.path,
-                            file_info.size,
-                            format_file_size(file_info.size),
-                            file_info.hash_md5 or '',
-                            file_info.modified_time,
-                            getattr(file_info, 'device_id', ''),
-                            getattr(file_info, 'inode', '')
-                        ])
-                    writer.writerows(rows)
-            else:
-                for file_info in data:
-                    writer.writerow([
-                        file_info.path,
-                        file_info.size,
-                        format_file_size(file_info.size),
-                        file_info.hash_md5 or '',
-                        file_info.modified_time,
-                        getattr(file_info, 'device_id', ''),
-                        getattr(file_info, 'inode', '')
-                    ])
+            # Lot transposé en colonnes puis recomposé par zip: toute la boucle par ligne reste en C
+            # (zip, map, lru_cache, writerows), sans bytecode Python par fichier. Le module csv
+            # écrit None comme ''
+            for chunk in _export_chunks(data, hashes, stop_event):
+                paths, sizes, digests, modified_times, device_ids, inodes = zip(*chunk)
+                writer.writerows(zip(paths, sizes, format_file_sizes(sizes), digests,
+                                     modified_times, device_ids, inodes))
         
         return True
+    except _ExportCancelled:
+        return _discard_partial_export(output_path)
     except Exception:
         return False
 
 
 # Fonctions de compatibilité
-def export_to_json(data: List[FileInfo], output_path: str) -> bool:
+def export_to_json(data: Union[Iterable[FileInfo], FileBatch], output_path: str,
+                   hashes: Optional[List[Optional[str]]] = None,
+                   stop_event: Optional[threading.Event] = None) -> bool:
     """Fonction de compatibilité"""
-    return export_to_json_optimized(data, output_path)
+    return export_to_json_optimized(data, output_path, hashes, stop_event)
 
 
-def export_to_csv(data: List[FileInfo], output_path: str) -> bool:
+def export_to_csv(data: Union[Iterable[FileInfo], FileBatch], output_path: str,
+                  hashes: Optional[List[Optional[str]]] = None,
+                  stop_event: Optional[threading.Event] = None) -> bool:
     """Fonction de compatibilité"""
-    return export_to_csv_optimized(data, output_path)
+    return export_to_csv_optimized(data, output_path, hashes, stop_event)
+
+
+def _txt_block(row: ExportRow) -> str:
+    """Bloc du rapport texte pour un fichier, composé en une seule chaîne"""
+    path, size, hash_md5, modified_time, _device_id, _inode = row
+    hash_line = f"Hash MD5: {hash_md5}\n" if hash_md5 else ""
+    return (f"Fichier: {path}\n"
+            f"Taille: {format_file_size(size)}\n"
+            f"{hash_line}"
+            f"Modifié: {modified_time}\n"
+            f"{'-' * 30}\n")
 
 
-def export_to_txt(data: List[FileInfo], output_path: str) -> bool:
-    """Exporte les données vers un fichier texte"""
+def export_to_txt(data: Union[Iterable[FileInfo], FileBatch], output_path: str,
+                  hashes: Optional[List[Optional[str]]] = None,
+                  stop_event: Optional[threading.Event] = None) -> bool:
+    """Exporte les données vers un fichier texte - une écriture par lot de fichiers"""
     try:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write("Rapport MacClean\n")
-            f.write("=" * 50 + "\n\n")
-            
-            for file_info in data:
-                f.write(f"Fichier: {file_info.path}\n")
-                f.write(f"Taille: {format_file_size(file_info.size)}\n")
-                if file_info.hash_md5:
-                    f.write(f"Hash MD5: {file_info.hash_md5}\n")
-                f.write(f"Modifié: {file_info.modified_time}\n")
-                f.write("-" * 30 + "\n")
+        with open(output_path, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+            f.write("Rapport MacClean\n" + "=" * 50 + "\n\n")
+            for chunk in _export_chunks(data, hashes, stop_event):
+                f.write("".join(map(_txt_block, chunk)))
         
         return True
+    except _ExportCancelled:
+        return _discard_partial_export(output_path)
     except Exception:
         return False
 
 
+@functools.lru_cache(maxsize=1)
+def _get_apple_silicon_cpu_info() -> Dict[str, Any]:
+    """Informations matérielles Apple Silicon via sysctlbyname - invariantes, lues une seule fois
+    et sans lancer de processus sysctl"""
+    cpu_info = {'brand': get_cpu_brand() or "Apple Silicon"}
+    
+    # Nombre de cœurs de performance et d'efficience, mémoire unifiée
+    for key, name in (('performance_cores', 'hw.perflevel0.logicalcpu'),
+                      ('efficiency_cores', 'hw.perflevel1.logicalcpu'),
+                      ('unified_memory', 'hw.memsize')):
+        value = sysctl_int(name)
+        if value is not None:
+            cpu_info[key] = value
+    
+    return cpu_info
+
+
 def get_system_info_m1_optimized() -> Dict[str, Any]:
     """Retourne les informations système - Optimisé pour M1/M2"""
     import platform
     import psutil
     
-    # Détection spéciale M1/M2
-    cpu_info = {}
-    if is_apple_silicon():
-        # Informations spécifiques Apple Silicon
-        try:
-            import subprocess
-            result = subprocess.run(['sysctl', '-n', 'machdep.cpu.brand_string'], 
-                                  capture_output=True, text=True)
-            cpu_info['brand'] = result.stdout.strip() if result.returncode == 0 else "Apple Silicon"
-            
-            # Nombre de cœurs de performance et d'efficience
-            result = subprocess.run(['sysctl', '-n', 'hw.perflevel0.logicalcpu'], 
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
-                cpu_info['performance_cores'] = int(result.stdout.strip())
-            
-            result = subprocess.run(['sysctl', '-n', 'hw.perflevel1.logicalcpu'], 
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
-                cpu_info['efficiency_cores'] = int(result.stdout.strip())
-                
-            # Mémoire unifiée
-            result = subprocess.run(['sysctl', '-n', 'hw.memsize'], 
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
-                cpu_info['unified_memory'] = int(result.stdout.strip())
-                
-        except Exception:
-            cpu_info['brand'] = "Apple Silicon"
+    # Détection spéciale M1/M2 (sysctl mis en cache, disque et mémoire relus à chaque appel)
+    cpu_info = dict(_get_apple_silicon_cpu_info()) if is_apple_silicon() else {}
     
     disk_usage = psutil.disk_usage('/')
     
@@ -2,12 +2,10 @@
 Configuration pour les tests pytest
 """
 
-import sys
 import os
-from pathlib import Path
+import pytest
 
-# Ajouter le répertoire src au Python path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Le répertoire src est ajouté au Python path par pytest (pythonpath dans pyproject.toml)
 
 def pytest_configure(config):
     """Configuration globale des tests"""
@@ -19,3 +17,14 @@ def pytest_configure(config):
         import PySide6
     except ImportError:
         config.option.markexpr = "not gui"
+
+
+@pytest.fixture(scope="session")
+def app():
+    """Fixture pour l'application Qt - une seule QApplication pour toute la session de tests
+    (réutilise celle déjà créée, par pytest-qt par exemple)"""
+    from PySide6.QtWidgets import QApplication
+    
+    if not QApplication.instance():
+        return QApplication([])
+    return QApplication.instance()
@@ -3,18 +3,15 @@ Tests unitaires pour les fonctionnalités de nettoyage
 """
 
 import os
+import sys
 import pytest
 import tempfile
-import shutil
 from pathlib import Path
 from unittest.mock import patch, Mock
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from macclean.core import (
     DuplicateFinder, CacheCleaner, OrphanedFilesFinder, 
-    LargeFilesFinder, FileInfo
+    LargeFilesFinder, FileInfo, FileBatch, HashDatabase
 )
 from macclean.utils import (
     format_file_size, safe_delete_file, export_to_json,
@@ -41,6 +38,22 @@ class TestFileInfo:
             
             os.unlink(tmp_file.name)
     
+    def test_file_info_single_stat(self):
+        """Test construction depuis le chemin: un seul lstat, aucun stat"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_file = Path(temp_dir) / "photo.jpg"
+            temp_file.write_bytes(b"jpeg")
+            
+            with patch("os.lstat", wraps=os.lstat) as mock_lstat, \
+                 patch("os.stat", wraps=os.stat) as mock_stat:
+                file_info = FileInfo(str(temp_file), 0)
+            
+            assert mock_lstat.call_count == 1
+            mock_stat.assert_not_called()
+            assert file_info.size == 4
+            assert file_info.file_type == "image"
+            assert file_info.is_removable is True
+    
     def test_file_info_nonexistent_file(self):
         """Test avec un fichier inexistant"""
         file_info = FileInfo("/nonexistent/file.txt", 100)
@@ -75,20 +88,129 @@ class TestFileInfo:
             
             assert broken_info.file_type == "symlink"
             assert not broken_info.is_removable  # Les liens brisés ne doivent pas être supprimables
+    
+    def test_file_info_slots(self):
+        """Test FileInfo sans __dict__ par instance"""
+        file_info = FileInfo("/nonexistent/file.txt", 10)
+        assert not hasattr(file_info, "__dict__")
+        file_info.hash_md5 = "abc"
+        assert file_info.hash_md5 == "abc"
+    
+    def test_file_info_from_stat(self):
+        """Test FileInfo construit depuis un lstat existant: mêmes champs, sans nouvel appel système"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "photo.jpg")
+            Path(path).write_bytes(b"x" * 10)
+            os.chmod(path, 0o444)
+            link = os.path.join(tmp_dir, "link")
+            os.symlink(path, link)
+            
+            expected = FileInfo(path, 0)
+            stat_result = os.lstat(path)
+            with patch("os.stat", side_effect=AssertionError), patch("os.lstat", side_effect=AssertionError):
+                file_info = FileInfo(path, 0, stat_result=stat_result)
+            assert file_info == expected
+            assert (file_info.size, file_info.file_type) == (10, "image")
+            assert file_info.is_removable == os.access(path, os.W_OK)
+            
+            assert FileInfo(link, 0, stat_result=os.lstat(link)).file_type == "symlink"
+            
+            # Construction différée: champs du stat seulement, classement à la demande
+            lazy = FileInfo.from_stat(path, stat_result)
+            assert (lazy.size, lazy.file_type, lazy.is_removable) == (10, None, None)
+            with patch("os.lstat", side_effect=AssertionError), patch("os.stat", side_effect=AssertionError):
+                lazy._finalize()  # Type par extension, droits par access: aucun stat
+            assert lazy == expected
+            
+            # Même règle de supprimabilité (os.access, ACL comprises) quel que soit le constructeur
+            with patch("os.access", return_value=False):
+                assert FileInfo(path, 0, stat_result=stat_result).is_removable is False
+                lazy = FileInfo.from_stat(path, stat_result)
+                lazy._finalize()
+                assert lazy.is_removable is False
+            lazy_link = FileInfo.from_stat(link, os.lstat(link))
+            assert lazy_link.file_type == "symlink"
+            lazy_link._finalize()
+            assert (lazy_link.file_type, lazy_link.is_removable) == ("symlink", expected.is_removable)
+
+
+class TestFileTypes:
+    """Tests pour la classification par extension"""
+    
+    def test_file_type_from_extension_cached(self):
+        """Test type par extension, calculé une fois par extension"""
+        from macclean.core import file_type_from_extension
+        from macclean.core.cleaner import _file_type_from_name
+        
+        file_type_from_extension.cache_clear()
+        paths = ["/a/photo.JPG", "/b/photo.jpg", "/c/clip.mp4", "/d/README", "/e/song.mp3"]
+        assert [_file_type_from_name(p) for p in paths] == ["image", "image", "video", "file", "audio"]
+        assert file_type_from_extension.cache_info().misses == 4
+
+
+class TestFileBatch:
+    """Tests pour le stockage en colonnes FileBatch"""
+    
+    def test_columns_and_grouping(self):
+        """Test colonnes, drapeaux et regroupement par taille"""
+        files = [
+            FileInfo("/nonexistent/a.png", 10, file_type="image"),
+            FileInfo("/nonexistent/b.txt", 20, is_removable=False),
+            FileInfo("/nonexistent/c.lnk", 10, file_type="symlink"),
+        ]
+        batch = FileBatch.from_file_infos(files)
+        
+        assert len(batch) == 3
+        assert batch.total_size() == 40
+        assert batch.total_size([0, 2]) == 20
+        assert [batch.file_type(i) for i in range(3)] == ["image", "file", "symlink"]
+        assert [batch.is_removable(i) for i in range(3)] == [True, False, True]
+        assert batch.group_indices_by_size() == {10: [0, 2], 20: [1]}
+        assert batch.group_indices_by_size(min_count=2) == {10: [0, 2]}
+
+        taken = batch.take([1, 0])
+        assert taken.paths == ["/nonexistent/b.txt", "/nonexistent/a.png"]
+        assert list(taken.sizes) == [20, 10]
+        assert [taken.file_type(i) for i in range(2)] == ["file", "image"]
+        assert taken.sizes.typecode == batch.sizes.typecode
+
+        batch.remove_range(0, 2)
+        assert len(batch) == 1
+        assert batch.paths == ["/nonexistent/c.lnk"]
+        assert batch.file_type(0) == "symlink"
+
+    def test_append_stat(self):
+        """Test lot construit depuis des stat, FileInfo reconstruit sans accès disque"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "song.mp3")
+            Path(path).write_bytes(b"x" * 10)
+            st = os.lstat(path)
+            
+            batch = FileBatch()
+            batch.append_stat(path, st)
+            assert (batch.file_type(0), batch.is_removable(0)) == (None, None)
+            batch.append_stat(path, st, "audio", True)
+            merged = FileBatch.from_file_infos([FileInfo("/nonexistent/a.txt", 5)])
+            merged.extend(batch)
+            
+            assert len(merged) == 3
+            assert (merged.devices[2], merged.inodes[2]) == (st.st_dev, st.st_ino)
+            with patch("os.stat", side_effect=AssertionError), patch("os.lstat", side_effect=AssertionError):
+                file_info = FileInfo.from_batch(merged, 2)
+            assert file_info == FileInfo(path, 0)
 
 
 class TestDuplicateFinder:
     """Tests pour DuplicateFinder"""
     
-    def setup_method(self):
-        """Configuration pour chaque test"""
-        self.test_dir = tempfile.mkdtemp()
+    @pytest.fixture(autouse=True)
+    def setup_test_dir(self, tmp_path):
+        """Configuration pour chaque test (tmp_path: purgé par pytest, sans rmtree par test)"""
+        # Sous-répertoire: les fichiers annexes d'un test (base de hash...) restent hors du scan
+        self.test_dir = str(tmp_path / "scan")
+        os.mkdir(self.test_dir)
         self.finder = DuplicateFinder()
     
-    def teardown_method(self):
-        """Nettoyage après chaque test"""
-        shutil.rmtree(self.test_dir, ignore_errors=True)
-    
     def test_calculate_md5(self):
         """Test du calcul MD5"""
         test_file = Path(self.test_dir) / "test.txt"
@@ -96,6 +218,102 @@ class TestDuplicateFinder:
         
         md5_hash = self.finder.calculate_md5(str(test_file))
         assert md5_hash == "b10a8db164e0754105b7a99be72e3fe5"
+        
+        # Gros fichier: haché depuis le mapping, sans boucle de lecture
+        import hashlib
+        from macclean.core import cleaner
+        content = os.urandom(4 * 1024 * 1024)
+        big_file = Path(self.test_dir) / "big.bin"
+        big_file.write_bytes(content)
+        with patch.object(cleaner, "_hash_stream", side_effect=AssertionError):
+            assert self.finder.calculate_md5(str(big_file)) == hashlib.md5(content).hexdigest()
+
+    @pytest.mark.parametrize("algorithm", ["md5", "sha256", "blake3", "xxh3_128"])
+    def test_calculate_hash_algorithms(self, algorithm):
+        """Test de chaque backend de hash (lecture directe et mmap) contre son implémentation
+        de référence"""
+        import hashlib
+        from macclean.core import M1OptimizedDuplicateFinder
+        if algorithm == "blake3":
+            reference = pytest.importorskip("blake3").blake3
+        elif algorithm == "xxh3_128":
+            reference = pytest.importorskip("xxhash").xxh3_128
+        else:
+            def reference(data):
+                return hashlib.new(algorithm, data)
+        finder = M1OptimizedDuplicateFinder(hash_algorithm=algorithm)
+
+        for name, content in [("small.bin", b"Hello World"), ("big.bin", os.urandom(200 * 1024))]:
+            test_file = Path(self.test_dir) / name
+            test_file.write_bytes(content)
+            assert finder.calculate_hash(str(test_file)) == reference(content).hexdigest()
+
+    def test_calculate_hash(self):
+        """Test du hash rapide utilisé pour la détection (lecture directe et mmap)"""
+        import hashlib
+        self.finder.hash_algorithm = "sha256"
+        
+        for name, content in [("small.bin", b"Hello World"), ("big.bin", b"x" * (200 * 1024))]:
+            test_file = Path(self.test_dir) / name
+            test_file.write_bytes(content)
+            assert self.finder.calculate_hash(str(test_file)) == hashlib.sha256(content).hexdigest()
+        
+        # Gros fichier haché par plusieurs fenêtres de mapping
+        import mmap
+        with patch("macclean.core.cleaner.MMAP_WINDOW_SIZE", mmap.ALLOCATIONGRANULARITY * 3):
+            assert self.finder.calculate_hash(str(test_file)) == hashlib.sha256(content).hexdigest()
+        
+        # Sans mmap possible: lecture par blocs dans le tampon réutilisé
+        with patch("mmap.mmap", side_effect=OSError):
+            assert self.finder.calculate_hash(str(test_file)) == hashlib.sha256(content).hexdigest()
+    
+    def test_calculate_hash_blake3_threaded(self):
+        """Test BLAKE3 multithread sur gros fichier: même résultat qu'en un seul appel"""
+        blake3 = pytest.importorskip("blake3")
+        from macclean.core import M1OptimizedDuplicateFinder
+        finder = M1OptimizedDuplicateFinder(hash_algorithm="blake3")
+        
+        content = os.urandom(9 * 1024 * 1024)
+        test_file = Path(self.test_dir) / "big.bin"
+        test_file.write_bytes(content)
+        assert finder.calculate_hash(str(test_file)) == blake3.blake3(content).hexdigest()
+    
+    def test_commoncrypto_sha256(self):
+        """Test SHA-256 CommonCrypto (macOS Apple Silicon uniquement)"""
+        import hashlib
+        from macclean.core import _ccrypto
+        if not _ccrypto.AVAILABLE:
+            pytest.skip("CommonCrypto indisponible sur cette plateforme")
+        
+        hasher = _ccrypto.CCSHA256()
+        hasher.update(b"Hello ")
+        hasher.update(bytearray(b"World"))
+        assert hasher.hexdigest() == hashlib.sha256(b"Hello World").hexdigest()
+    
+    def test_split_by_fingerprint(self):
+        """Test du pré-filtre début+fin avant le hash complet"""
+        from macclean.core import FileInfo
+        size = 3 * 4096
+        contents = {
+            "a.bin": b"a" * size,
+            "b.bin": b"a" * size,
+            "c.bin": b"b" + b"a" * (size - 1),  # Début différent
+            "d.bin": b"a" * 4096 + b"z" * 4096 + b"a" * 4096,  # Seul le milieu diffère
+        }
+        group = []
+        for name, content in contents.items():
+            test_file = Path(self.test_dir) / name
+            test_file.write_bytes(content)
+            group.append(FileInfo(path=str(test_file), size=size))
+        
+        sub_groups = self.finder.split_by_fingerprint(group)
+        assert len(sub_groups) == 1
+        assert sorted(Path(f.path).name for f in sub_groups[0]) == ["a.bin", "b.bin", "d.bin"]
+        
+        # Le hash complet départage les fichiers qui ne diffèrent qu'au milieu
+        duplicates = self.finder.scan_directory(self.test_dir)
+        assert len(duplicates) == 1
+        assert sorted(Path(f.path).name for f in duplicates[0]) == ["a.bin", "b.bin"]
     
     def test_calculate_md5_nonexistent(self):
         """Test MD5 avec fichier inexistant"""
@@ -125,6 +343,357 @@ class TestDuplicateFinder:
         duplicates = self.finder.scan_directory(self.test_dir)
         assert len(duplicates) == 1
         assert len(duplicates[0]) == 2
+
+    def test_scan_skips_unique_sizes(self):
+        """Test détection en étapes: taille unique jamais ouverte, empreinte différente jamais
+        hachée en entier"""
+        from macclean.core import cleaner
+        contents = {
+            "one.txt": b"x" * 5, "two.txt": b"x" * 6,
+            "dup1.txt": b"Identical content", "dup2.txt": b"Identical content",
+            "near.txt": b"Xdentical content",
+        }
+        for name, content in contents.items():
+            (Path(self.test_dir) / name).write_bytes(content)
+
+        fingerprinted, hashed = [], []
+        block_fingerprint, hash_file = cleaner._block_fingerprint, cleaner._hash_file
+        with patch.object(cleaner, "_block_fingerprint",
+                          side_effect=lambda path, *a: fingerprinted.append(path) or block_fingerprint(path, *a)), \
+             patch.object(cleaner, "_hash_file",
+                          side_effect=lambda path, *a: hashed.append(path) or hash_file(path, *a)):
+            duplicates = self.finder.scan_directory(self.test_dir)
+
+        names = lambda paths: sorted(Path(p).name for p in paths)
+        assert names(fingerprinted) == ["dup1.txt", "dup2.txt", "near.txt"]
+        assert names(hashed) == ["dup1.txt", "dup2.txt"]
+        assert [names(f.path for f in group) for group in duplicates] == [["dup1.txt", "dup2.txt"]]
+
+    def test_scan_differs_at_head_no_hash(self):
+        """Test gros fichiers différents dès le premier bloc: ni bloc de fin lu, ni hash complet"""
+        from macclean.core import cleaner
+        size = 2 * 1024 * 1024  # Au-dessus de LOCKSTEP_MIN_SIZE
+        for name, head in (("a.bin", b"a"), ("b.bin", b"b")):
+            (Path(self.test_dir) / name).write_bytes(b"x" * 10 + head + b"x" * (size - 11))
+        
+        offsets = []
+        block_fingerprint = cleaner._block_fingerprint
+        with patch.object(cleaner, "_block_fingerprint",
+                          side_effect=lambda path, offset: offsets.append(offset) or block_fingerprint(path, offset)), \
+             patch.object(cleaner, "_hash_file", side_effect=AssertionError), \
+             patch.object(cleaner, "_hash_group_lockstep", side_effect=AssertionError):
+            assert self.finder.scan_directory(self.test_dir) == []
+        assert offsets == [0, 0]
+
+    def test_scan_directory_stop_event(self):
+        """Test arrêt du scan demandé avant son démarrage"""
+        import threading
+        for name in ("file1.txt", "file2.txt"):
+            (Path(self.test_dir) / name).write_text("Identical content")
+        
+        stop_event = threading.Event()
+        stop_event.set()
+        assert self.finder.scan_directory(self.test_dir, stop_event=stop_event) == []
+    
+    def test_stop_event_during_walk_and_hash(self):
+        """Test arrêt demandé pendant le parcours puis pendant le hash: la suite n'est pas traitée"""
+        import threading
+        from macclean.core import M1OptimizedDuplicateFinder
+        from macclean.core.cleaner import _hash_group_lockstep, _list_directory, _walk_files_parallel
+        for i in range(3):
+            sub = Path(self.test_dir) / f"d{i}"
+            sub.mkdir()
+            (sub / "f.txt").write_text("x")
+        (Path(self.test_dir) / "root.txt").write_text("x")
+        
+        # Parcours: arrêt après le premier répertoire, les sous-répertoires ne sont pas listés
+        stop_event = threading.Event()
+        listed = []
+        
+        def list_then_stop(path):
+            listed.append(path)
+            stop_event.set()
+            return _list_directory(path)
+        
+        entries = _walk_files_parallel(self.test_dir, 2, list_directory=list_then_stop, stop_event=stop_event)
+        assert listed == [self.test_dir]
+        assert [entry.name for entry in entries] == ["root.txt"]
+        
+        # Hash: arrêt après le premier fichier, les calculs en attente sont annulés
+        paths = []
+        for i in range(10):
+            path = Path(self.test_dir) / f"file{i}.bin"
+            path.write_bytes(b"same")
+            paths.append(str(path))
+        finder = M1OptimizedDuplicateFinder(max_workers=1)
+        stop_event = threading.Event()
+        with patch.object(finder, "_hash_path", wraps=finder._hash_path) as mock_hash:
+            results = finder.calculate_md5_batch(paths, on_hashed=lambda path, digest: stop_event.set(),
+                                                 stop_event=stop_event)
+        assert len(results) == 1
+        assert mock_hash.call_count < len(paths)
+        
+        # Hash bloc par bloc: arrêt lu avant chaque bloc
+        assert _hash_group_lockstep(paths[:2], "md5", 1, stop_event=stop_event) == {}
+        
+        # Scan: arrêt à la première progression du hash, aucun groupe produit
+        stop_event = threading.Event()
+        
+        def progress(done, total):
+            if total:
+                stop_event.set()
+        
+        assert self.finder.scan_directory(self.test_dir, progress, stop_event=stop_event) == []
+        assert stop_event.is_set()
+    
+    def test_soc_tuning(self):
+        """Test réglages chunk_size/workers selon le modèle de SoC"""
+        from macclean.core import M1OptimizedDuplicateFinder, _tuning
+        with patch.object(_tuning, "get_cpu_brand", return_value="Apple M1 Pro"):
+            finder = M1OptimizedDuplicateFinder()
+            assert (finder.chunk_size, finder.max_workers) == (64 * 1024, 8)
+            assert finder.hash_threads == 2 * (os.cpu_count() or 8)
+            finder = M1OptimizedDuplicateFinder(max_workers=3)
+            assert (finder.max_workers, finder.hash_threads) == (3, 3)
+        
+        with patch.object(_tuning, "get_cpu_brand", return_value="Processeur inconnu"):
+            assert _tuning.get_soc_tuning() is None
+    
+    def test_sysctl_without_processes(self):
+        """Test lecture sysctl par sysctlbyname: aucun processus, None hors macOS"""
+        from macclean.core import _tuning
+        from macclean.utils import helpers
+        
+        if _tuning._libc is None:
+            assert _tuning.sysctl_string("machdep.cpu.brand_string") is None
+            assert _tuning.sysctl_int("hw.memsize") is None
+        else:
+            assert _tuning.sysctl_int("hw.memsize") > 0
+        
+        values = {"hw.perflevel0.logicalcpu": 8, "hw.memsize": 16 << 30}
+        with patch.object(helpers, "get_cpu_brand", return_value="Apple M1 Pro"), \
+                patch.object(helpers, "sysctl_int", side_effect=values.get), \
+                patch("subprocess.run") as mock_run:
+            helpers._get_apple_silicon_cpu_info.cache_clear()
+            try:
+                cpu_info = helpers._get_apple_silicon_cpu_info()
+            finally:
+                helpers._get_apple_silicon_cpu_info.cache_clear()
+        assert cpu_info == {"brand": "Apple M1 Pro", "performance_cores": 8, "unified_memory": 16 << 30}
+        mock_run.assert_not_called()
+    
+    def test_parallel_walk(self):
+        """Test parcours par file partagée: 4 threads sur macOS, chaque fichier une seule fois"""
+        from macclean.core import M1OptimizedDuplicateFinder
+        from macclean.core.cleaner import _walk_files_parallel
+        with patch.object(sys, "platform", "darwin"):
+            finder = M1OptimizedDuplicateFinder(max_workers=16)
+            assert (finder.walk_workers, finder.max_workers) == (4, 16)
+        
+        expected = set()
+        for i in range(5):
+            for j in range(i * 3):
+                path = Path(self.test_dir) / f"d{i}" / f"s{j % 2}" / f"f{j}.txt"
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text("x")
+                expected.add(str(path))
+        
+        paths = [entry.path for entry in _walk_files_parallel(self.test_dir, 3)]
+        assert len(paths) == len(expected) and set(paths) == expected
+        skipped = _walk_files_parallel(self.test_dir, 3, skip_dir=lambda d: d.endswith("s1"))
+        assert {entry.path for entry in skipped} == {p for p in expected if "/s1/" not in p}
+    
+    def test_calculate_md5_batch_processes(self):
+        """Test hash dans un pool de processus: mêmes résultats que les threads"""
+        from macclean.core import M1OptimizedDuplicateFinder
+        paths = []
+        for i in range(10):
+            test_file = Path(self.test_dir) / f"file{i}.bin"
+            test_file.write_bytes(b"content %d" % (i % 2))
+            paths.append(str(test_file))
+        
+        progress = []
+        finder = M1OptimizedDuplicateFinder(max_workers=2, hash_algorithm="sha256", use_processes=True)
+        results = finder.calculate_md5_batch(paths, lambda done, total: progress.append((done, total)))
+        
+        assert results == {path: finder.calculate_hash(path) for path in paths}
+        assert results[paths[0]] == results[paths[2]] != results[paths[1]]
+        assert progress[-1] == (10, 10)
+        
+        # Petit lot: pas de pool de processus, ni même de threads
+        with patch("concurrent.futures.ProcessPoolExecutor") as mock_pool, \
+             patch("concurrent.futures.ThreadPoolExecutor", side_effect=AssertionError):
+            assert finder.calculate_md5_batch(paths[:2]) == {p: results[p] for p in paths[:2]}
+            mock_pool.assert_not_called()
+    
+    def test_parallel_scan_matches_serial(self):
+        """Test scan avec un seul worker ou plusieurs: mêmes groupes de doublons"""
+        for i in range(12):
+            (Path(self.test_dir) / f"file{i}.bin").write_bytes(b"content %d" % (i % 3))
+        
+        def groups(finder):
+            return sorted(sorted(Path(f.path).name for f in group)
+                          for group in finder.scan_directory(self.test_dir))
+        
+        serial = groups(DuplicateFinder(max_workers=1))
+        assert len(serial) == 3
+        assert groups(DuplicateFinder(max_workers=8)) == serial
+    
+    def test_hash_groups_lockstep(self):
+        """Test hash bloc par bloc des gros fichiers de même taille"""
+        import hashlib
+        size = 2 * 1024 * 1024
+        contents = {
+            "a.bin": b"x" * size,
+            "b.bin": b"x" * size,
+            "c.bin": b"x" * (size // 2) + b"y" + b"x" * (size // 2 - 1),  # Diffère au milieu
+        }
+        for name, content in contents.items():
+            (Path(self.test_dir) / name).write_bytes(content)
+        
+        self.finder.hash_algorithm = "sha256"
+        group = [FileInfo(str(Path(self.test_dir) / name), size) for name in contents]
+        results = self.finder.hash_groups_lockstep([group])
+        
+        expected = hashlib.sha256(contents["a.bin"]).hexdigest()
+        assert results == {group[0].path: expected, group[1].path: expected}
+        
+        duplicates = self.finder.scan_directory(self.test_dir)
+        assert [sorted(Path(f.path).name for f in g) for g in duplicates] == [["a.bin", "b.bin"]]
+    
+    @pytest.mark.skipif(not hasattr(os, "posix_fadvise"), reason="posix_fadvise indisponible")
+    def test_hash_releases_page_cache(self):
+        """Test gros fichiers hachés (seuls ou bloc par bloc): pages libérées après lecture"""
+        paths = []
+        for name in ("a.bin", "b.bin"):
+            path = Path(self.test_dir) / name
+            path.write_bytes(b"x" * (2 * 1024 * 1024))
+            paths.append(str(path))
+        
+        self.finder.hash_algorithm = "sha256"
+        with patch("os.posix_fadvise") as mock_fadvise:
+            self.finder.calculate_hash(paths[0])
+            self.finder.hash_groups_lockstep([[FileInfo(p, 2 * 1024 * 1024) for p in paths]])
+        advices = [call.args[3] for call in mock_fadvise.call_args_list]
+        assert advices.count(os.POSIX_FADV_DONTNEED) == 3
+        assert advices.count(os.POSIX_FADV_SEQUENTIAL) == 3
+    
+    def test_hash_database(self, tmp_path):
+        """Test base de hash persistante: un second scan ne relit pas les fichiers inchangés"""
+        import hashlib
+        
+        paths = [Path(self.test_dir) / name for name in ("file1.txt", "file2.txt")]
+        for path in paths:
+            path.write_text("Identical content")
+        
+        hash_db = HashDatabase(str(tmp_path / "hashdb.sqlite"))
+        try:
+            finder = DuplicateFinder(hash_db=hash_db)
+            digest = finder.scan_directory(self.test_dir)[0][0].hash_md5
+            
+            with patch("macclean.core.cleaner._hash_file", side_effect=AssertionError) as mock_hash:
+                # Cache mémoire du même finder, puis base persistante pour un nouveau finder
+                for scanner in (finder, DuplicateFinder(hash_db=hash_db)):
+                    assert [len(group) for group in scanner.scan_directory(self.test_dir)] == [2]
+                    assert scanner.calculate_hash(str(paths[0])) == digest
+                mock_hash.assert_not_called()
+            
+            # Contenu modifié à taille égale: la mtime change, le hash est recalculé
+            paths[1].write_text("Different content")
+            stat = paths[1].stat()
+            os.utime(paths[1], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            assert finder.scan_directory(self.test_dir) == []
+            assert finder.calculate_md5(str(paths[0])) == hashlib.md5(b"Identical content").hexdigest()
+        finally:
+            hash_db.close()
+        
+        # Graine de hash tirée une fois et conservée avec la base
+        reopened = HashDatabase(str(tmp_path / "hashdb.sqlite"))
+        try:
+            assert reopened.seed == hash_db.seed == finder.hash_seed
+            assert DuplicateFinder().hash_seed == 0
+        finally:
+            reopened.close()
+    
+    def test_resume_after_interrupt(self, tmp_path):
+        """Test scan interrompu pendant le hash: les hash obtenus sont déjà en base, le scan
+        suivant ne relit que le reste"""
+        from macclean.core import cleaner
+        
+        class Interrupted(BaseException):
+            pass
+        
+        for i in range(20):  # 20 paires de doublons, une taille par paire
+            for name in (f"a{i}.txt", f"b{i}.txt"):
+                (Path(self.test_dir) / name).write_bytes(b"x" * (10 + i))
+        
+        hash_file = cleaner._hash_file
+        calls = []
+        
+        def crash_after_20(path, *args):
+            calls.append(path)
+            if len(calls) > 20:
+                raise Interrupted
+            return hash_file(path, *args)
+        
+        hash_db = HashDatabase(str(tmp_path / "hashdb.sqlite"))
+        try:
+            with patch.object(cleaner, "HASH_DB_FLUSH_SIZE", 8), \
+                 patch.object(cleaner, "_hash_file", side_effect=crash_after_20):
+                with pytest.raises(Interrupted):
+                    DuplicateFinder(hash_db=hash_db, max_workers=1).scan_directory(self.test_dir)
+            
+            calls.clear()
+            with patch.object(cleaner, "_hash_file", side_effect=lambda path, *args: calls.append(path) or hash_file(path, *args)):
+                duplicates = DuplicateFinder(hash_db=hash_db).scan_directory(self.test_dir)
+            assert len(duplicates) == 20
+            assert len(calls) == 20
+        finally:
+            hash_db.close()
+    
+    def test_md5_cache_hit(self, tmp_path):
+        """Test hash déjà en base: second calcul sans lecture, recherche groupée par lots"""
+        from macclean.core import hashdb
+        test_file = Path(self.test_dir) / "file.txt"
+        test_file.write_text("Hello World")
+        
+        hash_db = HashDatabase(str(tmp_path / "hashdb.sqlite"))
+        try:
+            first = DuplicateFinder(hash_db=hash_db).calculate_md5(str(test_file))
+            with patch("macclean.core.cleaner._hash_file", side_effect=AssertionError):
+                assert DuplicateFinder(hash_db=hash_db).calculate_md5(str(test_file)) == first
+            
+            # Plusieurs lots, liens physiques et clé périmée (taille changée)
+            link = Path(self.test_dir) / "link.txt"
+            os.link(test_file, link)
+            key = hashdb.file_key(str(test_file))
+            stale = (key[0], key[1], key[2] + 1, key[3])
+            keys = {str(test_file): key, str(link): key, "/stale": stale, "/absent": (key[0], key[1] + 1, 1, 1)}
+            with patch.object(hashdb, "LOOKUP_BATCH_SIZE", 1):
+                assert hash_db.lookup_many(keys, "md5") == {str(test_file): first, str(link): first}
+        finally:
+            hash_db.close()
+    
+    def test_scan_nested_directories_once(self):
+        """Test chaque fichier des sous-répertoires n'est collecté qu'une fois"""
+        for name in ("file1.txt", "sub/file2.txt", "sub/deep/file3.txt", ".hidden/file4.txt"):
+            path = Path(self.test_dir) / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("Identical content")
+        
+        duplicates = self.finder.scan_directory(self.test_dir)
+        assert len(duplicates) == 1
+        assert len({f.path for f in duplicates[0]}) == len(duplicates[0]) == 4
+        assert all(f.file_type == "file" and f.is_removable is not None for f in duplicates[0])
+    
+    def test_iter_duplicates(self):
+        """Test production des groupes de doublons par générateur"""
+        for name in ("file1.txt", "file2.txt"):
+            (Path(self.test_dir) / name).write_text("Identical content")
+        
+        groups = self.finder.iter_duplicates_optimized(self.test_dir)
+        assert not isinstance(groups, list)
+        assert [len(group) for group in groups] == [2]
     
     def test_scan_directory_with_progress_callback(self):
         """Test scan avec callback de progression"""
@@ -139,6 +708,19 @@ class TestDuplicateFinder:
         self.finder.scan_directory(self.test_dir, progress_callback)
         # Le callback peut être appelé ou non selon le nombre de fichiers
         # On vérifie juste qu'il n'y a pas d'erreur
+    
+    def test_progress_callback_is_throttled(self):
+        """Test progression du hash limitée à PROGRESS_STEPS appels, dernier appel complet"""
+        from macclean.core.cleaner import PROGRESS_STEPS
+        
+        for i in range(1000):
+            (Path(self.test_dir) / f"file{i}.txt").write_text("Identical content")
+        
+        progress_calls = []
+        duplicates = self.finder.scan_directory(self.test_dir, lambda *args: progress_calls.append(args))
+        assert [len(group) for group in duplicates] == [1000]
+        assert len(progress_calls) <= PROGRESS_STEPS + 10
+        assert progress_calls[-1] == (1000, 1000)
 
 
 class TestCacheCleaner:
@@ -149,6 +731,34 @@ class TestCacheCleaner:
         cleaner = CacheCleaner()
         assert isinstance(cleaner.cache_directories, list)
     
+    def test_scan_cache_files_stop_event(self, tmp_path):
+        """Test scan cache arrêté: parcours interrompu avant le répertoire suivant, liste vide"""
+        import asyncio
+        import threading
+        from macclean.core.cleaner import _list_directory, _walk_files_async
+        for name in ("a", "b"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "cache.tmp").write_text("x")
+        (tmp_path / "root.tmp").write_text("x")
+        
+        stop_event = threading.Event()
+        listed = []
+        
+        def list_then_stop(path):
+            listed.append(path)
+            stop_event.set()
+            return _list_directory(path)
+        
+        entries = asyncio.run(_walk_files_async(str(tmp_path), asyncio.Semaphore(4), None, list_then_stop,
+                                                stop_event=stop_event))
+        assert listed == [str(tmp_path)]
+        assert [entry.name for entry in entries] == ["root.tmp"]
+        
+        cleaner = CacheCleaner()
+        cleaner.cache_directories = [str(tmp_path)]
+        assert len(cleaner.scan_cache_files()) == 3
+        assert cleaner.scan_cache_files(stop_event=stop_event) == []
+    
     @patch('platform.system')
     def test_get_cache_directories_macos(self, mock_system):
         """Test détection répertoires cache macOS"""
@@ -173,6 +783,43 @@ class TestCacheCleaner:
         cache_dirs = cleaner._get_cache_directories()
         assert any(".cache" in d for d in cache_dirs)
     
+    def test_cache_dirs_memoized(self):
+        """Test liste des répertoires candidats calculée une fois par OS, existence revérifiée"""
+        from macclean.core import cleaner as cleaner_module
+        
+        cleaner_module._cache_dir_candidates.cache_clear()
+        # Racines gardées telles quelles: le dossier temporaire peut se trouver sous /tmp
+        with tempfile.TemporaryDirectory() as temp_dir, \
+             patch("platform.system", return_value="Linux"), \
+             patch("pathlib.Path.home", return_value=Path(temp_dir)), \
+             patch.object(cleaner_module, "_independent_roots", side_effect=list):
+            cache_dir = str(Path(temp_dir) / ".cache")
+            assert cache_dir not in CacheCleaner().cache_directories
+            
+            os.mkdir(cache_dir)
+            for _ in range(100):
+                cleaner = CacheCleaner()
+            assert cache_dir in cleaner.cache_directories
+        
+        info = cleaner_module._cache_dir_candidates.cache_info()
+        assert info.misses == 1 and info.hits == 100
+    
+    def test_cache_roots_without_overlap(self):
+        """Test racines de cache imbriquées parcourues une seule fois"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            nested = Path(temp_dir) / "Caches" / "com.apple.dt.Xcode"
+            nested.mkdir(parents=True)
+            (nested / "cache_file.tmp").write_text("cache content")
+            
+            from macclean.core.cleaner import _independent_roots
+            roots = _independent_roots([str(nested), str(nested.parent), str(nested.parent)])
+            assert roots == [os.path.realpath(nested.parent)]
+            
+            cleaner = CacheCleaner()
+            cleaner.is_apple_silicon = False  # Pas de filtre des caches récents
+            cleaner.cache_directories = roots
+            assert len(cleaner.scan_cache_files()) == 1
+    
     def test_scan_cache_files(self):
         """Test scan des fichiers cache"""
         cleaner = CacheCleaner()
@@ -193,15 +840,14 @@ class TestCacheCleaner:
 class TestLargeFilesFinder:
     """Tests pour LargeFilesFinder"""
     
-    def setup_method(self):
-        """Configuration pour chaque test"""
-        self.test_dir = tempfile.mkdtemp()
+    @pytest.fixture(autouse=True)
+    def setup_test_dir(self, tmp_path):
+        """Configuration pour chaque test (tmp_path: purgé par pytest, sans rmtree par test)"""
+        # Sous-répertoire: les fichiers annexes d'un test (base de hash...) restent hors du scan
+        self.test_dir = str(tmp_path / "scan")
+        os.mkdir(self.test_dir)
         self.finder = LargeFilesFinder(min_size_mb=1)  # 1MB min
     
-    def teardown_method(self):
-        """Nettoyage après chaque test"""
-        shutil.rmtree(self.test_dir, ignore_errors=True)
-    
     def test_find_large_files_empty_dir(self):
         """Test avec répertoire vide"""
         large_files = self.finder.find_large_files(self.test_dir)
@@ -225,6 +871,183 @@ class TestLargeFilesFinder:
         large_files = self.finder.find_large_files(self.test_dir)
         assert len(large_files) == 1
         assert large_files[0].path == str(large_file)
+    
+    def test_find_large_files_nested(self):
+        """Test parcours récursif: fichiers comptés une fois, répertoires exclus ignorés"""
+        content = b"x" * (1024 * 1024 + 1)
+        nested_file = Path(self.test_dir) / "a" / "b" / "nested.bin"
+        nested_file.parent.mkdir(parents=True)
+        nested_file.write_bytes(content)
+        
+        excluded_file = Path(self.test_dir) / "node_modules" / "dep.bin"
+        excluded_file.parent.mkdir()
+        excluded_file.write_bytes(content)
+        
+        large_files = self.finder.find_large_files(self.test_dir)
+        assert [f.path for f in large_files] == [str(nested_file)]
+    
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="mkfifo indisponible")
+    def test_finders_skip_special_files(self):
+        """Test FIFO et lien brisé écartés au listage, sans ouverture ni stat supplémentaire"""
+        from macclean.core.cleaner import _list_directory
+        
+        large_file = Path(self.test_dir) / "large.bin"
+        large_file.write_bytes(b"x" * (1024 * 1024 + 1))
+        os.mkfifo(Path(self.test_dir) / "pipe")  # Une ouverture bloquerait le test
+        (Path(self.test_dir) / "broken").symlink_to(Path(self.test_dir) / "missing")
+        
+        files, subdirs = _list_directory(self.test_dir)
+        assert [entry.path for entry in files] == [str(large_file)] and subdirs == []
+        
+        assert [f.path for f in self.finder.find_large_files(self.test_dir)] == [str(large_file)]
+        (Path(self.test_dir) / "copy.bin").write_bytes(large_file.read_bytes())
+        [group] = DuplicateFinder().scan_directory(self.test_dir)
+        assert sorted(f.path for f in group) == sorted([str(large_file), str(Path(self.test_dir) / "copy.bin")])
+    
+    def test_find_large_files_scandir_rs_single_stat(self):
+        """Test parcours scandir-rs: un seul lstat par gros fichier, champs tous renseignés"""
+        import macclean.core.cleaner as cleaner
+        
+        large_file = Path(self.test_dir) / "movie.mp4"
+        large_file.write_bytes(b"x" * (1024 * 1024 + 1))
+        entry = Mock(is_file=True, st_size=1024 * 1024 + 1, path="movie.mp4")
+        
+        with patch.object(cleaner, "Scandir", Mock(return_value=[entry]), create=True), \
+                patch.object(cleaner, "ReturnType", Mock(), create=True), \
+                patch.object(cleaner.os, "lstat", wraps=os.lstat) as mock_lstat, \
+                patch.object(cleaner.os.path, "islink") as mock_islink:
+            large_files = self.finder._find_large_files_scandir_rs(self.test_dir)
+        
+        [file_info] = large_files
+        assert (file_info.path, file_info.size, file_info.file_type) == (str(large_file), 1024 * 1024 + 1, "video")
+        assert file_info.mtime_ns == large_file.stat().st_mtime_ns
+        mock_lstat.assert_called_once_with(str(large_file))
+        mock_islink.assert_not_called()
+    
+    def test_find_large_files_scandir_rs_prunes_excluded(self):
+        """Test parcours scandir-rs: répertoires exclus élagués pendant le parcours, pas après"""
+        scandir_rs = pytest.importorskip("scandir_rs")
+        import macclean.core.cleaner as cleaner
+        
+        for relative in ("keep/big.bin", "node_modules/pkg/big.bin", "src/.git/objects/big.bin"):
+            path = Path(self.test_dir) / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b"x" * (1024 * 1024 + 1))
+        
+        with patch.object(cleaner, "Scandir", wraps=scandir_rs.Scandir) as mock_scandir, \
+                patch.object(self.finder, "_should_skip_directory", return_value=False):
+            large_files = self.finder._find_large_files_scandir_rs(self.test_dir)
+        
+        assert [f.path for f in large_files] == [str(Path(self.test_dir) / "keep" / "big.bin")]
+        assert mock_scandir.call_args.kwargs["dir_exclude"] == self.finder._exclude_globs
+    
+    @pytest.mark.parametrize("backend", ["scandir_rs", "python"])
+    def test_find_large_files_root_inside_excluded_tree(self, backend):
+        """Test racine choisie sous un répertoire exclu: mêmes fichiers quel que soit le parcours,
+        seules les exclusions sous la racine comptent"""
+        import macclean.core.cleaner as cleaner
+        if backend == "scandir_rs":
+            pytest.importorskip("scandir_rs")
+        
+        root = Path(self.test_dir) / "project" / ".venv"
+        for relative in ("big.bin", "lib/big.bin", "lib/node_modules/big.bin"):
+            path = root / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b"x" * (1024 * 1024 + 1))
+        
+        with patch.object(cleaner._darwin_walk, "AVAILABLE", False):
+            if backend == "python":
+                with patch.object(cleaner, "Scandir", None):
+                    large_files = self.finder.find_large_files(str(root))
+            else:
+                large_files = self.finder.find_large_files(str(root))
+        
+        assert sorted(f.path for f in large_files) == [str(root / "big.bin"), str(root / "lib" / "big.bin")]
+    
+    @pytest.mark.parametrize("backend", ["scandir_rs", "python"])
+    def test_find_large_files_stop_event(self, backend):
+        """Test recherche arrêtée: liste vide quel que soit le parcours"""
+        import threading
+        import macclean.core.cleaner as cleaner
+        if backend == "scandir_rs":
+            pytest.importorskip("scandir_rs")
+        (Path(self.test_dir) / "big.bin").write_bytes(b"x" * (1024 * 1024 + 1))
+        
+        stop_event = threading.Event()
+        with patch.object(cleaner._darwin_walk, "AVAILABLE", False), \
+                patch.object(cleaner, "Scandir", cleaner.Scandir if backend == "scandir_rs" else None):
+            assert len(self.finder.find_large_files(self.test_dir, stop_event=stop_event)) == 1
+            stop_event.set()
+            assert self.finder.find_large_files(self.test_dir, stop_event=stop_event) == []
+    
+    def test_darwin_walk_entries(self):
+        """Test décodage des entrées getattrlistbulk en DirEntry avec stat (tampon synthétique)"""
+        import stat
+        from macclean.core import _darwin_walk
+        
+        def packed_entry(name: bytes, obj_type: int, size: int) -> bytes:
+            name_data = name + b"\0"
+            name_data += b"\0" * (-len(name_data) % 4)
+            length = _darwin_walk._ENTRY.size + len(name_data)
+            fixed = _darwin_walk._ENTRY.pack(
+                length, _darwin_walk._COMMON_ATTRS, 0, 0, 0, 0,
+                _darwin_walk._ENTRY.size - _darwin_walk._NAME_REF_OFFSET, len(name) + 1,
+                7, obj_type, 1_700_000_000, 500, 501, 20, 0o644, 42, size)
+            return fixed + name_data
+        
+        buffer = packed_entry(b"photo.jpg", _darwin_walk.VREG, 1234) + packed_entry(b"sub", _darwin_walk.VDIR, 0)
+        files, subdirs = [], []
+        _darwin_walk._parse_entries(memoryview(buffer), 2, "/data", files, subdirs)
+        
+        assert subdirs == ["/data/sub"]
+        assert [entry.path for entry in files] == ["/data/photo.jpg"]
+        st = files[0].stat(follow_symlinks=False)
+        assert stat.S_ISREG(st.st_mode) and stat.S_IMODE(st.st_mode) == 0o644
+        assert (st.st_size, st.st_ino, st.st_dev, st.st_uid) == (1234, 42, 7, 501)
+        assert st.st_mtime_ns == 1_700_000_000_000_000_500
+        assert FileInfo(files[0].path, 0, stat_result=st).file_type == "image"
+    
+    def test_should_skip_directory(self):
+        """Test motifs d'exclusion compilés: génériques partout, macOS sur Apple Silicon"""
+        assert self.finder._should_skip_directory("/home/user/project/node_modules/pkg")
+        assert self.finder._should_skip_directory(Path("/src/__pycache__"))
+        assert not self.finder._should_skip_directory("/home/user/Documents")
+        
+        for is_apple_silicon in (True, False):
+            with patch("macclean.core.cleaner.IS_APPLE_SILICON", is_apple_silicon):
+                finder = LargeFilesFinder(min_size_mb=1)
+            assert finder._should_skip_directory("/Users/me/Library/Caches/com.apple.Safari") == is_apple_silicon
+
+
+class TestOrphanedFilesFinder:
+    """Tests pour OrphanedFilesFinder"""
+    
+    def test_find_orphaned_files_classifies_matches_only(self, tmp_path):
+        """Test fichiers orphelins: stat du parcours réutilisé, classement des seuls retenus"""
+        import time
+        old_log = tmp_path / "app.log"
+        old_log.write_text("ancien")
+        (tmp_path / "recent.log").write_text("récent")
+        (tmp_path / "data.txt").write_text("données")
+        old_time = time.time() - 60 * 24 * 3600
+        os.utime(old_log, (old_time, old_time))
+        
+        finder = OrphanedFilesFinder()
+        finder.application_dirs = [str(tmp_path)]
+        access_calls = []
+        real_access = os.access
+        with patch("os.access", side_effect=lambda path, mode: access_calls.append(path) or real_access(path, mode)):
+            orphans = finder.find_orphaned_files()
+        
+        assert [f.path for f in orphans] == [str(old_log)]
+        assert orphans[0].file_type == "file" and orphans[0].is_removable is not None
+        assert access_calls == [str(old_log)]
+        
+        # Scan arrêté: liste vide
+        import threading
+        stop_event = threading.Event()
+        stop_event.set()
+        assert finder.find_orphaned_files(stop_event=stop_event) == []
 
 
 class TestUtilityFunctions:
@@ -236,6 +1059,39 @@ class TestUtilityFunctions:
         assert format_file_size(1024) == "1.0 KB"
         assert format_file_size(1024 * 1024) == "1.0 MB"
         assert format_file_size(1024 * 1024 * 1024) == "1.0 GB"
+        assert format_file_size(1536) == "1.5 KB"
+        assert format_file_size(1024 ** 2 - 1) == "1024.0 KB"
+        assert format_file_size(1024 ** 5) == "1024.0 TB"
+    
+    def test_format_file_size_is_cached(self):
+        """Test formatage mis en cache: tailles répétées servies sans recalcul"""
+        format_file_size.cache_clear()
+        for _ in range(3):
+            assert format_file_size(1536) == "1.5 KB"
+        info = format_file_size.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+    
+    def test_format_file_sizes_batch(self):
+        """Test formatage d'une colonne de tailles: mêmes chaînes que le formatage unitaire"""
+        from array import array
+        from macclean.utils import format_file_sizes
+        
+        sizes = [0, 1536, 1536, 1024 ** 2 - 1, 1024 ** 3, 7]
+        expected = [format_file_size(size) for size in sizes]
+        assert format_file_sizes(sizes) == expected
+        assert format_file_sizes(array("q", sizes)) == expected
+        assert format_file_sizes(iter(sizes)) == expected
+        assert format_file_sizes([]) == []
+    
+    def test_system_info_cached(self):
+        """Test mise en cache de la détection plateforme"""
+        from macclean.utils import is_apple_silicon, get_system_info
+        assert is_apple_silicon() is is_apple_silicon()
+        assert is_apple_silicon.cache_info().hits >= 1
+        
+        info = get_system_info()
+        assert info["is_apple_silicon"] == is_apple_silicon()
+        assert info["memory_available"] > 0
     
     def test_safe_delete_file(self):
         """Test suppression sécurisée"""
@@ -246,8 +1102,9 @@ class TestUtilityFunctions:
             # Vérifier que le fichier existe
             assert os.path.exists(tmp_file.name)
             
-            # Supprimer
-            result = safe_delete_file(tmp_file.name)
+            # Supprimer (unlink seul, sans stat préalable)
+            with patch("os.path.exists", side_effect=AssertionError):
+                result = safe_delete_file(tmp_file.name)
             assert result is True
             assert not os.path.exists(tmp_file.name)
     
@@ -255,6 +1112,66 @@ class TestUtilityFunctions:
         """Test suppression fichier inexistant"""
         result = safe_delete_file("/nonexistent/file.txt")
         assert result is False
+
+    def test_safe_verify_duplicate_group(self, tmp_path):
+        """Test vérification octet par octet: classes identiques, fichier illisible à part"""
+        from macclean.utils import files_identical, safe_verify_duplicate_group
+        from macclean.utils import helpers
+
+        contents = {"a": b"x" * 10, "b": b"x" * 10, "c": b"x" * 9 + b"y", "d": b"x" * 9 + b"y"}
+        for name, data in contents.items():
+            (tmp_path / name).write_bytes(data)
+        paths = [str(tmp_path / name) for name in ("a", "c", "b", "d", "missing")]
+
+        with patch.object(helpers, "COMPARE_CHUNK_SIZE", 4):
+            assert safe_verify_duplicate_group(paths, max_workers=2) == [
+                [paths[0], paths[2]], [paths[1], paths[3]], [paths[4]]
+            ]
+            assert files_identical(paths[0], paths[2])
+            (tmp_path / "f").write_bytes(b"y" + b"x" * 9)
+            assert not files_identical(paths[0], str(tmp_path / "f"))  # Différence au premier bloc
+            (tmp_path / "g").write_bytes(b"x" * 8)
+            (tmp_path / "h").write_bytes(b"x" * 8)
+            assert files_identical(str(tmp_path / "g"), str(tmp_path / "h"))  # Blocs entiers seulement
+        assert not files_identical(paths[0], str(tmp_path / "missing"))
+
+        # Petits fichiers: une seule lecture de chaque côté
+        (tmp_path / "e1").write_bytes(b"")
+        (tmp_path / "e2").write_bytes(b"")
+        assert files_identical(str(tmp_path / "e1"), str(tmp_path / "e2"))
+        assert files_identical(paths[1], paths[3]) and not files_identical(paths[0], paths[1])
+
+    def test_safe_delete_broken_symlink(self, tmp_path):
+        """Test suppression d'un lien brisé: le lien est retiré, pas sa cible"""
+        link = tmp_path / "broken_link"
+        link.symlink_to(tmp_path / "missing")
+        assert safe_delete_file(str(link)) is True
+        assert not os.path.lexists(link)
+        assert safe_delete_file(str(tmp_path)) is False
+    
+    def test_safe_delete_files_chunked(self, tmp_path):
+        """Test suppression par lots: résultats dans l'ordre des chemins, quel que soit le lot"""
+        from macclean.utils import safe_delete_files, safe_delete_files_batch
+        from macclean.utils import helpers
+        
+        paths = []
+        for i in range(5):
+            path = tmp_path / f"f{i}.tmp"
+            path.write_bytes(b"x")
+            paths.append(str(path))
+        paths.insert(2, str(tmp_path / "missing.tmp"))
+        
+        progress = []
+        with patch.object(helpers, "DELETE_CHUNK_SIZE", 2):
+            assert safe_delete_files(paths, max_workers=3, progress_callback=lambda *p: progress.append(p)) == \
+                [True, True, False, True, True, True]
+        assert progress == [(2, 6), (4, 6), (6, 6)]
+        assert not any(os.path.exists(path) for path in paths)
+        assert safe_delete_files_batch(paths[:2]) == {paths[0]: False, paths[1]: False}
+        
+        # Répertoire et chemin invalide: échecs isolés, le répertoire est conservé
+        assert safe_delete_files([str(tmp_path), "bad\0path"]) == [False, False]
+        assert tmp_path.is_dir()
     
     def test_export_to_json(self):
         """Test export JSON"""
@@ -275,8 +1192,75 @@ class TestUtilityFunctions:
             assert len(data) == 2
             assert data[0]['path'] == "/test/file1.txt"
             assert data[0]['size'] == 100
+            # Clés stables pour les consommateurs d'exports existants
+            assert 'hash_md5' in data[0] and 'hash' not in data[0]
             
             os.unlink(tmp_file.name)
+    
+    def test_export_to_json_stream(self, tmp_path):
+        """Test export JSON depuis un générateur, sur plusieurs lots, et sans fichier"""
+        import json
+        from macclean.utils import export_to_json_stream
+        from macclean.utils import helpers
+        
+        output = tmp_path / "export.json"
+        files = (FileInfo(f"/test/file{i}.txt", i) for i in range(5))
+        with patch.object(helpers, "EXPORT_CHUNK_ROWS", 2):
+            assert export_to_json_stream(files, str(output)) is True
+        assert [entry["size"] for entry in json.loads(output.read_text())] == [0, 1, 2, 3, 4]
+        
+        assert export_to_json_stream(iter([]), str(output)) is True
+        assert json.loads(output.read_text()) == []
+        
+        # Annulé après le premier lot: pas de document tronqué mais fermé, ni de succès
+        import threading
+        stop_event = threading.Event()
+        
+        def stopping_files():
+            for i in range(5):
+                if i == 3:
+                    stop_event.set()
+                yield FileInfo(f"/test/file{i}.txt", i)
+        
+        with patch.object(helpers, "EXPORT_CHUNK_ROWS", 2):
+            assert export_to_json_stream(stopping_files(), str(output), stop_event=stop_event) is False
+        assert not output.exists()
+
+        # Gros export sur Apple Silicon: toujours dans le thread appelant, sans pool
+        many = [FileInfo(f"/test/file{i}.txt", i) for i in range(2000)]
+        with patch.object(helpers, "is_apple_silicon", return_value=True), \
+             patch("concurrent.futures.ThreadPoolExecutor", side_effect=AssertionError), \
+             patch("concurrent.futures.ProcessPoolExecutor", side_effect=AssertionError):
+            assert export_to_json(many, str(output)) is True
+        assert len(json.loads(output.read_text())) == 2000
+
+    def test_export_from_batch_columns(self, tmp_path):
+        """Test export depuis les colonnes d'un FileBatch: même fichier qu'avec des FileInfo"""
+        import threading
+        from macclean.utils import export_to_json_stream
+
+        files = [FileInfo(f"/test/file{i}.txt", i * 10) for i in range(3)]
+        for file_info, digest in zip(files, ["a", None, "c"]):
+            file_info.hash_md5 = digest
+            file_info.device_id, file_info.inode = 1, 42
+        batch = FileBatch.from_file_infos(files)
+
+        for exporter, name in ((export_to_json_stream, "out.json"), (export_to_json, "compat.json"),
+                               (export_to_csv, "out.csv"), (export_to_txt, "out.txt")):
+            from_infos, from_batch = tmp_path / f"infos_{name}", tmp_path / f"batch_{name}"
+            assert exporter(files, str(from_infos)) is True
+            assert exporter(batch, str(from_batch), hashes=["a", None, "c"]) is True
+            assert from_batch.read_bytes() == from_infos.read_bytes()
+
+        # Annulation: échec signalé et fichier partiel supprimé, pour chaque format
+        stop_event = threading.Event()
+        stop_event.set()
+        for exporter, name in ((export_to_json_stream, "stopped.json"), (export_to_csv, "stopped.csv"),
+                               (export_to_txt, "stopped.txt")):
+            output = tmp_path / name
+            assert exporter(batch, str(output), stop_event=stop_event) is False
+            assert not output.exists()
+
     def test_export_to_csv(self):
         """Test export CSV"""
         files = [
@@ -295,6 +1279,12 @@ class TestUtilityFunctions:
             content = f.read()
             assert "file1.txt" in content
             assert "file2.txt" in content
+            assert content.splitlines()[0].split(',')[3] == "Hash MD5"
+        
+        # Fins de ligne Unix: en-tête + une ligne par fichier, sans '\r'
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        assert b"\r" not in raw and raw.count(b"\n") == 3
         
         os.unlink(file_path)
 
@@ -392,3 +1382,12 @@ class TestNewFeatures:
             assert "/test/file1.txt" in content
             
             os.unlink(tmp_file.name)
+
+    def test_scan_logger_left_to_application(self):
+        """Test journal des scans: aucun handler ni niveau imposés par la bibliothèque"""
+        import logging
+        from macclean.core import cleaner
+
+        assert cleaner._log.name == "macclean.core.cleaner"
+        assert cleaner._log.handlers == []
+        assert cleaner._log.level == logging.NOTSET and cleaner._log.propagate
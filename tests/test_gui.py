@@ -3,71 +3,91 @@ Tests pour l'interface graphique
 """
 
 import pytest
-import sys
 from pathlib import Path
 from unittest.mock import Mock, patch
 
-# Configuration du path pour les imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Module ignoré d'un bloc (et non en erreur de collecte) si PySide6 n'est pas installé
+pytest.importorskip("PySide6")
 
-from PySide6.QtWidgets import QApplication
 from PySide6.QtTest import QTest
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QCoreApplication, QEvent
 
 from macclean.gui import MacCleanApp
-from macclean.core import FileInfo
+from macclean.gui.main_window import ScanWorker, DeleteWorker
+from macclean.core import FileInfo, FileBatch
+
+pytestmark = pytest.mark.gui
+
+
+def _dispose(window):
+    """Ferme la fenêtre et libère ses ressources Qt tout de suite, sans attendre le ramasse-miettes"""
+    window.close()
+    window.deleteLater()
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
 
 
 @pytest.fixture(scope="module")
-def app():
-    """Fixture pour l'application Qt"""
-    if not QApplication.instance():
-        return QApplication([])
-    return QApplication.instance()
+def main_window(app):
+    """Fenêtre principale construite une seule fois pour le module"""
+    window = MacCleanApp()
+    yield window
+    _dispose(window)
+
+
+@pytest.fixture
+def fresh_window(app):
+    """Fenêtre propre au test (scans, suppressions, exports), fermée même si le test échoue"""
+    window = MacCleanApp()
+    yield window
+    _dispose(window)
+
+
+@pytest.fixture
+def window(main_window):
+    """Fenêtre partagée remise à zéro avant chaque test: tables vides et sans tri, premier onglet,
+    aucun scan actif (les tests qui lancent de vrais scans, suppressions ou exports gardent leur propre fenêtre)"""
+    for table in main_window.tables.values():
+        table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        table.populate_table([])
+    main_window.tabs.setCurrentIndex(0)
+    main_window.active_scans.clear()
+    main_window._update_progress_visibility()
+    QTest.qWait(0)  # Résumés de sélection différés émis ici, pas pendant le test suivant
+    return main_window
 
 
 class TestMacCleanApp:
     """Tests pour l'application principale"""
     
-    def test_app_creation(self, app):
-        """Test création de l'application"""
-        window = MacCleanApp()
-        assert window.windowTitle() == "MacClean - Nettoyeur de stockage"
-        assert window.tabs.count() == 4  # 4 onglets
-        window.close()
-    
-    def test_tabs_creation(self, app):
-        """Test création des onglets"""
-        window = MacCleanApp()
-        
-        tab_titles = []
-        for i in range(window.tabs.count()):
-            tab_titles.append(window.tabs.tabText(i))
-        
-        expected_titles = ["Doublons", "Cache", "Fichiers orphelins", "Gros fichiers"]
-        assert tab_titles == expected_titles
-        window.close()
+    @pytest.mark.parametrize("probe, expected", [
+        (lambda w: w.windowTitle(), "MacClean - Nettoyeur de stockage"),
+        (lambda w: w.tabs.count(), 4),
+        (lambda w: [w.tabs.tabText(i) for i in range(w.tabs.count())],
+         ["Doublons", "Cache", "Fichiers orphelins", "Gros fichiers"]),
+        (lambda w: w.tab_keys, ["duplicates", "cache", "orphans", "large"]),
+        (lambda w: set(w.tables), {"duplicates", "cache", "orphans", "large"}),
+        (lambda w: set(w.dir_labels), {"duplicates", "large"}),
+    ], ids=["title", "tab_count", "tab_titles", "tab_keys", "tables", "dir_labels"])
+    def test_window_static_props(self, window, probe, expected):
+        """Test structure de la fenêtre: titre, onglets, tables et libellés de répertoire"""
+        assert probe(window) == expected
     
     @patch('macclean.gui.main_window.QFileDialog.getExistingDirectory')
-    def test_browse_duplicate_directory(self, mock_dialog, app):
+    def test_browse_duplicate_directory(self, mock_dialog, window):
         """Test sélection répertoire doublons"""
-        window = MacCleanApp()
-        
         # Mock du dialogue
         mock_dialog.return_value = "/test/directory"
         
-        window.browse_duplicate_directory()
+        window.browse_directory()
         
-        assert "Répertoire: /test/directory" in window.duplicate_dir_label.text()
-        window.close()
+        assert "Répertoire: /test/directory" in window.dir_labels["duplicates"].text()
+        assert window.scan_parameters("duplicates") == {"directory": "/test/directory"}
     
-    def test_file_table_widget(self, app):
+    def test_file_table_widget(self, window):
         """Test du widget table des fichiers"""
-        window = MacCleanApp()
-        
         # Tester la table des doublons
-        table = window.duplicates_table
-        assert table.columnCount() == 5
+        table = window.tables["duplicates"]
+        assert table.columnCount() == 6
         
         # Tester l'ajout de fichiers
         test_files = [
@@ -77,13 +97,12 @@ class TestMacCleanApp:
         
         table.populate_table(test_files)
         assert table.rowCount() == 2
-        
-        window.close()
+        assert table.model() is table.file_model and table.model().rowCount() == 2
+        assert table.horizontalHeader().resizeContentsPrecision() == 0
     
-    def test_select_all_functionality(self, app):
+    def test_select_all_functionality(self, window):
         """Test sélection/désélection de tous les fichiers"""
-        window = MacCleanApp()
-        table = window.duplicates_table
+        table = window.tables["duplicates"]
         
         # Ajouter des fichiers test
         test_files = [
@@ -101,90 +120,530 @@ class TestMacCleanApp:
         table.select_all(False)
         selected = table.get_selected_files()
         assert len(selected) == 0
-        
-        window.close()
     
+    def test_checkbox_delegate(self, window):
+        """Test cases dessinées par le délégué, basculées sans widget par ligne"""
+        from PySide6.QtGui import QKeyEvent
+        from PySide6.QtWidgets import QStyleOptionViewItem
+        from PySide6.QtCore import QEvent
+
+        table = window.tables["duplicates"]
+        model = table.file_model
+        table.populate_table([FileInfo("/test/file1.txt", 100), FileInfo("/test/file2.txt", 200)])
+
+        assert table.itemDelegateForColumn(0) is table.checkbox_delegate
+        assert table.indexWidget(model.index(0, 0)) is None
+
+        space = QKeyEvent(QEvent.KeyPress, Qt.Key_Space, Qt.NoModifier)
+        option = QStyleOptionViewItem()
+        assert table.checkbox_delegate.editorEvent(space, model, option, model.index(1, 0))
+        assert [f.path for f in table.get_selected_files()] == ["/test/file2.txt"]
+        table.checkbox_delegate.editorEvent(space, model, option, model.index(1, 0))
+        assert table.get_selected_files() == []
+
+    def test_preview_shared_across_tabs(self, fresh_window):
+        """Test panneau de prévisualisation unique, hors des onglets"""
+        window = fresh_window
+        assert window.preview_dock.widget() is window.preview_widget
+        assert not window.tabs.isAncestorOf(window.preview_widget)
+
+        window.tables["cache"].populate_table([FileInfo("/test/cache.tmp", 10)])
+        window.tables["cache"].select_all(True)
+        QTest.qWait(10)
+        # Le résumé va au label de sa table, même hors de l'onglet courant
+        assert window.selection_labels["cache"].text().startswith("Sélectionnés: 1 fichiers")
+        assert window.selection_labels["duplicates"].text() == "Aucun fichier sélectionné"
+        window.tabs.setCurrentIndex(window.tab_keys.index("cache"))
+        assert "cache.tmp" in window.file_info_label.text()
+
+        window.tabs.setCurrentIndex(window.tab_keys.index("duplicates"))
+        assert window.file_info_label.text() == "Aucun fichier sélectionné"
+
+    def test_preview_cache(self, fresh_window, tmp_path):
+        """Test aperçu décodé dans le pool puis servi depuis le cache"""
+        from PySide6.QtGui import QImage
+        from macclean.gui.main_window import PreviewTask
+        image_path = tmp_path / "photo.png"
+        image = QImage(500, 400, QImage.Format_RGB32)
+        image.fill(Qt.red)
+        image.save(str(image_path))
+
+        window = fresh_window
+        table = window.tables["duplicates"]
+        table.populate_table([FileInfo(str(image_path), image_path.stat().st_size, file_type="image")])
+        table.file_model.setData(table.file_model.index(0, 0), Qt.Checked, Qt.CheckStateRole)
+
+        window.update_preview()
+        window.task_pool.waitForDone()
+        QTest.qWait(10)
+        assert len(window.preview_cache) == 1
+        assert window.preview_label.pixmap().width() == 250
+
+        # Même fichier toujours affiché: rien n'est reconstruit
+        with patch.object(table.file_model, 'file_info') as mock_file_info:
+            window.update_preview()
+        mock_file_info.assert_not_called()
+
+        # Décodage en attente d'un autre fichier: retiré du pool quand la sélection change
+        queued = PreviewTask(("/test/other.png", 1), "/test/other.png")
+        window.preview_tasks[queued.key] = queued
+        with patch.object(window.task_pool, 'tryTake', return_value=True) as mock_take:
+            table.select_all(False)
+            window.update_preview()
+        mock_take.assert_called_once_with(queued)
+        assert window.preview_tasks == {}
+        table.file_model.setData(table.file_model.index(0, 0), Qt.Checked, Qt.CheckStateRole)
+
+        # Nouvel affichage du même fichier: servi par le cache, aucune nouvelle tâche
+        window.preview_source = None
+        with patch.object(window.task_pool, 'start') as mock_start:
+            window.update_preview()
+        mock_start.assert_not_called()
+        assert window.preview_label.pixmap().height() == 200
+
+    def test_selection_summary(self, window):
+        """Test résumé de la sélection tenu à jour sans parcourir les lignes"""
+        table = window.tables["duplicates"]
+        model = table.file_model
+        summaries = []
+        table.selection_summary_changed.connect(lambda *summary: summaries.append(summary))
+
+        table.populate_table([
+            FileInfo("/test/photo.jpg", 100, file_type="image"),
+            FileInfo("/test/link", 10, file_type="symlink", is_removable=False),
+            FileInfo("/test/file.txt", 1000),
+        ])
+        model.setData(model.index(0, 0), Qt.Checked, Qt.CheckStateRole)
+        model.setData(model.index(0, 0), Qt.Checked, Qt.CheckStateRole)
+        assert model.selection_summary == [1, 100, 1, 0, 0]
+
+        table.select_all(True)
+        assert model.selection_summary == [3, 1110, 1, 1, 1]
+        assert model.checked == bytearray(b"\x01\x01\x01")
+
+        model.setData(model.index(2, 0), Qt.Unchecked, Qt.CheckStateRole)
+        assert model.selection_summary == [2, 110, 1, 1, 1]
+
+        # Changements regroupés: un seul signal au tour de boucle suivant
+        QTest.qWait(10)
+        assert summaries == [("duplicates", 2, 110, 1, 1, 1)]
+
+        # Case déjà dans l'état demandé, ou simple surlignage: aucun signal
+        changes = []
+        model.dataChanged.connect(lambda *args: changes.append(args))
+        model.setData(model.index(0, 0), Qt.Checked, Qt.CheckStateRole)
+        table.selectRow(1)
+        QTest.qWait(10)
+        assert changes == [] and len(summaries) == 1
+
+        model.remove_rows([1])
+        assert model.selection_summary == [1, 100, 1, 0, 0]
+        assert model.last_checked_row() == 0
+
+        # Tout cocher/décocher quand c'est déjà le cas: aucun signal
+        table.select_all(False)
+        changes.clear()
+        table.select_all(False)
+        assert changes == []
+        table.select_all(True)
+        table.select_all(True)
+        assert len(changes) == 1
+
+    def test_incremental_rows(self, window):
+        """Test du chargement des lignes par lots"""
+        table = window.tables["duplicates"]
+        model = table.file_model
+
+        test_files = [FileInfo(f"/test/file{i}.txt", i) for i in range(model.FETCH_BATCH_SIZE + 10)]
+        table.populate_table(test_files)
+        assert table.rowCount() == model.FETCH_BATCH_SIZE
+        assert model.canFetchMore()
+
+        model.fetchMore()
+        assert table.rowCount() == len(test_files)
+        assert not model.canFetchMore()
+
+        # La sélection globale couvre aussi les lignes pas encore chargées
+        table.populate_table(test_files)
+        table.select_all(True)
+        assert len(table.get_selected_files()) == len(test_files)
+
+    def test_model_columns_and_sort(self, window):
+        """Test du modèle en colonnes: FileInfo reconstruits et tri par permutation"""
+        table = window.tables["duplicates"]
+        model = table.file_model
+
+        test_files = [
+            FileInfo("/test/b.txt", 300, hash_md5="h1"),
+            FileInfo("/test/a.txt", 100, hash_md5="h2"),
+            FileInfo("/test/c.txt", 200),
+        ]
+        table.populate_table(test_files)
+        model.setData(model.index(0, 0), Qt.Checked, Qt.CheckStateRole)
+
+        model.sort(2, Qt.AscendingOrder)
+        assert list(model.batch.sizes) == [100, 200, 300]
+        assert [f.path for f in table.get_selected_files()] == ["/test/b.txt"]
+        assert [f.hash_md5 for f in table.files_data] == ["h2", None, "h1"]
+
+        model.sort(1, Qt.DescendingOrder)
+        assert model.batch.paths == ["/test/c.txt", "/test/b.txt", "/test/a.txt"]
+
+        # Clés texte calculées une fois puis permutées avec les lignes
+        model.sort(4, Qt.AscendingOrder)
+        assert model.sort_keys(4) == ["/test/a.txt", "/test/b.txt", "/test/c.txt"]
+        model.sort(2, Qt.DescendingOrder)
+        assert model.sort_keys(4) == ["/test/b.txt", "/test/c.txt", "/test/a.txt"]
+        assert model.data(model.index(0, 1), Qt.UserRole) == "b.txt"
+        assert model.data(model.index(0, 2), Qt.UserRole) == 300
+
+        # Nouveau résultat: tri de l'en-tête appliqué dans une seule réinitialisation
+        table.sortByColumn(2, Qt.AscendingOrder)
+        resets = []
+        model.modelReset.connect(lambda: resets.append(True))
+        table.populate_table(test_files)
+        assert len(resets) == 1
+        assert list(model.batch.sizes) == [100, 200, 300]
+
+    def test_model_row_backgrounds(self, window):
+        """Test couleurs de fond: lien > non supprimable > média"""
+        from PySide6.QtGui import QColor
+        table = window.tables["duplicates"]
+        model = table.file_model
+
+        table.populate_table([
+            FileInfo("/test/link.jpg", 1, file_type="symlink", is_removable=False),
+            FileInfo("/test/locked.jpg", 2, file_type="image", is_removable=False),
+            FileInfo("/test/photo.jpg", 3, file_type="image"),
+            FileInfo("/test/file.txt", 4),
+        ])
+        model.sort(2, Qt.AscendingOrder)
+        backgrounds = [model.data(model.index(row, 1), Qt.BackgroundRole) for row in range(4)]
+        assert backgrounds == [QColor(Qt.yellow), QColor(Qt.red), QColor(173, 216, 230), None]
+        assert model.data(model.index(0, 2), Qt.BackgroundRole) is None
+
+    def test_model_remove_rows(self, window):
+        """Test retrait de lignes par plages, lignes non chargées comprises"""
+        table = window.tables["duplicates"]
+        model = table.file_model
+
+        count = model.FETCH_BATCH_SIZE + 10
+        test_files = [FileInfo(f"/test/file{i}.txt", i) for i in range(count)]
+        table.populate_table(test_files)
+        model.setData(model.index(3, 0), Qt.Checked, Qt.CheckStateRole)
+
+        removed = [0, 1, 2, 5, count - 1]
+        model.remove_rows(removed)
+
+        assert model.file_count() == count - len(removed)
+        assert table.rowCount() == model.FETCH_BATCH_SIZE - 4
+        assert list(model.batch.sizes[:3]) == [3, 4, 6]
+        assert [f.path for f in table.get_selected_files()] == ["/test/file3.txt"]
+
     @patch('macclean.gui.main_window.ScanWorker')
-    @patch('macclean.gui.main_window.QThread')
-    def test_start_scan(self, mock_thread, mock_worker, app):
+    def test_start_scan(self, mock_worker, window):
         """Test démarrage d'un scan"""
-        window = MacCleanApp()
-        
         # Mock des objets
         mock_worker_instance = Mock()
-        mock_thread_instance = Mock()
         mock_worker.return_value = mock_worker_instance
-        mock_thread.return_value = mock_thread_instance
         
-        window.start_scan("duplicates", {"directory": "/test"})
+        with patch.object(window, "scan_pool") as mock_pool:
+            window.start_scan("duplicates", {"directory": "/test"})
         
-        # Vérifier que le worker et thread sont créés
+        # Vérifier que le worker est créé et confié au pool
         mock_worker.assert_called_once_with("duplicates", {"directory": "/test"})
-        mock_thread.assert_called_once()
+        mock_pool.start.assert_called_once_with(mock_worker_instance)
+        assert window.active_scans["duplicates"] is mock_worker_instance
+    
+    def test_short_tasks_not_queued_behind_scans(self, fresh_window):
+        """Test pools séparés: infos système, aperçus, suppressions et exports hors du pool des scans"""
+        window = fresh_window
+        assert window.task_pool is not window.scan_pool
+        assert window.task_pool.maxThreadCount() >= 2
         
-        window.close()
+        window.system_info_task = None
+        with patch.object(window.scan_pool, 'start') as mock_scan_start, \
+                patch.object(window.task_pool, 'start') as mock_task_start:
+            window.refresh_system_info()
+            window.start_delete("cache", [0], ["/test/a.tmp"])
+        assert mock_task_start.call_count == 2
+        mock_scan_start.assert_not_called()
+        window.active_deletes.clear()
     
-    @patch('macclean.gui.main_window.export_to_json')
+    @patch('macclean.gui.main_window.QMessageBox')
+    def test_delete_selected_skips_protected(self, mock_message_box, fresh_window):
+        """Test suppression: seules les lignes supprimables sont transmises au worker"""
+        window = fresh_window
+        table = window.tables["cache"]
+        table.populate_table([
+            FileInfo("/test/a.tmp", 10, is_removable=True),
+            FileInfo("/test/link", 10, file_type="symlink", is_removable=False),
+            FileInfo("/test/b.tmp", 10, is_removable=True),
+        ])
+        table.select_all(True)
+        mock_message_box.question.return_value = mock_message_box.Yes
+
+        with patch.object(window, 'start_delete') as mock_start:
+            window.delete_selected_files("cache")
+        mock_start.assert_called_once_with("cache", [0, 2], ["/test/a.tmp", "/test/b.tmp"])
+
+    @patch('macclean.gui.main_window.QMessageBox')
+    def test_delete_during_scan_rescans(self, mock_message_box, fresh_window):
+        """Test suppression pendant un scan: scan annulé, résultat partiel ignoré, puis relancé"""
+        window = fresh_window
+        table = window.tables["cache"]
+        table.populate_table([FileInfo("/test/a.tmp", 10, is_removable=True),
+                              FileInfo("/test/b.tmp", 10, is_removable=True)])
+        table.select_all(True)
+        mock_message_box.question.return_value = mock_message_box.Yes
+        scan_worker = window.active_scans["cache"] = Mock()
+
+        with patch.object(window, 'task_pool'):
+            window.delete_selected_files("cache")
+        scan_worker.stop.assert_called_once()
+        assert set(window.active_deletes) == {"cache"}
+        mock_message_box.warning.assert_not_called()
+
+        with patch.object(window, 'start_scan') as mock_start_scan:
+            window.scan_finished("cache", FileBatch.from_file_infos([FileInfo("/test/c.tmp", 1)]), [None])
+            assert table.file_model.batch.paths == ["/test/a.tmp", "/test/b.tmp"]
+            mock_start_scan.assert_not_called()
+
+            window.delete_finished("cache", [True, True])
+            mock_start_scan.assert_called_once_with("cache", window.scan_parameters("cache"))
+        assert table.rowCount() == 0 and not window.pending_rescans
+
+        # Bilan dans la barre d'état, sans boîte de dialogue modale
+        mock_message_box.information.assert_not_called()
+        assert window.status_bar.currentMessage() == "2/2 fichier(s) supprimé(s)."
+
+    def test_cancelled_scan_keeps_results(self, fresh_window):
+        """Test scan annulé: résultats précédents conservés, annulation signalée"""
+        window = fresh_window
+        table = window.tables["large"]
+        table.populate_table([FileInfo("/test/big.iso", 10)])
+        worker = window.active_scans["large"] = ScanWorker("large", {})
+        
+        window.cancel_operations()
+        assert worker.should_stop
+        window.scan_finished("large", FileBatch.from_file_infos([FileInfo("/test/other.iso", 1)]), [None])
+        
+        assert table.file_model.batch.paths == ["/test/big.iso"]
+        assert window.status_bar.currentMessage() == "Scan annulé"
+        assert not window.active_scans
+
+    @patch('macclean.gui.main_window.QMessageBox')
+    @patch('macclean.gui.main_window.ScanWorker')
+    def test_scans_tracked_per_type(self, mock_worker, mock_message_box, fresh_window):
+        """Test scans en cours suivis par type: un seul par onglet, plusieurs onglets en parallèle"""
+        window = fresh_window
+        window.scan_pool = Mock()
+
+        window.start_scan("duplicates", {"directory": "/test"})
+        window.start_scan("cache", {})
+        assert set(window.active_scans) == {"duplicates", "cache"}
+        mock_message_box.warning.assert_not_called()
+
+        window.start_scan("duplicates", {"directory": "/test"})
+        mock_message_box.warning.assert_called_once()
+        assert mock_worker.call_count == 2
+
+        window.scan_finished("duplicates", FileBatch(), [])
+        assert set(window.active_scans) == {"cache"}
+        window.scan_error("cache", "erreur")
+        assert not window.active_scans
+
+    def test_signal_connections_policy(self, app):
+        """Test des connexions: syntaxe fonctionnelle vers des slots nommés uniquement"""
+        import macclean.gui.main_window as main_window
+
+        source = Path(main_window.__file__).read_text(encoding="utf-8")
+        assert "SIGNAL(" not in source and "SLOT(" not in source
+        assert ".connect(lambda" not in source
+        # Les tables remontent leur résumé par signal, sans sonder leur parent
+        assert "hasattr(" not in source and ".parent()" not in source
+        assert ".connect(\n            lambda" not in source
+
+    @patch('macclean.gui.main_window.QMessageBox')
+    @patch('macclean.gui.main_window.export_to_json_stream')
     @patch('macclean.gui.main_window.QFileDialog.getSaveFileName')
-    def test_export_results(self, mock_save_dialog, mock_export, app):
+    def test_export_results(self, mock_save_dialog, mock_export, mock_message_box, fresh_window, qtbot):
         """Test export des résultats"""
-        window = MacCleanApp()
+        window = fresh_window
         
         # Préparer des données test
         test_files = [FileInfo("/test/file1.txt", 100)]
-        window.duplicates_table.populate_table(test_files)
+        window.tables["duplicates"].populate_table(test_files)
         
-        # Mock du dialogue de sauvegarde
+        # Mock du dialogue de sauvegarde (chemin et format choisis)
         mock_save_dialog.return_value = ("/test/export.json", "JSON (*.json)")
         mock_export.return_value = True
         
-        window.export_results()
+        # Attendre la fin de l'export, signalée par la barre d'état une fois export_finished exécuté
+        done = "Données exportées vers /test/export.json"
+        with qtbot.waitSignal(window.status_bar.messageChanged, timeout=5000,
+                              check_params_cb=lambda message: message == done):
+            window.export_results()
         
-        # Vérifier que l'export est appelé
+        # Vérifier que l'export est appelé (dans le pool, directement avec les colonnes du lot)
         mock_export.assert_called_once()
-        
+        batch, file_path = mock_export.call_args[0]
+        assert isinstance(batch, FileBatch)
+        assert batch.paths == ["/test/file1.txt"]
+        assert file_path == "/test/export.json"
+        assert mock_export.call_args[1]["hashes"] == [None]
+        assert window.export_worker is None
+        mock_message_box.information.assert_called_once()
+
+    def test_close_stops_export(self, fresh_window):
+        """Test fermeture: export en cours annulé avant l'attente du pool"""
+        window = fresh_window
+        window.export_worker = Mock()
         window.close()
+        window.export_worker.stop.assert_called_once()
+
+    def test_export_worker_cancel(self, tmp_path):
+        """Test annulation d'un export: écriture arrêtée, fichier partiel supprimé"""
+        from macclean.gui.main_window import ExportWorker
+
+        output = tmp_path / "export.csv"
+        batch = FileBatch.from_file_infos([FileInfo(f"/test/f{i}.txt", i) for i in range(10)])
+        worker = ExportWorker("csv", str(output), batch, [None] * 10)
+        emitted = []
+        worker.signals.finished.connect(lambda path, success: emitted.append((path, success)))
+
+        worker.stop()
+        worker.run()
+        assert emitted == [(str(output), False)]
+        assert not output.exists()
+
+
+@pytest.fixture(scope="class")
+def scan_classes():
+    """Classes de scan remplacées une seule fois pour toute la classe de tests qui les demande"""
+    with patch('macclean.gui.main_window.HashDatabase') as hash_db_class, \
+            patch('macclean.gui.main_window.DuplicateFinder') as finder_class, \
+            patch('macclean.gui.main_window.CacheCleaner') as cleaner_class:
+        yield {"hash_db": hash_db_class, "finder": finder_class, "cleaner": cleaner_class}
 
 
 class TestScanWorker:
     """Tests pour le worker de scan"""
     
-    @patch('macclean.gui.main_window.DuplicateFinder')
-    def test_scan_worker_duplicates(self, mock_finder_class):
+    @pytest.fixture
+    def scan_mocks(self, scan_classes):
+        """Mocks partagés remis à zéro avant chaque test (appels, valeurs de retour)"""
+        for mock_class in scan_classes.values():
+            mock_class.reset_mock(return_value=True, side_effect=True)
+        return scan_classes
+    
+    def test_scan_worker_duplicates(self, scan_mocks):
         """Test worker pour scan doublons"""
-        from macclean.gui.main_window import ScanWorker
-        
         # Mock du finder
         mock_finder = Mock()
-        mock_finder.scan_directory.return_value = [[FileInfo("/test/file1.txt", 100)]]
-        mock_finder_class.return_value = mock_finder
+        mock_finder.scan_directory.return_value = [
+            [FileInfo("/test/file1.txt", 100), FileInfo("/test/copy1.txt", 100)],
+            [FileInfo("/test/file2.txt", 50), FileInfo("/test/copy2.txt", 50)],
+        ]
+        scan_mocks["finder"].return_value = mock_finder
         
         worker = ScanWorker("duplicates", {"directory": "/test"})
+        emitted = []
+        worker.signals.finished.connect(lambda *payload: emitted.append(payload))
         worker.run()
         
         # Vérifier que le scan est appelé
-        mock_finder.scan_directory.assert_called_once_with("/test", progress_callback=worker._progress_callback)
+        mock_finder.scan_directory.assert_called_once_with(
+            "/test", progress_callback=worker._progress_callback, stop_event=worker._stop_event
+        )
+        
+        # Résultats remis en colonnes, prêts pour le modèle
+        [(scan_type, batch, hashes)] = emitted
+        assert scan_type == "duplicates"
+        # Groupes aplatis dans l'ordre, chaque groupe restant contigu
+        assert batch.paths == ["/test/file1.txt", "/test/copy1.txt", "/test/file2.txt", "/test/copy2.txt"]
+        assert list(batch.sizes) == [100, 100, 50, 50]
+        assert hashes == [None] * 4
     
-    @patch('macclean.gui.main_window.CacheCleaner')
-    def test_scan_worker_cache(self, mock_cleaner_class):
+    def test_scan_worker_cache(self, scan_mocks):
         """Test worker pour scan cache"""
-        from macclean.gui.main_window import ScanWorker
-        
         # Mock du cleaner
         mock_cleaner = Mock()
         mock_cleaner.scan_cache_files.return_value = [FileInfo("/test/cache.tmp", 50)]
-        mock_cleaner_class.return_value = mock_cleaner
+        scan_mocks["cleaner"].return_value = mock_cleaner
         
         worker = ScanWorker("cache", {})
         worker.run()
         
-        # Vérifier que le scan est appelé
-        mock_cleaner.scan_cache_files.assert_called_once()
+        # Vérifier que le scan est appelé, arrêtable
+        mock_cleaner.scan_cache_files.assert_called_once_with(
+            progress_callback=worker._cache_progress_callback, stop_event=worker._stop_event
+        )
     
+    def test_scan_worker_progress_throttle(self):
+        """Test limitation de fréquence des signaux de progression"""
+        worker = ScanWorker("cache", {})
+        emitted = []
+        worker.signals.progress.connect(lambda current, total: emitted.append((current, total)))
+
+        for count in range(1, 1001):
+            worker._cache_progress_callback(count)
+        worker._flush_progress()
+
+        # Bien moins d'émissions que d'appels, la dernière valeur est toujours émise
+        assert len(emitted) < 100
+        assert emitted[-1] == (1000, 0)
+
+        # Phase terminée (current == total): émise immédiatement
+        emitted.clear()
+        worker._last_emit = 0.0
+        worker._progress_callback(5, 5)
+        assert emitted == [(5, 5)]
+
+        # Rapports espacés (un par répertoire de cache): chacun passe dès l'intervalle écoulé
+        emitted.clear()
+        for directory in range(1, 4):
+            worker._last_emit = 0.0
+            worker._cache_progress_callback(directory)
+        assert emitted == [(1, 0), (2, 0), (3, 0)]
+
+    def test_delete_worker(self, tmp_path):
+        """Test suppression par lot: un seul signal, succès dans l'ordre des chemins"""
+        existing = tmp_path / "a.tmp"
+        existing.write_bytes(b"x")
+        paths = [str(existing), str(tmp_path / "missing.tmp")]
+
+        worker = DeleteWorker("cache", [0, 1], paths)
+        emitted = []
+        progress = []
+        worker.signals.finished.connect(lambda scan_type, results: emitted.append((scan_type, results)))
+        worker.signals.progress.connect(lambda done, total: progress.append((done, total)))
+        worker.run()
+
+        assert emitted == [("cache", [True, False])]
+        assert progress == [(2, 2)]
+        assert not existing.exists()
+
+    def test_delete_worker_verifies_duplicates(self, tmp_path):
+        """Test suppression de doublons: une copie différente de la copie conservée est gardée"""
+        kept, same, collision, orphan = (tmp_path / name for name in ("kept", "same", "collision", "orphan"))
+        kept.write_bytes(b"abc")
+        same.write_bytes(b"abc")
+        collision.write_bytes(b"abd")
+        orphan.write_bytes(b"zzz")
+        paths = [str(same), str(collision), str(orphan)]
+
+        worker = DeleteWorker("duplicates", [1, 2, 3], paths, [str(kept), str(kept), None])
+        emitted = []
+        worker.signals.finished.connect(lambda scan_type, results: emitted.append(results))
+        worker.run()
+
+        assert emitted == [[True, False, True]]
+        assert kept.exists() and collision.exists()
+        assert not same.exists() and not orphan.exists()
+
     def test_scan_worker_stop(self):
         """Test arrêt du worker"""
-        from macclean.gui.main_window import ScanWorker
-        
         worker = ScanWorker("duplicates", {})
         assert worker.should_stop is False
         
@@ -2,45 +2,30 @@
 Tests d'initialisation du package
 """
 
+import importlib
+
+import pytest
+
+import macclean
+
+
 def test_package_import():
     """Test import du package principal"""
-    try:
-        import macclean
-        assert macclean.__version__ == "1.0.0"
-    except ImportError:
-        assert False, "Impossible d'importer le package macclean"
-
-
-def test_core_imports():
-    """Test import des modules core"""
-    try:
-        from macclean.core import (
-            DuplicateFinder, CacheCleaner, 
-            OrphanedFilesFinder, LargeFilesFinder, FileInfo
-        )
-        assert True
-    except ImportError as e:
-        assert False, f"Impossible d'importer les modules core: {e}"
-
-
-def test_utils_imports():
-    """Test import des utilitaires"""
-    try:
-        from macclean.utils import (
-            format_file_size, safe_delete_file,
-            export_to_json, export_to_csv, export_to_txt
-        )
-        assert True
-    except ImportError as e:
-        assert False, f"Impossible d'importer les utilitaires: {e}"
+    assert macclean.__version__ == "1.0.0"
+
+
+@pytest.mark.parametrize("module_name, names", [
+    ("macclean.core", ["DuplicateFinder", "CacheCleaner", "OrphanedFilesFinder", "LargeFilesFinder", "FileInfo"]),
+    ("macclean.utils", ["format_file_size", "safe_delete_file", "export_to_json", "export_to_csv", "export_to_txt"]),
+])
+def test_module_exports(module_name, names):
+    """Test import des modules core et des utilitaires: noms publics présents"""
+    module = importlib.import_module(module_name)
+    assert [name for name in names if not hasattr(module, name)] == []
 
 
 def test_gui_imports():
-    """Test import de l'interface graphique"""
-    try:
-        from macclean.gui import MacCleanApp
-        assert True
-    except ImportError as e:
-        # L'import peut échouer si PySide6 n'est pas installé
-        # Ce n'est pas critique pour les tests de base
-        print(f"Import GUI échoué (normal si PySide6 non installé): {e}")
+    """Test import de l'interface graphique (ignoré si PySide6 n'est pas installé)"""
+    pytest.importorskip("PySide6")
+    from macclean.gui import MacCleanApp
+    assert MacCleanApp is not None